@@ -110,7 +110,7 @@ done
 echo ""
 echo "Checking source files..."
 
-for file in src/run_yolov8.py src/run_yolov11.py src/compare_results.py \
+for file in src/run_yolov8.py src/run_yolov11.py src/compare_results.py src/utils/benchmark.py \
             src/utils/monitor.py src/utils/logger.py src/utils/fps.py; do
     if [ -f "$file" ]; then
         print_success "$file exists"
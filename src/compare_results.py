@@ -1,15 +1,172 @@
 #!/usr/bin/env python3
 """
-Comparison Script for YOLOv8n vs YOLO11n Benchmark Results
-Analyzes and compares log files from both models
+Comparison Script for YOLO Benchmark Results
+Compares any number of runs (models, formats, input sizes, thread settings)
+with bootstrap confidence intervals
 """
 
 import sys
 import json
 import argparse
 from pathlib import Path
-from typing import Dict, List, Tuple
-import glob
+from typing import Dict, List, Optional
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+from utils.result_stream import load_results
+from utils.op_profile import compare_op_profiles
+from utils.histogram import LatencyHistogram
+from utils.bootstrap import (bootstrap_histogram, bootstrap_mean, confidence_interval, rank_runs,
+                             DEFAULT_RESAMPLES, DEFAULT_CONFIDENCE)
+
+
+# Bootstrapped metrics: (key, label, unit, lower is better)
+STATISTIC_METRICS = (
+    ('fps', 'FPS (30-frame windows)', 'FPS', False),
+    ('inference_mean_ms', 'Mean Inference Time', 'ms', True),
+    ('inference_p50_ms', 'p50 Inference Time', 'ms', True),
+    ('inference_p99_ms', 'p99 Inference Time', 'ms', True),
+    ('sustained_p50_ms', 'Sustained p50 Inference Time (after thermal plateau)', 'ms', True),
+    ('cpu', 'CPU Usage', '%', True),
+    ('memory', 'Memory Usage', '%', True),
+    ('temperature', 'Temperature', '°C', True)
+)
+
+# Start temperatures further apart than this (°C) bias the comparison
+START_TEMPERATURE_SPREAD = 3.0
+
+# Fewer samples than this give no meaningful interval
+MIN_SAMPLES = 5
+
+# Category winners and the statistic that decides them
+WINNER_STATISTICS = {
+    'fps': 'fps',
+    'inference': 'inference_mean_ms',
+    'p99_inference': 'inference_p99_ms',
+    'cpu': 'cpu',
+    'memory': 'memory',
+    'temperature': 'temperature'
+}
+
+
+# Regression gate metrics: (tolerance key, summary key, label, lower is better)
+GATE_METRICS = (
+    ('p50', 'p50_inference_ms', 'p50 inference (ms)', True),
+    ('p99', 'p99_inference_ms', 'p99 inference (ms)', True),
+    ('fps', 'avg_fps', 'Average FPS', False),
+    ('rss', 'peak_rss_mb', 'Peak RSS (MB)', True),
+    ('cpu', 'cpu_ms_per_frame', 'CPU per frame (ms)', True)
+)
+
+# Allowed change in the bad direction, in percent
+DEFAULT_TOLERANCES = {'p50': 5.0, 'p99': 10.0, 'fps': 5.0, 'rss': 10.0, 'cpu': 10.0}
+
+
+def check_regression(baseline: Dict, candidate: Dict, tolerances: Dict[str, float]) -> Dict:
+    """Check a run against a baseline run with per-metric tolerances
+    
+    Args:
+        baseline: Baseline results (load_results() output)
+        candidate: New results to check
+        tolerances: Allowed change in the bad direction per metric, in percent
+    
+    Returns:
+        Dictionary with one row per metric ('ok', 'regression', 'improved',
+        'missing' when only the baseline has it, or 'skipped' when the baseline
+        lacks it), the regression and missing counts, and whether the run finished
+    """
+    base_summary = baseline.get('summary') or {}
+    new_summary = candidate.get('summary') or {}
+    rows = []
+    
+    for key, summary_key, label, lower_is_better in GATE_METRICS:
+        base = base_summary.get(summary_key)
+        new = new_summary.get(summary_key)
+        row = {'metric': key, 'label': label, 'baseline': base, 'new': new,
+               'tolerance_pct': tolerances[key], 'change_pct': None}
+        
+        if not base:
+            row['status'] = 'skipped'
+        elif new is None:
+            row['status'] = 'missing'
+        else:
+            change = (new - base) / base * 100
+            worse = change if lower_is_better else -change
+            row['change_pct'] = change
+            if worse > tolerances[key]:
+                row['status'] = 'regression'
+            elif worse < -tolerances[key]:
+                row['status'] = 'improved'
+            else:
+                row['status'] = 'ok'
+        rows.append(row)
+    
+    return {
+        'metrics': rows,
+        'regressions': sum(1 for row in rows if row['status'] == 'regression'),
+        'missing': sum(1 for row in rows if row['status'] == 'missing'),
+        'complete': candidate.get('complete') is not False
+    }
+
+
+def print_regression_report(gate: Dict, baseline_path: str, candidate_path: str):
+    """Print a compact baseline diff"""
+    print("\n" + "=" * 80)
+    print("REGRESSION GATE")
+    print("=" * 80)
+    print(f"Baseline: {baseline_path}")
+    print(f"New run:  {candidate_path}\n")
+    print(f"  {'Metric':20s} {'Baseline':>10s} {'New':>10s} {'Change':>8s} {'Tol':>6s}  Status")
+    
+    icons = {'ok': '✓', 'improved': '✓', 'regression': '❌', 'missing': '❌', 'skipped': '-'}
+    for row in gate['metrics']:
+        base = f"{row['baseline']:10.2f}" if row['baseline'] is not None else f"{'n/a':>10s}"
+        new = f"{row['new']:10.2f}" if row['new'] is not None else f"{'n/a':>10s}"
+        change = f"{row['change_pct']:+7.1f}%" if row['change_pct'] is not None else f"{'':8s}"
+        print(f"  {row['label']:20s} {base} {new} {change} {row['tolerance_pct']:5.0f}%  "
+              f"{icons[row['status']]} {row['status']}")
+    
+    if not gate['complete']:
+        print("\n❌ New run did not finish (no final summary), it cannot pass the gate")
+    if gate['missing']:
+        print(f"\n❌ {gate['missing']} metric(s) of the baseline missing from the new run")
+    if gate['regressions']:
+        print(f"\n❌ {gate['regressions']} regression(s) beyond tolerance")
+    elif gate['complete'] and not gate['missing']:
+        print(f"\n✓ No regressions beyond tolerance")
+
+
+def parse_tolerances(specs: List[str]) -> Dict[str, float]:
+    """Parse --tolerance METRIC=PCT overrides on top of the defaults"""
+    tolerances = dict(DEFAULT_TOLERANCES)
+    for spec in specs:
+        key, _, value = spec.partition('=')
+        if key not in tolerances or not value:
+            raise ValueError(f"Invalid tolerance '{spec}' (expected one of "
+                             f"{', '.join(tolerances)} as METRIC=PCT)")
+        tolerances[key] = float(value)
+    return tolerances
+
+
+def metric_samples(data: Dict, stream: str, key: str) -> np.ndarray:
+    """Get the logged samples of one metric (NaN/None dropped)
+
+    Args:
+        data: Results loaded by load_results()
+        stream: 'inference' or 'system'
+        key: Column name (e.g. 'fps', 'cpu_percent')
+
+    Returns:
+        Float array of samples
+    """
+    metrics = data.get('metrics') or {}
+    if isinstance(metrics, list):
+        # Older JSON logs: one dict per logged row, streams mixed
+        values = [row.get(key) for row in metrics if key in row]
+    else:
+        values = (metrics.get(stream) or {}).get(key, [])
+    return np.array([v for v in values if v is not None], dtype=np.float64)
 
 
 class BenchmarkComparator:
@@ -17,48 +174,193 @@ class BenchmarkComparator:
     
     def __init__(self):
         self.results = {}
+        self.paths = {}
     
-    def load_json_log(self, json_path: str, model_name: str):
-        """Load JSON log file
+    def load_json_log(self, json_path: str, model_name: Optional[str] = None):
+        """Load a results stream (.jsonl) or JSON log file
         
         Args:
-            json_path: Path to JSON log file
-            model_name: Name identifier for the model
+            json_path: Path to results stream or JSON log file
+            model_name: Name identifier for the run (default: derived from its config)
         """
-        with open(json_path, 'r') as f:
-            data = json.load(f)
-            self.results[model_name] = data
-            print(f"✓ Loaded {model_name}: {json_path}")
+        data = load_results(json_path)
+        model_name = self._unique_label(model_name or self._run_label(data, json_path), data, json_path)
+        self.results[model_name] = data
+        self.paths[model_name] = str(json_path)
+        print(f"✓ Loaded {model_name}: {json_path}")
+        if data.get('complete') is False:
+            print(f"⚠️  {model_name}: run did not finish (no summary record)")
+    
+    @staticmethod
+    def _run_label(data: Dict, json_path: str) -> str:
+        """Name a run after its model file"""
+        config = data.get('config') or {}
+        return Path(config.get('model_path') or data.get('model') or json_path).stem
+    
+    def _unique_label(self, label: str, data: Dict, json_path: str) -> str:
+        """Disambiguate runs of the same model by the first setting that differs"""
+        if label not in self.results:
+            return label
+        config = data.get('config') or {}
+        other = self.results[label].get('config') or {}
+        for field in ('input_size', 'session_settings', 'io_binding', 'pipelined', 'preprocess',
+                      'batch_size', 'workers', 'shm_slots', 'input_source'):
+            value = config.get(field)
+            if value is not None and value != other.get(field):
+                candidate = f"{label} {value}" if isinstance(value, str) else f"{label} {field}={value}"
+                if candidate not in self.results:
+                    return candidate
+        for detail in ((data.get('timestamp') or '')[:19], Path(json_path).stem):
+            candidate = f"{label} {detail}"
+            if detail and candidate not in self.results:
+                return candidate
+        return f"{label} #{len(self.results) + 1}"
+    
+    @staticmethod
+    def _result_files(model_dir: Path) -> List[Path]:
+        """Results streams and JSON logs in a directory (ORT profiles excluded)"""
+        files = list(model_dir.glob('*.jsonl')) + list(model_dir.glob('*.json'))
+        return [p for p in files if not p.name.endswith('_ort_profile.json')]
     
     def find_latest_logs(self, log_dir: str = 'logs') -> Dict[str, str]:
         """Find latest log files for each model
         
         Args:
-            log_dir: Base log directory
+            log_dir: Base log directory (one subdirectory per model)
             
         Returns:
             Dictionary mapping model names to latest JSON files
         """
         log_path = Path(log_dir)
         latest_logs = {}
+        if not log_path.exists():
+            return latest_logs
         
-        for model_name in ['yolov8', 'yolov11']:
-            model_dir = log_path / model_name
-            if not model_dir.exists():
-                continue
-            
-            # Find all JSON files
-            json_files = list(model_dir.glob('*.json'))
+        for model_dir in sorted(p for p in log_path.iterdir() if p.is_dir()):
+            json_files = self._result_files(model_dir)
             if json_files:
                 # Get most recent
                 latest = max(json_files, key=lambda p: p.stat().st_mtime)
-                latest_logs[model_name] = str(latest)
+                latest_logs[model_dir.name] = str(latest)
         
         return latest_logs
     
-    def compare(self) -> Dict:
+    def find_all_logs(self, log_dir: str = 'logs') -> List[str]:
+        """Find every results file under the log directory, oldest first
+        
+        Args:
+            log_dir: Base log directory (one subdirectory per model)
+            
+        Returns:
+            List of results paths
+        """
+        log_path = Path(log_dir)
+        if not log_path.exists():
+            return []
+        files = []
+        for model_dir in (p for p in log_path.iterdir() if p.is_dir()):
+            files.extend(self._result_files(model_dir))
+        return [str(p) for p in sorted(files, key=lambda p: p.stat().st_mtime)]
+    
+    def find_matrix_logs(self, table_path: str) -> Dict[str, str]:
+        """Find the results of every finished cell in a matrix table
+        
+        Args:
+            table_path: matrix_results.json written by run_matrix.py
+            
+        Returns:
+            Dictionary mapping cell labels to results files
+        """
+        with open(table_path, 'r') as f:
+            table = json.load(f)
+        return {cell['label']: cell['results_path'] for cell in table.get('cells', [])
+                if cell.get('status') == 'ok' and cell.get('results_path')
+                and Path(cell['results_path']).exists()}
+    
+    def _bootstrap_statistics(self, n_boot: int, confidence: float, seed: Optional[int]) -> Dict:
+        """Bootstrap confidence intervals and winners for every run
+        
+        Latency statistics are resampled from the per-frame inference
+        histogram, FPS from the logged 30-frame window rates and system
+        metrics from the sampler rows. Runs with fewer than MIN_SAMPLES
+        samples get a point estimate but no interval and are untested.
+        
+        Args:
+            n_boot: Bootstrap resamples per run
+            confidence: Confidence level of intervals and winner tests
+            seed: Random seed (None for a fresh one)
+            
+        Returns:
+            Dictionary per metric with per-run estimates/intervals and the ranking
+        """
+        rng = np.random.default_rng(seed)
+        estimates = {key: {} for key, _, _, _ in STATISTIC_METRICS}
+        replicates = {key: {} for key, _, _, _ in STATISTIC_METRICS}
+        counts = {key: {} for key, _, _, _ in STATISTIC_METRICS}
+        
+        for name, data in self.results.items():
+            histogram = (data.get('histograms') or {}).get('inference')
+            if histogram and histogram.get('count', 0) >= MIN_SAMPLES:
+                hist = LatencyHistogram.from_dict(histogram)
+                reps = bootstrap_histogram(hist, (50.0, 99.0), n_boot, rng)
+                point = hist.percentiles((50.0, 99.0))
+                for key, stat, value in (('inference_mean_ms', 'mean', hist.mean()),
+                                         ('inference_p50_ms', 50.0, point[50.0]),
+                                         ('inference_p99_ms', 99.0, point[99.0])):
+                    estimates[key][name] = value * 1000
+                    replicates[key][name] = reps[stat] * 1000
+                    counts[key][name] = hist.count
+            
+            # Steady-state latency, only for runs that reached a thermal plateau
+            histogram = (data.get('histograms') or {}).get('inference_sustained')
+            if histogram and histogram.get('count', 0) >= MIN_SAMPLES:
+                hist = LatencyHistogram.from_dict(histogram)
+                estimates['sustained_p50_ms'][name] = hist.percentile(50.0) * 1000
+                replicates['sustained_p50_ms'][name] = bootstrap_histogram(hist, (50.0,), n_boot, rng)[50.0] * 1000
+                counts['sustained_p50_ms'][name] = hist.count
+            
+            for key, stream, column in (('fps', 'inference', 'fps'),
+                                        ('cpu', 'system', 'cpu_percent'),
+                                        ('memory', 'system', 'memory_percent'),
+                                        ('temperature', 'system', 'temperature')):
+                samples = metric_samples(data, stream, column)
+                samples = samples[~np.isnan(samples)]
+                if samples.size:
+                    estimates[key][name] = float(samples.mean())
+                    counts[key][name] = int(samples.size)
+                if samples.size >= MIN_SAMPLES:
+                    replicates[key][name] = bootstrap_mean(samples, n_boot, rng)
+        
+        statistics = {}
+        for key, label, unit, lower_is_better in STATISTIC_METRICS:
+            if not estimates[key]:
+                continue
+            runs = {}
+            for name, value in estimates[key].items():
+                low, high = (confidence_interval(replicates[key][name], confidence)
+                             if name in replicates[key] else (None, None))
+                runs[name] = {'value': value, 'ci_low': low, 'ci_high': high, 'n': counts[key][name]}
+            statistics[key] = {
+                'label': label,
+                'unit': unit,
+                'lower_is_better': lower_is_better,
+                'runs': runs
+            }
+            statistics[key].update(rank_runs(estimates[key], replicates[key], lower_is_better, confidence))
+        return statistics
+    
+    def compare(self, n_boot: int = DEFAULT_RESAMPLES, confidence: float = DEFAULT_CONFIDENCE,
+                seed: Optional[int] = 0) -> Dict:
         """Compare loaded benchmark results
         
+        A category winner is only declared when it is significantly better
+        than every other run at the given confidence level.
+        
+        Args:
+            n_boot: Bootstrap resamples per run
+            confidence: Confidence level of intervals and winner tests
+            seed: Random seed for reproducible intervals (None for a fresh one)
+        
         Returns:
             Comparison dictionary with metrics
         """
@@ -68,13 +370,21 @@ class BenchmarkComparator:
         
         comparison = {
             'models': list(self.results.keys()),
+            'paths': self.paths,
+            'bootstrap': {'resamples': n_boot, 'confidence': confidence, 'seed': seed},
             'performance': {},
             'system': {},
+            'statistics': self._bootstrap_statistics(n_boot, confidence, seed),
             'winner': {}
         }
         
+        # Only statistically significant winners count
+        for category, key in WINNER_STATISTICS.items():
+            if key in comparison['statistics']:
+                comparison['winner'][category] = comparison['statistics'][key]['winner']
+        
         # Extract summaries
-        summaries = {name: data.get('summary', {}) 
+        summaries = {name: data.get('summary') or {} 
                     for name, data in self.results.items()}
         
         # Compare FPS
@@ -82,7 +392,6 @@ class BenchmarkComparator:
                    for name, summary in summaries.items()}
         
         comparison['performance']['fps'] = fps_data
-        comparison['winner']['fps'] = max(fps_data, key=fps_data.get)
         comparison['performance']['fps_improvement'] = self._calculate_improvement(fps_data)
         
         # Compare inference time
@@ -90,24 +399,55 @@ class BenchmarkComparator:
                          for name, summary in summaries.items()}
         
         comparison['performance']['inference_ms'] = inference_data
-        comparison['winner']['inference'] = min(inference_data, key=inference_data.get)
         comparison['performance']['inference_improvement'] = self._calculate_improvement(
             inference_data, lower_is_better=True
         )
         
+        # Compare tail latency (logs written before per-frame histograms lack it)
+        latency_data = {name: summary['latency'] for name, summary in summaries.items()
+                        if summary.get('latency')}
+        
+        if latency_data:
+            comparison['performance']['latency'] = latency_data
+            p99_data = {name: latency['inference']['p99_ms']
+                        for name, latency in latency_data.items() if 'inference' in latency}
+            if p99_data:
+                comparison['performance']['p99_inference_improvement'] = self._calculate_improvement(
+                    p99_data, lower_is_better=True
+                )
+        
+        # Burst vs sustained performance around the thermal plateau
+        thermal_data = {name: summary['thermal'] for name, summary in summaries.items()
+                        if summary.get('thermal') and summary['thermal'].get('start_temperature') is not None}
+        
+        if thermal_data:
+            comparison['performance']['thermal'] = thermal_data
+            start_temps = [thermal['start_temperature'] for thermal in thermal_data.values()
+                           if thermal.get('start_temperature') is not None]
+            if len(start_temps) >= 2:
+                comparison['performance']['start_temperature_spread'] = max(start_temps) - min(start_temps)
+        
+        # Compare time per operator type (runs made with --profile-ops)
+        op_profiles = {name: summary['op_profile'] for name, summary in summaries.items()
+                       if summary.get('op_profile')}
+        
+        if len(op_profiles) >= 2:
+            comparison['performance']['op_types'] = compare_op_profiles(op_profiles)
+            comparison['performance']['kernel_ms_per_run'] = {
+                name: profile['kernel_ms_per_run'] for name, profile in op_profiles.items()
+            }
+        
         # Compare CPU usage
         cpu_data = {name: summary.get('avg_cpu', 0) 
                    for name, summary in summaries.items()}
         
         comparison['system']['cpu'] = cpu_data
-        comparison['winner']['cpu'] = min(cpu_data, key=cpu_data.get)
         
         # Compare memory
         memory_data = {name: summary.get('avg_memory', 0) 
                       for name, summary in summaries.items()}
         
         comparison['system']['memory'] = memory_data
-        comparison['winner']['memory'] = min(memory_data, key=memory_data.get)
         
         # Compare temperature
         temp_data = {name: summary.get('avg_temperature') 
@@ -116,7 +456,6 @@ class BenchmarkComparator:
         
         if temp_data:
             comparison['system']['temperature'] = temp_data
-            comparison['winner']['temperature'] = min(temp_data, key=temp_data.get)
         
         # Throttling events
         throttle_data = {name: summary.get('throttle_events', 0) 
@@ -128,7 +467,7 @@ class BenchmarkComparator:
     
     def _calculate_improvement(self, data: Dict[str, float], 
                                lower_is_better: bool = False) -> Dict:
-        """Calculate percentage improvement between models
+        """Calculate percentage improvement of the best run over the runner-up
         
         Args:
             data: Dictionary of model names to values
@@ -137,25 +476,20 @@ class BenchmarkComparator:
         Returns:
             Dictionary with improvement calculations
         """
-        if len(data) != 2:
+        if len(data) < 2:
             return {}
         
-        models = list(data.keys())
-        values = list(data.values())
+        ranked = sorted(data, key=data.get, reverse=not lower_is_better)
+        better_model, runner_up = ranked[0], ranked[1]
+        if not data[runner_up]:
+            return {}
         
-        if lower_is_better:
-            # For metrics like latency where lower is better
-            improvement_pct = ((values[0] - values[1]) / values[0]) * 100
-            better_model = models[1] if values[1] < values[0] else models[0]
-        else:
-            # For metrics like FPS where higher is better
-            improvement_pct = ((values[1] - values[0]) / values[0]) * 100
-            better_model = models[1] if values[1] > values[0] else models[0]
+        improvement_pct = (data[better_model] - data[runner_up]) / data[runner_up] * 100
         
         return {
             'percentage': abs(improvement_pct),
             'better_model': better_model,
-            'direction': 'improvement' if improvement_pct > 0 else 'regression'
+            'compared_to': runner_up
         }
     
     def print_comparison(self, comparison: Dict):
@@ -169,7 +503,11 @@ class BenchmarkComparator:
         print("=" * 80)
         
         models = comparison['models']
-        print(f"\nComparing: {' vs '.join(models)}")
+        width = max([12] + [len(model) for model in models])
+        print(f"\nComparing {len(models)} runs: {', '.join(models)}")
+        
+        def marker(category: str, model: str) -> str:
+            return "🏆" if comparison['winner'].get(category) == model else "  "
         
         # Performance comparison
         print("\n" + "-" * 80)
@@ -182,25 +520,75 @@ class BenchmarkComparator:
         print(f"\n📊 Average FPS:")
         for model in models:
             fps = perf['fps'][model]
-            is_winner = (comparison['winner']['fps'] == model)
-            marker = "🏆" if is_winner else "  "
-            print(f"  {marker} {model:12s}: {fps:6.2f} FPS")
+            print(f"  {marker('fps', model)} {model:{width}s}: {fps:6.2f} FPS")
         
-        if 'fps_improvement' in perf and perf['fps_improvement']:
+        if perf.get('fps_improvement'):
             imp = perf['fps_improvement']
-            print(f"  → {imp['better_model']} is {imp['percentage']:.1f}% faster")
+            print(f"  → {imp['better_model']} is {imp['percentage']:.1f}% faster than {imp['compared_to']}")
         
         # Inference time
         print(f"\n⏱️  Average Inference Time:")
         for model in models:
             inf = perf['inference_ms'][model]
-            is_winner = (comparison['winner']['inference'] == model)
-            marker = "🏆" if is_winner else "  "
-            print(f"  {marker} {model:12s}: {inf:6.1f} ms")
+            print(f"  {marker('inference', model)} {model:{width}s}: {inf:6.1f} ms")
         
-        if 'inference_improvement' in perf and perf['inference_improvement']:
+        if perf.get('inference_improvement'):
             imp = perf['inference_improvement']
-            print(f"  → {imp['better_model']} is {imp['percentage']:.1f}% faster")
+            print(f"  → {imp['better_model']} is {imp['percentage']:.1f}% faster than {imp['compared_to']}")
+        
+        # Tail latency per stage
+        if 'latency' in perf:
+            print(f"\n📈 Latency Percentiles (every frame):")
+            print(f"     {'Model':{width}s} {'Stage':12s} {'p50':>8s} {'p95':>8s} {'p99':>8s} {'p99.9':>8s}")
+            for model in models:
+                for stage, lat in perf['latency'].get(model, {}).items():
+                    stage_marker = marker('p99_inference', model) if stage == 'inference' else "  "
+                    print(f"  {stage_marker} {model:{width}s} {stage:12s} {lat['p50_ms']:6.1f}ms "
+                          f"{lat['p95_ms']:6.1f}ms {lat['p99_ms']:6.1f}ms {lat['p999_ms']:6.1f}ms")
+            
+            if perf.get('p99_inference_improvement'):
+                imp = perf['p99_inference_improvement']
+                print(f"  → {imp['better_model']} has a {imp['percentage']:.1f}% lower p99 inference time "
+                      f"than {imp['compared_to']}")
+        
+        # Thermal phases
+        if 'thermal' in perf:
+            print(f"\n🔥 Burst vs Sustained (split at the thermal plateau):")
+            print(f"     {'Model':{width}s} {'Start':>7s} {'Plateau':>8s} {'Burst FPS':>10s} {'p50':>8s} "
+                  f"{'Sust. FPS':>10s} {'p50':>8s}")
+            for model in models:
+                thermal = perf['thermal'].get(model)
+                if thermal is None:
+                    continue
+                start = (f"{thermal['start_temperature']:5.1f}°C" if thermal.get('start_temperature') is not None
+                         else f"{'-':>7s}")
+                plateau = f"{thermal['plateau_elapsed_s']:7.0f}s" if thermal['plateau_reached'] else f"{'none':>8s}"
+                phases = ' '.join(
+                    f"{thermal[phase]['fps']:10.2f} {thermal[phase]['p50_inference_ms']:6.1f}ms"
+                    if thermal.get(phase) else f"{'-':>10s} {'-':>8s}"
+                    for phase in ('burst', 'sustained')
+                )
+                print(f"     {model:{width}s} {start} {plateau} {phases}")
+            
+            spread = perf.get('start_temperature_spread')
+            if spread is not None and spread > START_TEMPERATURE_SPREAD:
+                print(f"  ⚠️  Start temperatures differ by {spread:.1f}°C: later runs inherit heat "
+                      f"from earlier ones (use --cooldown-temp)")
+        
+        # Operator types
+        if 'op_types' in perf:
+            profiled = list(perf['kernel_ms_per_run'])
+            print(f"\n🔬 Time per Operator Type (ms/run, share of kernel time):")
+            print(f"     {'Op Type':20s} " + ' '.join(f"{model:>18s}" for model in profiled))
+            for row in perf['op_types'][:15]:
+                cells = ' '.join(
+                    f"{row['ms_per_run'][model]:8.2f} ({row['share'][model] * 100:5.1f}%)"
+                    if model in row['ms_per_run'] else f"{'-':>18s}"
+                    for model in profiled
+                )
+                print(f"     {row['op_type'][:20]:20s} {cells}")
+            totals = ' '.join(f"{perf['kernel_ms_per_run'][model]:8.2f}{'':10s}" for model in profiled)
+            print(f"     {'Total':20s} {totals}")
         
         # System metrics
         print("\n" + "-" * 80)
@@ -213,17 +601,13 @@ class BenchmarkComparator:
         print(f"\n💻 Average CPU Usage:")
         for model in models:
             cpu = sys_metrics['cpu'][model]
-            is_winner = (comparison['winner']['cpu'] == model)
-            marker = "🏆" if is_winner else "  "
-            print(f"  {marker} {model:12s}: {cpu:5.1f}%")
+            print(f"  {marker('cpu', model)} {model:{width}s}: {cpu:5.1f}%")
         
         # Memory
         print(f"\n🧠 Average Memory Usage:")
         for model in models:
             mem = sys_metrics['memory'][model]
-            is_winner = (comparison['winner']['memory'] == model)
-            marker = "🏆" if is_winner else "  "
-            print(f"  {marker} {model:12s}: {mem:5.1f}%")
+            print(f"  {marker('memory', model)} {model:{width}s}: {mem:5.1f}%")
         
         # Temperature
         if 'temperature' in sys_metrics:
@@ -231,34 +615,68 @@ class BenchmarkComparator:
             for model in models:
                 if model in sys_metrics['temperature']:
                     temp = sys_metrics['temperature'][model]
-                    is_winner = (comparison['winner'].get('temperature') == model)
-                    marker = "🏆" if is_winner else "  "
-                    print(f"  {marker} {model:12s}: {temp:5.1f}°C")
+                    print(f"  {marker('temperature', model)} {model:{width}s}: {temp:5.1f}°C")
         
         # Throttling
         print(f"\n⚠️  Throttling Events:")
         for model in models:
             throttle = sys_metrics['throttle_events'][model]
-            marker = "✓" if throttle == 0 else "⚠️ "
-            print(f"  {marker} {model:12s}: {throttle} events")
+            status = "✓" if throttle == 0 else "⚠️ "
+            print(f"  {status} {model:{width}s}: {throttle} events")
+        
+        # Confidence intervals
+        bootstrap = comparison['bootstrap']
+        print("\n" + "-" * 80)
+        print(f"STATISTICAL SIGNIFICANCE (bootstrap, {bootstrap['resamples']} resamples, "
+              f"{bootstrap['confidence'] * 100:g}% CI)")
+        print("-" * 80)
+        
+        for key, stat in comparison['statistics'].items():
+            direction = 'lower' if stat['lower_is_better'] else 'higher'
+            print(f"\n📐 {stat['label']} ({stat['unit']}, {direction} is better):")
+            for model in models:
+                run = stat['runs'].get(model)
+                if run is None:
+                    print(f"     {model:{width}s}: no data")
+                    continue
+                run_marker = "🏆" if stat['winner'] == model else "  "
+                interval = (f"[{run['ci_low']:8.2f}, {run['ci_high']:8.2f}]" if run['ci_low'] is not None
+                            else f"{'(too few samples)':>20s}")
+                print(f"  {run_marker} {model:{width}s}: {run['value']:8.2f}  {interval}  n={run['n']}")
+            
+            if stat['significant']:
+                print(f"  → {stat['best']} is significantly better than every other run")
+            else:
+                reasons = []
+                if stat['tied']:
+                    reasons.append(f"not separable from {', '.join(stat['tied'])}")
+                if stat['untested']:
+                    reasons.append(f"too few samples for {', '.join(stat['untested'])}")
+                print(f"  → No significant winner: best is {stat['best']}, {'; '.join(reasons)}")
         
         # Overall winner
         print("\n" + "=" * 80)
         print("OVERALL ASSESSMENT")
         print("=" * 80)
         
-        # Count wins
+        # Count significant wins
         wins = {model: 0 for model in models}
         for category, winner in comparison['winner'].items():
             if winner in wins:
                 wins[winner] += 1
         
-        print(f"\nCategory Wins:")
+        print(f"\nCategory Wins (statistically significant):")
         for model, count in wins.items():
-            print(f"  {model:12s}: {count} categories")
+            print(f"  {model:{width}s}: {count} categories")
         
         overall_winner = max(wins, key=wins.get)
-        print(f"\n🏆 Overall Winner: {overall_winner}")
+        if wins[overall_winner] == 0:
+            print(f"\n🤝 No run is significantly better in any category")
+        elif list(wins.values()).count(wins[overall_winner]) > 1:
+            leaders = [model for model, count in wins.items() if count == wins[overall_winner]]
+            print(f"\n🤝 Tied for most wins: {', '.join(leaders)}")
+        else:
+            print(f"\n🏆 Overall Winner: {overall_winner}")
         
         print("\n" + "=" * 80)
     
@@ -276,16 +694,35 @@ class BenchmarkComparator:
 
 def main():
     parser = argparse.ArgumentParser(
-        description='Compare YOLOv8n and YOLO11n benchmark results'
+        description='Compare YOLO benchmark runs with bootstrap confidence intervals'
     )
+    parser.add_argument('results', type=str, nargs='*',
+                       help='Results files to compare (.jsonl streams or .json), any number')
     parser.add_argument('--yolov8', type=str, default=None,
-                       help='Path to YOLOv8 JSON log file')
+                       help='Path to YOLOv8 results (.jsonl stream or .json)')
     parser.add_argument('--yolov11', type=str, default=None,
-                       help='Path to YOLO11 JSON log file')
+                       help='Path to YOLO11 results (.jsonl stream or .json)')
     parser.add_argument('--log-dir', type=str, default='logs',
                        help='Base log directory (default: logs)')
     parser.add_argument('--auto', action='store_true',
-                       help='Automatically find and compare latest logs')
+                       help='Automatically find and compare the latest log of every model')
+    parser.add_argument('--all', action='store_true',
+                       help='Compare every run found in the log directory')
+    parser.add_argument('--matrix', type=str, default=None,
+                       help='Compare every finished cell of a run_matrix.py table (matrix_results.json)')
+    parser.add_argument('--bootstrap', type=int, default=DEFAULT_RESAMPLES,
+                       help=f'Bootstrap resamples per run (default: {DEFAULT_RESAMPLES})')
+    parser.add_argument('--confidence', type=float, default=DEFAULT_CONFIDENCE,
+                       help=f'Confidence level for intervals and winners (default: {DEFAULT_CONFIDENCE})')
+    parser.add_argument('--seed', type=int, default=0,
+                       help='Random seed for the bootstrap (default: 0)')
+    parser.add_argument('--baseline', type=str, default=None,
+                       help='Check one run (first RESULTS file, default: latest log next to the '
+                            'baseline) against this pinned baseline; exits 1 on a regression, '
+                            '2 if the run cannot be measured')
+    parser.add_argument('--tolerance', type=str, action='append', default=[], metavar='METRIC=PCT',
+                       help='Regression tolerance override, METRIC in p50, p99, fps, rss, cpu '
+                            '(defaults: ' + ', '.join(f"{k}={v:g}" for k, v in DEFAULT_TOLERANCES.items()) + ')')
     parser.add_argument('--output', type=str, default='comparison_result.json',
                        help='Output file for comparison (default: comparison_result.json)')
     
@@ -293,13 +730,32 @@ def main():
     
     comparator = BenchmarkComparator()
     
-    if args.auto or (not args.yolov8 and not args.yolov11):
+    if args.baseline:
+        return run_regression_gate(comparator, args)
+    
+    # Explicit runs: positional paths plus the per-model shortcuts
+    specified = [(path, None) for path in args.results]
+    if args.yolov8:
+        specified.append((args.yolov8, 'yolov8'))
+    if args.yolov11:
+        specified.append((args.yolov11, 'yolov11'))
+    
+    if args.matrix:
+        for label, log_path in comparator.find_matrix_logs(args.matrix).items():
+            comparator.load_json_log(log_path, label)
+    
+    elif args.all:
+        print("🔍 Searching for all benchmark logs...")
+        for log_path in comparator.find_all_logs(args.log_dir):
+            comparator.load_json_log(log_path)
+    
+    elif args.auto or not specified:
         # Auto-find latest logs
         print("🔍 Searching for latest benchmark logs...")
         latest_logs = comparator.find_latest_logs(args.log_dir)
         
         if len(latest_logs) < 2:
-            print("❌ Could not find logs for both models")
+            print("❌ Could not find logs for at least two models")
             print(f"   Found: {list(latest_logs.keys())}")
             print(f"   Please run benchmarks first or specify log files manually")
             return
@@ -310,20 +766,14 @@ def main():
     
     else:
         # Load specified logs
-        if args.yolov8:
-            if not Path(args.yolov8).exists():
-                print(f"❌ YOLOv8 log not found: {args.yolov8}")
+        for log_path, model_name in specified:
+            if not Path(log_path).exists():
+                print(f"❌ Log not found: {log_path}")
                 return
-            comparator.load_json_log(args.yolov8, 'yolov8')
-        
-        if args.yolov11:
-            if not Path(args.yolov11).exists():
-                print(f"❌ YOLO11 log not found: {args.yolov11}")
-                return
-            comparator.load_json_log(args.yolov11, 'yolov11')
+            comparator.load_json_log(log_path, model_name)
     
     # Perform comparison
-    comparison = comparator.compare()
+    comparison = comparator.compare(args.bootstrap, args.confidence, args.seed)
     
     if comparison:
         # Print report
@@ -333,5 +783,52 @@ def main():
         comparator.save_comparison(comparison, args.output)
 
 
+def run_regression_gate(comparator: BenchmarkComparator, args) -> int:
+    """Check a run against the pinned baseline
+    
+    Returns:
+        Exit code: 0 when within tolerance, 1 on a regression, 2 on bad input
+        or a new run that could not be measured (unfinished or missing metrics)
+    """
+    try:
+        tolerances = parse_tolerances(args.tolerance)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+    
+    if not Path(args.baseline).exists():
+        print(f"❌ Baseline not found: {args.baseline}")
+        return 2
+    
+    if args.results:
+        candidate_path = args.results[0]
+    else:
+        # Newest other run of the same model
+        baseline_dir = Path(args.baseline).parent
+        candidates = [p for p in comparator._result_files(baseline_dir)
+                      if p.resolve() != Path(args.baseline).resolve()]
+        if not candidates:
+            print(f"❌ No run to check next to the baseline in {baseline_dir}")
+            return 2
+        candidate_path = str(max(candidates, key=lambda p: p.stat().st_mtime))
+    
+    if not Path(candidate_path).exists():
+        print(f"❌ Log not found: {candidate_path}")
+        return 2
+    
+    baseline = load_results(args.baseline)
+    candidate = load_results(candidate_path)
+    gate = check_regression(baseline, candidate, tolerances)
+    print_regression_report(gate, args.baseline, candidate_path)
+    
+    gate.update({'baseline': args.baseline, 'new': candidate_path})
+    comparator.save_comparison(gate, args.output)
+    if gate['regressions']:
+        return 1
+    if not gate['complete'] or gate['missing']:
+        return 2
+    return 0
+
+
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
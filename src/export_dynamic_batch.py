@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Dynamic-Batch Export Script for YOLOv8n / YOLO11n ONNX models
+Makes the batch axis of a model dynamic so the runners can infer N frames per call
+"""
+
+import sys
+import os
+import shutil
+import argparse
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+# Add utils to path
+sys.path.insert(0, str(Path(__file__).parent))
+from utils import ConsoleLogger
+from utils.iobinding import ONNX_TO_NUMPY
+from utils.autotune import DEFAULT_SESSION_SETTINGS, apply_session_settings
+
+
+BATCH_DIM = 'batch'
+
+
+def export_ultralytics(pt_path: str, output_path: str, input_size: int) -> Dict:
+    """Export a PyTorch checkpoint with ultralytics' dynamic axes
+
+    Note: ultralytics makes height and width dynamic too; the runners still
+    feed input_size x input_size frames.
+
+    Args:
+        pt_path: .pt checkpoint
+        output_path: Path of the exported model
+        input_size: Export image size
+
+    Returns:
+        Dictionary describing the export
+    """
+    from ultralytics import YOLO
+
+    exported = YOLO(pt_path).export(format='onnx', dynamic=True, simplify=True, imgsz=input_size)
+    shutil.move(str(exported), output_path)
+    return {'model': pt_path, 'output': output_path, 'method': 'ultralytics export (dynamic=True)'}
+
+
+def make_batch_dynamic(model_path: str, output_path: str) -> Dict:
+    """Rewrite a fixed batch-1 ONNX model to take any batch size
+
+    The first axis of every graph input and output becomes the symbol
+    'batch'. Exports bake the batch size into Reshape targets (e.g.
+    [1, 144, -1] in the detection head); a leading 1 there is replaced by 0,
+    which copies the batch axis of the reshaped tensor. Stale intermediate
+    shape annotations are dropped so ONNX Runtime infers them again.
+
+    Args:
+        model_path: Fixed-batch ONNX model
+        output_path: Path of the dynamic-batch model
+
+    Returns:
+        Dictionary describing the rewrite
+    """
+    import onnx
+    from onnx import numpy_helper
+
+    model = onnx.load(model_path)
+    graph = model.graph
+    initializer_names = {init.name for init in graph.initializer}
+
+    for value in list(graph.input) + list(graph.output):
+        if value.name in initializer_names:
+            continue
+        dims = value.type.tensor_type.shape.dim
+        if len(dims) == 0:
+            continue
+        if dims[0].HasField('dim_value') and dims[0].dim_value != 1:
+            raise ValueError(f"'{value.name}' has batch size {dims[0].dim_value}, expected 1")
+        dims[0].dim_param = BATCH_DIM
+
+    # Reshape targets given as initializers or Constant nodes
+    constants = {init.name: init for init in graph.initializer}
+    for node in graph.node:
+        if node.op_type == 'Constant':
+            for attr in node.attribute:
+                if attr.name == 'value':
+                    constants[node.output[0]] = attr.t
+
+    patched = 0
+    for node in graph.node:
+        if node.op_type != 'Reshape' or len(node.input) < 2 or node.input[1] not in constants:
+            continue
+        if any(attr.name == 'allowzero' and attr.i == 1 for attr in node.attribute):
+            continue
+        tensor = constants[node.input[1]]
+        shape = numpy_helper.to_array(tensor).copy()
+        if shape.ndim == 1 and shape.size > 1 and shape[0] == 1:
+            shape[0] = 0
+            tensor.CopyFrom(numpy_helper.from_array(shape, tensor.name))
+            patched += 1
+
+    del graph.value_info[:]
+    onnx.checker.check_model(model)
+    onnx.save(model, output_path)
+    return {'model': model_path, 'output': output_path,
+            'method': f"batch axis rewrite ({patched} Reshape targets patched)"}
+
+
+def _create_session(model_path: str):
+    import onnxruntime as ort
+
+    sess_options = ort.SessionOptions()
+    sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    apply_session_settings(sess_options, DEFAULT_SESSION_SETTINGS)
+    return ort.InferenceSession(model_path, sess_options=sess_options, providers=['CPUExecutionProvider'])
+
+
+def verify_batch(model_path: str, dynamic_path: str, batch_size: int, input_size: int) -> Dict:
+    """Check that one batch gives the same outputs as its frames one by one
+
+    Args:
+        model_path: Original batch-1 model
+        dynamic_path: Dynamic-batch model
+        batch_size: Frames in the test batch
+        input_size: Model input size
+
+    Returns:
+        Dictionary with the output shape and the largest absolute difference
+    """
+    reference = _create_session(model_path)
+    dynamic = _create_session(dynamic_path)
+    meta = dynamic.get_inputs()[0]
+    dtype = ONNX_TO_NUMPY.get(meta.type, np.float32)
+    shape = [batch_size] + [dim if isinstance(dim, int) else input_size for dim in meta.shape[1:]]
+
+    rng = np.random.default_rng(0)
+    if dtype == np.uint8:
+        batch = rng.integers(0, 256, shape, dtype=np.uint8)
+    else:
+        batch = rng.random(shape, dtype=np.float32)
+
+    batched = dynamic.run(None, {meta.name: batch})[0]
+    single = np.concatenate([reference.run(None, {reference.get_inputs()[0].name: batch[i:i + 1]})[0]
+                             for i in range(batch_size)])
+    if batched.shape != single.shape:
+        raise ValueError(f"Batch output shape {batched.shape} does not match {single.shape}")
+    return {'batch_size': batch_size, 'output_shape': list(batched.shape),
+            'max_abs_diff': float(np.abs(batched - single).max())}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Export YOLO ONNX models with a dynamic batch axis for batched inference'
+    )
+    parser.add_argument('--model', type=str, nargs='+',
+                        default=['models/yolov8n.onnx', 'models/yolo11n.onnx'],
+                        help='Batch-1 ONNX model(s), or .pt checkpoints exported through ultralytics '
+                             '(default: models/yolov8n.onnx models/yolo11n.onnx)')
+    parser.add_argument('--output-dir', type=str, default=None,
+                        help='Directory for exported models (default: next to each model)')
+    parser.add_argument('--suffix', type=str, default='_dynamic',
+                        help='Suffix of exported model files (default: _dynamic)')
+    parser.add_argument('--verify-batch', type=int, default=4,
+                        help='Compare a batch of this size against single-frame runs, 0 to skip (default: 4)')
+    parser.add_argument('--input-size', type=int, default=640,
+                        help='Input image size (default: 640)')
+
+    args = parser.parse_args()
+
+    exported = []
+    for model_path in args.model:
+        if not os.path.exists(model_path):
+            ConsoleLogger.warning(f"Model not found, skipping: {model_path}")
+            continue
+        output_dir = Path(args.output_dir) if args.output_dir else Path(model_path).parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = str(output_dir / f"{Path(model_path).stem}{args.suffix}.onnx")
+
+        ConsoleLogger.progress(f"Exporting {model_path} with a dynamic batch axis...")
+        try:
+            if model_path.endswith('.pt'):
+                info = export_ultralytics(model_path, output_path, args.input_size)
+            else:
+                info = make_batch_dynamic(model_path, output_path)
+        except ImportError as e:
+            ConsoleLogger.error(f"{model_path}: {e}")
+            ConsoleLogger.info("ONNX rewrites need 'onnx', .pt exports need 'ultralytics' (pip install ...)")
+            continue
+        except ValueError as e:
+            ConsoleLogger.error(f"{model_path}: {e}")
+            continue
+        ConsoleLogger.success(f"{output_path}: {info['method']}")
+
+        if args.verify_batch > 0 and not model_path.endswith('.pt'):
+            try:
+                check = verify_batch(model_path, output_path, args.verify_batch, args.input_size)
+            except Exception as e:
+                ConsoleLogger.error(f"Batch {args.verify_batch} failed: {e}")
+                ConsoleLogger.info("Export from the .pt checkpoint instead: "
+                                   f"python3 src/export_dynamic_batch.py --model {Path(model_path).with_suffix('.pt')}")
+                os.remove(output_path)
+                continue
+            ConsoleLogger.success(f"Batch {check['batch_size']} matches single frames "
+                                  f"(output {check['output_shape']}, max difference {check['max_abs_diff']:.2e})")
+        exported.append(output_path)
+
+    if exported:
+        ConsoleLogger.info("Run batched benchmarks on video or an image directory, e.g.")
+        ConsoleLogger.info(f"  python3 src/run_yolov8.py --model {exported[0]} --video input.mp4 --batch 1 2 4 8")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Preprocessing Folding Script for YOLOv8n / YOLO11n ONNX models
+Wraps a model with Transpose -> Cast -> Div so it takes raw uint8 HWC frames
+"""
+
+import sys
+import os
+import json
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import cv2
+import numpy as np
+
+# Add utils to path
+sys.path.insert(0, str(Path(__file__).parent))
+from utils import ConsoleLogger, LetterboxPreprocessor
+from utils.letterbox import LAYOUT_NHWC
+from utils.autotune import DEFAULT_SESSION_SETTINGS, apply_session_settings
+
+
+# Written to the folded model's metadata (runners detect the uint8 input itself)
+FOLDED_METADATA = {'input_layout': 'nhwc_uint8', 'channel_order': 'bgr'}
+
+
+def fold_preprocess(model_path: str, output_path: str) -> Dict:
+    """Prepend NHWC -> NCHW, uint8 -> float and / 255 to a model's input
+
+    The transpose runs first, on uint8 data, so it moves a quarter of the
+    bytes it would move on float32.
+
+    The new input keeps the original name and takes (N, H, W, 3) uint8 BGR
+    frames. BGR -> RGB is folded into the weights of the first convolutions
+    when every consumer of the input is a Conv with its own weight
+    initializer; otherwise a Gather on the channel axis is inserted.
+
+    Args:
+        model_path: fp32 NCHW ONNX model
+        output_path: Path of the folded model
+
+    Returns:
+        Dictionary describing the rewrite
+    """
+    import onnx
+    from onnx import TensorProto, helper, numpy_helper
+
+    model = onnx.load(model_path)
+    graph = model.graph
+    initializer_names = {init.name for init in graph.initializer}
+    graph_inputs = [inp for inp in graph.input if inp.name not in initializer_names]
+    if len(graph_inputs) != 1:
+        raise ValueError(f"Expected one model input, found {len(graph_inputs)}")
+    original = graph_inputs[0]
+    tensor_type = original.type.tensor_type
+    if tensor_type.elem_type != TensorProto.FLOAT:
+        raise ValueError(f"Input '{original.name}' is not float32 (already folded?)")
+    dims = list(tensor_type.shape.dim)
+    if len(dims) != 4 or dims[1].dim_value != 3:
+        raise ValueError(f"Input '{original.name}' is not NCHW with 3 channels")
+
+    name = original.name
+    internal = f"{name}_nchw"
+    consumers = [node for node in graph.node if name in node.input]
+    for node in consumers:
+        for i, value in enumerate(node.input):
+            if value == name:
+                node.input[i] = internal
+
+    # BGR -> RGB: reverse the input channels of the first convolutions if possible
+    initializers = {init.name: init for init in graph.initializer}
+    weight_users = {}
+    for node in graph.node:
+        for value in node.input:
+            weight_users[value] = weight_users.get(value, 0) + 1
+    foldable = all(
+        node.op_type == 'Conv' and len(node.input) > 1 and node.input[0] == internal
+        and node.input[1] in initializers and weight_users[node.input[1]] == 1
+        and all(attr.name != 'group' or attr.i == 1 for attr in node.attribute)
+        for node in consumers
+    )
+
+    nodes = []
+    if foldable:
+        for node in consumers:
+            weight = initializers[node.input[1]]
+            flipped = numpy_helper.to_array(weight)[:, ::-1]
+            weight.CopyFrom(numpy_helper.from_array(np.ascontiguousarray(flipped), weight.name))
+        nhwc_input = name
+        channel_order = 'folded into first Conv weights'
+    else:
+        graph.initializer.append(numpy_helper.from_array(np.array([2, 1, 0], dtype=np.int64),
+                                                         f"{name}_bgr_to_rgb"))
+        nodes.append(helper.make_node('Gather', [name, f"{name}_bgr_to_rgb"], [f"{name}_rgb"],
+                                      axis=3, name='preprocess_bgr_to_rgb'))
+        nhwc_input = f"{name}_rgb"
+        channel_order = 'Gather on channel axis'
+
+    graph.initializer.append(numpy_helper.from_array(np.array(255.0, dtype=np.float32), f"{name}_scale"))
+    nodes += [
+        helper.make_node('Transpose', [nhwc_input], [f"{name}_nchw_uint8"], perm=[0, 3, 1, 2],
+                         name='preprocess_transpose'),
+        helper.make_node('Cast', [f"{name}_nchw_uint8"], [f"{name}_float"], to=TensorProto.FLOAT,
+                         name='preprocess_cast'),
+        helper.make_node('Div', [f"{name}_float", f"{name}_scale"], [internal], name='preprocess_div')
+    ]
+    existing = list(graph.node)
+    del graph.node[:]
+    graph.node.extend(nodes + existing)
+
+    # Same name, uint8 NHWC (batch/spatial dims keep their values or symbols)
+    new_input = helper.make_tensor_value_info(name, TensorProto.UINT8, None)
+    new_dims = new_input.type.tensor_type.shape.dim
+    for dim in (dims[0], dims[2], dims[3]):
+        new_dims.add().CopyFrom(dim)
+    new_dims.add().dim_value = 3
+    for i, inp in enumerate(graph.input):
+        if inp.name == name:
+            graph.input[i].CopyFrom(new_input)
+
+    for key, value in FOLDED_METADATA.items():
+        entry = model.metadata_props.add()
+        entry.key, entry.value = key, value
+
+    onnx.checker.check_model(model)
+    onnx.save(model, output_path)
+
+    def dim_str(dim):
+        return str(dim.dim_value) if dim.HasField('dim_value') else (dim.dim_param or '?')
+
+    return {
+        'model': model_path,
+        'output': output_path,
+        'input': name,
+        'input_shape': [dim_str(d) for d in new_dims],
+        'channel_order': channel_order
+    }
+
+
+def _create_session(model_path: str):
+    import onnxruntime as ort
+
+    sess_options = ort.SessionOptions()
+    sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    apply_session_settings(sess_options, DEFAULT_SESSION_SETTINGS)
+    return ort.InferenceSession(model_path, sess_options=sess_options, providers=['CPUExecutionProvider'])
+
+
+def compare_end_to_end(model_path: str, folded_path: str, image_path: str,
+                       input_size: int, iterations: int) -> Dict:
+    """Check the folded model's outputs and time preprocess + inference for both
+
+    Args:
+        model_path: Original fp32 model
+        folded_path: Folded uint8 model
+        image_path: Test image
+        input_size: Model input size
+        iterations: Timed frames per model
+
+    Returns:
+        Per-variant timings (ms, median) and the output difference
+    """
+    import time
+
+    image = cv2.imread(image_path)
+    if image is None:
+        raise ValueError(f"Failed to load image: {image_path}")
+
+    variants = {
+        'fp32': (_create_session(model_path), LetterboxPreprocessor(input_size)),
+        'uint8': (_create_session(folded_path), LetterboxPreprocessor(input_size, layout=LAYOUT_NHWC))
+    }
+    result = {'image': image_path, 'iterations': iterations, 'variants': {}}
+    outputs = {}
+
+    for name, (session, preprocess) in variants.items():
+        input_name = session.get_inputs()[0].name
+        outputs[name] = session.run(None, {input_name: preprocess(image)})[0]
+
+        times = np.empty((iterations, 2))
+        for i in range(iterations):
+            t0 = time.perf_counter()
+            tensor = preprocess(image)
+            t1 = time.perf_counter()
+            session.run(None, {input_name: tensor})
+            times[i] = (t1 - t0, time.perf_counter() - t1)
+
+        preprocess_ms, inference_ms = np.median(times, axis=0) * 1000
+        result['variants'][name] = {
+            'input_bytes': int(tensor.nbytes),
+            'preprocess_ms': float(preprocess_ms),
+            'inference_ms': float(inference_ms),
+            'end_to_end_ms': float(np.median(times.sum(axis=1)) * 1000)
+        }
+
+    result['max_abs_diff'] = float(np.abs(outputs['fp32'] - outputs['uint8']).max())
+    fp32, uint8 = result['variants']['fp32'], result['variants']['uint8']
+    result['end_to_end_gain_pct'] = (1 - uint8['end_to_end_ms'] / fp32['end_to_end_ms']) * 100
+    return result
+
+
+def print_comparison(result: Dict):
+    """Print the end-to-end comparison table"""
+    print("\n" + "=" * 80)
+    print("FOLDED PREPROCESSING (median per frame)")
+    print("=" * 80)
+    print(f"{'Variant':8s} {'Input':>10s} {'Preprocess':>11s} {'Inference':>10s} {'End-to-end':>11s}")
+    print("-" * 80)
+    for name, variant in result['variants'].items():
+        print(f"{name:8s} {variant['input_bytes'] / (1024 * 1024):8.2f}MB {variant['preprocess_ms']:9.2f}ms "
+              f"{variant['inference_ms']:8.2f}ms {variant['end_to_end_ms']:9.2f}ms")
+    print("-" * 80)
+    print(f"End-to-end gain: {result['end_to_end_gain_pct']:+.1f}%, "
+          f"max output difference: {result['max_abs_diff']:.2e}")
+    print("=" * 80)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Fold input normalization and layout conversion into YOLO ONNX models (uint8 NHWC input)'
+    )
+    parser.add_argument('--model', type=str, nargs='+',
+                        default=['models/yolov8n.onnx', 'models/yolo11n.onnx'],
+                        help='fp32 ONNX model(s) (default: models/yolov8n.onnx models/yolo11n.onnx)')
+    parser.add_argument('--output-dir', type=str, default=None,
+                        help='Directory for folded models (default: next to each model)')
+    parser.add_argument('--suffix', type=str, default='_u8',
+                        help='Suffix of folded model files (default: _u8)')
+    parser.add_argument('--image', type=str, default=None,
+                        help='Verify outputs and time preprocess + inference on this image')
+    parser.add_argument('--iterations', type=int, default=50,
+                        help='Timed frames per model with --image (default: 50)')
+    parser.add_argument('--input-size', type=int, default=640,
+                        help='Input image size (default: 640)')
+    parser.add_argument('--report-dir', type=str, default='logs/fold_preprocess',
+                        help='Directory for the JSON report with --image (default: logs/fold_preprocess)')
+
+    args = parser.parse_args()
+
+    try:
+        import onnx  # noqa: F401
+    except ImportError:
+        ConsoleLogger.error("Folding requires the 'onnx' package")
+        ConsoleLogger.info("Install it with: pip install onnx")
+        return
+
+    reports: List[Dict] = []
+    for model_path in args.model:
+        if not os.path.exists(model_path):
+            ConsoleLogger.warning(f"Model not found, skipping: {model_path}")
+            continue
+        output_dir = Path(args.output_dir) if args.output_dir else Path(model_path).parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = str(output_dir / f"{Path(model_path).stem}{args.suffix}.onnx")
+
+        ConsoleLogger.progress(f"Folding preprocessing into {model_path}...")
+        try:
+            info = fold_preprocess(model_path, output_path)
+        except ValueError as e:
+            ConsoleLogger.error(f"{model_path}: {e}")
+            continue
+        ConsoleLogger.success(f"{output_path}: input '{info['input']}' uint8 "
+                              f"[{', '.join(info['input_shape'])}], BGR -> RGB {info['channel_order']}")
+
+        if args.image:
+            info['comparison'] = compare_end_to_end(model_path, output_path, args.image,
+                                                    args.input_size, args.iterations)
+            print_comparison(info['comparison'])
+        reports.append(info)
+
+    if args.image and reports:
+        report_dir = Path(args.report_dir)
+        report_dir.mkdir(parents=True, exist_ok=True)
+        report_path = report_dir / f"fold_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json"
+        with open(report_path, 'w') as f:
+            json.dump(reports, f, indent=2)
+        ConsoleLogger.info(f"Report saved to: {report_path}")
+
+    if reports:
+        ConsoleLogger.info("The benchmark runners detect the uint8 input and feed frames directly, e.g.")
+        ConsoleLogger.info(f"  python3 src/run_yolov8.py --model {reports[0]['output']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+INT8 Quantization Script for YOLOv8n / YOLO11n ONNX models
+Builds dynamic and static INT8 variants and benchmarks them against fp32
+"""
+
+import sys
+import os
+import json
+import argparse
+import resource
+import multiprocessing
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import cv2
+import numpy as np
+
+# Add utils to path
+sys.path.insert(0, str(Path(__file__).parent))
+from utils import ConsoleLogger
+from utils.runners import get_benchmark_class
+
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+
+def find_images(image_dir: str, limit: Optional[int] = None) -> List[str]:
+    """List calibration images in a directory
+
+    Args:
+        image_dir: Directory with images
+        limit: Maximum number of images
+
+    Returns:
+        Sorted list of image paths
+    """
+    images = sorted(str(p) for p in Path(image_dir).iterdir()
+                    if p.suffix.lower() in IMAGE_EXTENSIONS)
+    return images[:limit] if limit else images
+
+
+def make_calibration_reader(image_paths: List[str], preprocess, input_name: str):
+    """Create an ORT calibration data reader using the benchmark preprocessing
+
+    Args:
+        image_paths: Calibration images
+        preprocess: Preprocessing function (the benchmark's _preprocess)
+        input_name: Model input name
+
+    Returns:
+        CalibrationDataReader instance
+    """
+    from onnxruntime.quantization import CalibrationDataReader
+
+    class PreprocessCalibrationReader(CalibrationDataReader):
+        """Feeds calibration images through the benchmark's _preprocess"""
+
+        def __init__(self):
+            self.paths = iter(image_paths)
+
+        def get_next(self):
+            for path in self.paths:
+                image = cv2.imread(path)
+                if image is None:
+                    ConsoleLogger.warning(f"Skipping unreadable image: {path}")
+                    continue
+                # Copy: the preprocess path may reuse its output buffer
+                return {input_name: np.array(preprocess(image), copy=True)}
+            return None
+
+    return PreprocessCalibrationReader()
+
+
+def quantize_variants(model_path: str, image_paths: List[str], output_dir: str,
+                      preprocess, input_name: str) -> Dict[str, str]:
+    """Build dynamic and static INT8 variants of a model
+
+    Args:
+        model_path: Path to fp32 ONNX model
+        image_paths: Calibration images for static quantization
+        output_dir: Directory for quantized models
+        preprocess: Preprocessing function
+        input_name: Model input name
+
+    Returns:
+        Dictionary mapping variant name to model path
+    """
+    from onnxruntime.quantization import QuantFormat, QuantType, quantize_dynamic, quantize_static
+
+    stem = Path(model_path).stem
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    variants = {'fp32': model_path}
+
+    ConsoleLogger.progress("Building dynamic INT8 model...")
+    dynamic_path = str(Path(output_dir) / f"{stem}_int8_dynamic.onnx")
+    # ConvInteger on the CPU provider only supports uint8 weights
+    quantize_dynamic(model_path, dynamic_path, weight_type=QuantType.QUInt8)
+    variants['int8_dynamic'] = dynamic_path
+    ConsoleLogger.success(f"Dynamic INT8 model: {dynamic_path}")
+
+    ConsoleLogger.progress(f"Building static INT8 model ({len(image_paths)} calibration images)...")
+    static_path = str(Path(output_dir) / f"{stem}_int8_static.onnx")
+    quantize_static(
+        model_path, static_path,
+        make_calibration_reader(image_paths, preprocess, input_name),
+        quant_format=QuantFormat.QDQ,
+        activation_type=QuantType.QUInt8,
+        weight_type=QuantType.QInt8
+    )
+    variants['int8_static'] = static_path
+    ConsoleLogger.success(f"Static INT8 model: {static_path}")
+
+    return variants
+
+
+def _benchmark_variant(model_path: str, input_size: int, conf_threshold: float,
+                       image_path: str, iterations: int) -> Dict:
+    """Benchmark one variant (runs in a fresh process so peak RSS is its own)"""
+    benchmark_class = get_benchmark_class(model_path)
+    benchmark = benchmark_class(model_path, input_size=input_size, conf_threshold=conf_threshold)
+    benchmark.run_image_benchmark(image_path, iterations)
+
+    return {
+        'summary': benchmark.logger.summary if benchmark.logger else None,
+        'log_path': benchmark.logger.get_json_path() if benchmark.logger else None,
+        # ru_maxrss is reported in kilobytes on Linux
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    }
+
+
+def measure_drift(reference, candidate, image_paths: List[str], preprocess,
+                  conf_threshold: float) -> Dict:
+    """Measure how far a variant's outputs drift from the fp32 reference
+
+    Args:
+        reference: fp32 ONNX Runtime session
+        candidate: Quantized ONNX Runtime session
+        image_paths: Images to compare on
+        preprocess: Preprocessing function
+        conf_threshold: Score threshold for candidate detections
+
+    Returns:
+        Drift statistics
+    """
+    input_name = reference.get_inputs()[0].name
+    abs_errors, max_errors, agreements = [], [], []
+
+    for path in image_paths:
+        image = cv2.imread(path)
+        if image is None:
+            continue
+        input_tensor = np.array(preprocess(image), copy=True)
+        ref = reference.run(None, {input_name: input_tensor})[0]
+        out = candidate.run(None, {input_name: input_tensor})[0]
+
+        diff = np.abs(ref - out)
+        abs_errors.append(float(diff.mean()))
+        max_errors.append(float(diff.max()))
+
+        # Candidate detections: anchors whose best class score passes the threshold
+        ref_scores, out_scores = ref[0, 4:], out[0, 4:]
+        ref_keep = ref_scores.max(axis=0) >= conf_threshold
+        out_keep = out_scores.max(axis=0) >= conf_threshold
+        same_class = ref_scores.argmax(axis=0) == out_scores.argmax(axis=0)
+        union = np.count_nonzero(ref_keep | out_keep)
+        agreements.append(np.count_nonzero(ref_keep & out_keep & same_class) / union if union else 1.0)
+
+    return {
+        'images': len(abs_errors),
+        'mean_abs_error': float(np.mean(abs_errors)) if abs_errors else 0.0,
+        'max_abs_error': float(np.max(max_errors)) if max_errors else 0.0,
+        'detection_agreement': float(np.mean(agreements)) if agreements else 0.0
+    }
+
+
+def print_report(report: Dict):
+    """Print quantization comparison table
+
+    Args:
+        report: Report dictionary
+    """
+    print("\n" + "=" * 80)
+    print("QUANTIZATION REPORT")
+    print("=" * 80)
+    print(f"{'Variant':14s} {'Size MB':>8s} {'Avg ms':>8s} {'FPS':>7s} {'Peak RSS':>9s} "
+          f"{'MAE':>8s} {'Max Err':>8s} {'Det Agree':>9s}")
+    print("-" * 80)
+
+    for name, variant in report['variants'].items():
+        summary = variant.get('summary') or {}
+        drift = variant.get('drift') or {}
+        print(f"{name:14s} {variant['size_mb']:8.2f} "
+              f"{summary.get('avg_inference_ms', 0):8.1f} {summary.get('avg_fps', 0):7.2f} "
+              f"{variant.get('peak_rss_mb', 0):7.0f}MB "
+              f"{drift.get('mean_abs_error', 0):8.4f} {drift.get('max_abs_error', 0):8.3f} "
+              f"{drift.get('detection_agreement', 1.0) * 100:8.1f}%")
+
+    print("=" * 80)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Quantize a YOLO ONNX model to INT8 and benchmark it against fp32'
+    )
+    parser.add_argument('--model', type=str, default='models/yolov8n.onnx',
+                        help='Path to fp32 ONNX model (default: models/yolov8n.onnx)')
+    parser.add_argument('--calib-dir', type=str, required=True,
+                        help='Directory of calibration images')
+    parser.add_argument('--calib-limit', type=int, default=100,
+                        help='Maximum number of calibration images (default: 100)')
+    parser.add_argument('--output-dir', type=str, default='models',
+                        help='Directory for quantized models (default: models)')
+    parser.add_argument('--image', type=str, default=None,
+                        help='Benchmark image (default: first calibration image)')
+    parser.add_argument('--iterations', type=int, default=100,
+                        help='Benchmark iterations per variant (default: 100)')
+    parser.add_argument('--input-size', type=int, default=640,
+                        help='Input image size (default: 640)')
+    parser.add_argument('--conf', type=float, default=0.25,
+                        help='Confidence threshold (default: 0.25)')
+    parser.add_argument('--report-dir', type=str, default='logs/quantization',
+                        help='Directory for the JSON report (default: logs/quantization)')
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.model):
+        ConsoleLogger.error(f"Model not found: {args.model}")
+        return
+
+    try:
+        import onnxruntime.quantization  # noqa: F401
+    except ImportError:
+        ConsoleLogger.error("onnxruntime.quantization requires the 'onnx' package")
+        ConsoleLogger.info("Install it with: pip install onnx")
+        return
+
+    image_paths = find_images(args.calib_dir, args.calib_limit)
+    if not image_paths:
+        ConsoleLogger.error(f"No calibration images found in {args.calib_dir}")
+        return
+    benchmark_image = args.image or image_paths[0]
+
+    # The fp32 runner provides the exact preprocessing used by the benchmark
+    reference = get_benchmark_class(args.model)(
+        args.model, input_size=args.input_size, conf_threshold=args.conf
+    )
+
+    variants = quantize_variants(args.model, image_paths, args.output_dir,
+                                 reference._preprocess, reference.input_name)
+
+    import onnxruntime as ort
+
+    report = {
+        'model': args.model,
+        'timestamp': datetime.now().isoformat(),
+        'calibration_images': len(image_paths),
+        'benchmark_image': benchmark_image,
+        'iterations': args.iterations,
+        'variants': {}
+    }
+
+    ctx = multiprocessing.get_context('spawn')
+    for name, path in variants.items():
+        ConsoleLogger.info(f"Benchmarking {name}: {path}")
+        with ctx.Pool(1) as pool:
+            result = pool.apply(_benchmark_variant, (path, args.input_size, args.conf,
+                                                     benchmark_image, args.iterations))
+
+        result['model_path'] = path
+        result['size_mb'] = os.path.getsize(path) / (1024 * 1024)
+        if name != 'fp32':
+            candidate = ort.InferenceSession(path, providers=['CPUExecutionProvider'])
+            result['drift'] = measure_drift(reference.session, candidate, image_paths,
+                                            reference._preprocess, args.conf)
+        report['variants'][name] = result
+
+    print_report(report)
+
+    report_dir = Path(args.report_dir)
+    report_dir.mkdir(parents=True, exist_ok=True)
+    report_path = report_dir / f"{Path(args.model).stem}_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json"
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    ConsoleLogger.success(f"Report saved to: {report_path}")
+
+
+if __name__ == '__main__':
+    main()
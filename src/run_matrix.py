@@ -0,0 +1,548 @@
+#!/usr/bin/env python3
+"""
+Benchmark Matrix Runner
+Runs every model x format x input size x thread count cell in a fresh process
+"""
+
+import sys
+import os
+import json
+import time
+import queue
+import argparse
+import resource
+import itertools
+import multiprocessing
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add utils to path
+sys.path.insert(0, str(Path(__file__).parent))
+from utils import ConsoleLogger, create_monitor, wait_for_cooldown, parse_synthetic_spec
+from utils.result_stream import encode_record
+from utils.runners import get_benchmark_class
+from utils.thermal import DEFAULT_COOLDOWN_TIMEOUT
+
+
+FORMATS = ('onnx', 'ncnn', 'pt')
+
+DEFAULT_MATRIX = {
+    'models': ['yolov8n', 'yolo11n'],
+    'formats': ['onnx'],
+    'sizes': [320, 480, 640],
+    'threads': [1, 2, 4]
+}
+
+
+def cell_key(cell: Dict) -> str:
+    """Stable identifier of a matrix cell (used for resuming)"""
+    return f"{cell['model']}|{cell['format']}|{cell['input_size']}|{cell['threads']}"
+
+
+def cell_label(cell: Dict) -> str:
+    """Short human-readable cell name"""
+    return f"{cell['model']} {cell['format']} {cell['input_size']} t{cell['threads']}"
+
+
+def resolve_model_path(model_dir: str, model: str, model_format: str, input_size: int) -> Optional[str]:
+    """Find the exported model file for a cell
+
+    Size-specific exports ('yolov8n_320.onnx', 'yolov8n_320_ncnn_model')
+    are preferred over the default export.
+
+    Returns:
+        Path, or None if no export exists
+    """
+    names = {
+        'onnx': [f"{model}_{input_size}.onnx", f"{model}.onnx"],
+        'ncnn': [f"{model}_{input_size}_ncnn_model", f"{model}_ncnn_model"],
+        'pt': [f"{model}.pt"]
+    }[model_format]
+    for name in names:
+        path = Path(model_dir) / name
+        if path.exists():
+            return str(path)
+    return None
+
+
+def build_cells(matrix: Dict, model_dir: str) -> List[Dict]:
+    """Expand the declared matrix into cells in run order"""
+    cells = []
+    for model, model_format, size, threads in itertools.product(
+            matrix['models'], matrix['formats'], matrix['sizes'], matrix['threads']):
+        cells.append({
+            'model': model,
+            'format': model_format,
+            'input_size': int(size),
+            'threads': int(threads),
+            'model_path': resolve_model_path(model_dir, model, model_format, int(size))
+        })
+    return cells
+
+
+def _run_onnx_cell(cell: Dict, source: Dict) -> Dict:
+    """Benchmark one ONNX cell with the ORT runners"""
+    from utils.autotune import DEFAULT_SESSION_SETTINGS
+
+    settings = dict(DEFAULT_SESSION_SETTINGS, intra_op_num_threads=cell['threads'])
+    benchmark_class = get_benchmark_class(cell['model_path'])
+    benchmark = benchmark_class(cell['model_path'], input_size=cell['input_size'],
+                                session_settings=settings)
+
+    # Fixed-shape exports only run at their own size
+    shape = benchmark.session.get_inputs()[0].shape
+    if all(isinstance(dim, int) for dim in shape[2:]) and list(shape[2:]) != [cell['input_size']] * 2:
+        raise ValueError(f"{cell['model_path']} is exported for {shape[2]}x{shape[3]}; "
+                         f"export a {cell['input_size']} variant as {cell['model']}_{cell['input_size']}.onnx")
+
+    if source.get('image'):
+        benchmark.run_image_benchmark(source['image'], source['iterations'])
+    elif source.get('video'):
+        benchmark.run_video_benchmark(source['video'], source['duration'])
+    else:
+        benchmark.run_synthetic_benchmark(source['synthetic'], source['duration'], capture_policy='sync')
+
+    if benchmark.logger is None or benchmark.logger.summary is None:
+        raise RuntimeError("benchmark produced no summary")
+    return {'summary': benchmark.logger.summary, 'results_path': benchmark.logger.get_json_path()}
+
+
+def _run_ultralytics_cell(cell: Dict, source: Dict) -> Dict:
+    """Benchmark one PyTorch or NCNN cell through ultralytics
+
+    Latency is ultralytics' own per-frame inference time; FPS covers the
+    whole predict() call (pre- and postprocessing included).
+    """
+    # Must be set before torch/ncnn create their thread pools
+    os.environ['OMP_NUM_THREADS'] = str(cell['threads'])
+
+    import cv2
+    from ultralytics import YOLO
+    from utils import BenchmarkLogger, FPSCalculator, LatencyHistogram
+    from utils import VideoFileSource, SyntheticSource, parse_synthetic_spec
+    from utils.histogram import DEFAULT_PERCENTILES, percentile_key
+
+    if cell['format'] == 'pt':
+        import torch
+        torch.set_num_threads(cell['threads'])
+
+    model = YOLO(cell['model_path'], task='detect')
+    logger = BenchmarkLogger(f"{cell['model']}_{cell['format']}")
+
+    if source.get('image'):
+        image = cv2.imread(source['image'])
+        if image is None:
+            raise ValueError(f"Failed to load image: {source['image']}")
+        frames, limit, description = None, source['iterations'], f"Image: {source['image']}"
+    else:
+        if source.get('video'):
+            frames = VideoFileSource(source['video'])
+        else:
+            frames = SyntheticSource(*parse_synthetic_spec(source['synthetic']))
+        image, limit, description = None, None, frames.describe()
+
+    logger.write_header({
+        'model_path': cell['model_path'],
+        'input_size': f"{cell['input_size']}x{cell['input_size']}",
+        'backend': f"ultralytics ({cell['format']})",
+        'input_source': description,
+        'duration_seconds': source.get('duration'),
+        'num_iterations': limit,
+        'threads': cell['threads']
+    })
+
+    warmup = image if image is not None else frames.read()[1]
+    for _ in range(10):
+        model.predict(warmup, imgsz=cell['input_size'], verbose=False)
+
+    fps_calc = FPSCalculator(window_size=30)
+    histograms = {'inference': LatencyHistogram(), 'postprocess': LatencyHistogram()}
+    fps_calc.start()
+    cpu_start = time.process_time()
+    start_time = time.time()
+    frame_count = 0
+
+    try:
+        while True:
+            if limit is not None:
+                if frame_count >= limit:
+                    break
+                frame = image
+            else:
+                if time.time() - start_time >= source['duration']:
+                    break
+                ret, frame = frames.read()
+                if not ret:
+                    if getattr(frames, 'finished', False):
+                        break
+                    continue
+
+            result = model.predict(frame, imgsz=cell['input_size'], verbose=False)[0]
+            fps = fps_calc.update()
+            inference_time = result.speed['inference'] / 1000
+            postprocess_time = result.speed['postprocess'] / 1000
+            histograms['inference'].record(inference_time)
+            histograms['postprocess'].record(postprocess_time)
+
+            frame_count += 1
+            detections = len(result.boxes)
+            logger.log_detections(frame_count, detections)
+            if frame_count % 30 == 0:
+                logger.log_inference(frame_count, inference_time, fps, postprocess_time, detections)
+    finally:
+        fps_calc.stop()
+        cpu_time = time.process_time() - cpu_start
+        if frames is not None:
+            frames.release()
+
+    inference_hist = histograms['inference']
+    fps_stats = logger.get_running_summary()['fps']
+    summary = {
+        'total_frames': frame_count,
+        'elapsed_s': fps_calc.get_elapsed_time(),
+        'avg_fps': fps_calc.get_average_fps(),
+        'min_fps': fps_stats['min'],
+        'max_fps': fps_stats['max'],
+        'avg_inference_ms': inference_hist.mean() * 1000,
+        'min_inference_ms': (inference_hist.min * 1000) if inference_hist.count else 0,
+        'max_inference_ms': inference_hist.max * 1000,
+        'avg_postprocess_ms': histograms['postprocess'].mean() * 1000,
+        'max_postprocess_ms': histograms['postprocess'].max * 1000,
+        'latency': {stage: hist.summary() for stage, hist in histograms.items() if hist.count},
+        'process_cpu_s': cpu_time,
+        'cpu_ms_per_frame': (cpu_time / frame_count * 1000) if frame_count else 0,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    }
+    for p, value in inference_hist.percentiles(DEFAULT_PERCENTILES).items():
+        summary[f'{percentile_key(p)}_inference_ms'] = value * 1000
+    logger.log_histograms(histograms)
+    logger.write_summary(summary)
+    logger.save_json()
+    return {'summary': summary, 'results_path': logger.get_json_path()}
+
+
+def _cell_worker(cell: Dict, source: Dict, results):
+    """Child process entry point: run one cell and report back"""
+    try:
+        if cell['format'] == 'onnx':
+            outcome = _run_onnx_cell(cell, source)
+        else:
+            outcome = _run_ultralytics_cell(cell, source)
+        outcome['status'] = 'ok'
+    except ImportError as e:
+        outcome = {'status': 'skipped', 'error': f"missing dependency: {e.name or e}"}
+    except BaseException as e:  # Report every failure to the driver
+        outcome = {'status': 'failed', 'error': f"{type(e).__name__}: {e}"}
+    results.put(outcome)
+
+
+class MatrixRunner:
+    """Runs matrix cells one at a time, each in a fresh spawned process
+
+    Finished cells are appended to a JSON Lines state file as soon as they
+    complete, so an interrupted matrix resumes where it stopped.
+    """
+
+    def __init__(self, cells: List[Dict], source: Dict, output_dir: str,
+                 cooldown: float = 60.0, cell_timeout: Optional[float] = None,
+                 retry_failed: bool = False, cooldown_temp: Optional[float] = None,
+                 cooldown_timeout: float = DEFAULT_COOLDOWN_TIMEOUT):
+        """Initialize matrix runner
+
+        Args:
+            cells: Cells from build_cells()
+            source: Benchmark input ('image' + 'iterations', 'video' or 'synthetic' + 'duration')
+            output_dir: Directory for the state file and combined table
+            cooldown: Seconds to idle between cells (when no cooldown_temp is set)
+            cell_timeout: Seconds before a cell is killed (None: no limit)
+            retry_failed: Run failed cells again instead of keeping their failure
+            cooldown_temp: Wait until the CPU is at or below this temperature (°C) before every cell
+            cooldown_timeout: Maximum seconds to wait for the cool-down
+        """
+        self.cells = cells
+        self.source = source
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.state_path = self.output_dir / 'cells.jsonl'
+        self.table_path = self.output_dir / 'matrix_results.json'
+        self.cooldown = cooldown
+        self.cell_timeout = cell_timeout
+        self.retry_failed = retry_failed
+        self.cooldown_temp = cooldown_temp
+        self.cooldown_timeout = cooldown_timeout
+        self.monitor = create_monitor('sysfs')
+        self.completed: Dict[str, Dict] = self._load_state()
+
+    def _load_state(self) -> Dict[str, Dict]:
+        """Read finished cells (a truncated last line is ignored)"""
+        completed = {}
+        if not self.state_path.exists():
+            return completed
+        with open(self.state_path, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                completed[record['key']] = record
+        return completed
+
+    def _append_state(self, record: Dict):
+        with open(self.state_path, 'a') as f:
+            f.write(encode_record(record))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def pending(self) -> List[Dict]:
+        """Cells that still need to run"""
+        pending = []
+        for cell in self.cells:
+            record = self.completed.get(cell_key(cell))
+            if record is None or (self.retry_failed and record['status'] == 'failed'):
+                pending.append(cell)
+        return pending
+
+    def run_cell(self, cell: Dict) -> Dict:
+        """Run one cell in a fresh process"""
+        if cell['model_path'] is None:
+            return dict(cell, key=cell_key(cell), started=datetime.now().isoformat(),
+                        status='skipped', error='model export not found')
+
+        # Every cell starts from the same thermal state
+        cooldown = None
+        if self.cooldown_temp is not None:
+            cooldown = wait_for_cooldown(self.monitor, self.cooldown_temp, self.cooldown_timeout)
+            if cooldown['reached'] is False:
+                ConsoleLogger.warning(f"Cool-down timed out at {cooldown['end_c']:.1f}°C")
+
+        record = dict(cell, key=cell_key(cell), started=datetime.now().isoformat(),
+                      start_temperature=self.monitor.get_cpu_temp(), cooldown=cooldown)
+
+        ctx = multiprocessing.get_context('spawn')
+        results = ctx.Queue()
+        process = ctx.Process(target=_cell_worker, args=(cell, self.source, results),
+                              name=f"cell {cell_label(cell)}")
+        start = time.perf_counter()
+        process.start()
+        outcome = None
+        try:
+            # Poll so a crashed (e.g. segfaulted) cell cannot hang the driver
+            while outcome is None:
+                try:
+                    outcome = results.get(timeout=1.0)
+                except queue.Empty:
+                    if not process.is_alive():
+                        outcome = {'status': 'failed',
+                                   'error': f"process exited with code {process.exitcode}"}
+                    elif self.cell_timeout and time.perf_counter() - start > self.cell_timeout:
+                        outcome = {'status': 'failed',
+                                   'error': f"timed out after {self.cell_timeout:.0f}s"}
+        finally:
+            process.join(timeout=10.0)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+        record.update(outcome)
+        record['wall_s'] = time.perf_counter() - start
+        return record
+
+    def run(self) -> List[Dict]:
+        """Run every pending cell, cooling down in between
+
+        Returns:
+            Records of all cells (including ones finished in earlier sessions)
+        """
+        pending = self.pending()
+        done = len(self.cells) - len(pending)
+        if done:
+            ConsoleLogger.info(f"Resuming: {done}/{len(self.cells)} cells already finished")
+
+        for index, cell in enumerate(pending):
+            ConsoleLogger.progress(f"[{done + index + 1}/{len(self.cells)}] {cell_label(cell)}")
+            record = self.run_cell(cell)
+            self.completed[record['key']] = record
+            self._append_state(record)
+            self.write_table()
+
+            if record['status'] == 'ok':
+                summary = record['summary']
+                ConsoleLogger.success(f"{cell_label(cell)}: {summary.get('avg_fps', 0):.2f} FPS, "
+                                      f"p50 {summary.get('p50_inference_ms', 0):.1f}ms")
+            else:
+                ConsoleLogger.warning(f"{cell_label(cell)}: {record['status']} ({record.get('error')})")
+
+            # Let the SoC cool so thermal state does not leak into the next cell
+            if (self.cooldown_temp is None and self.cooldown > 0 and index < len(pending) - 1
+                    and record['status'] != 'skipped'):
+                ConsoleLogger.info(f"Cooling down for {self.cooldown:.0f}s...")
+                time.sleep(self.cooldown)
+
+        self.monitor.close()
+        return self.records()
+
+    def records(self) -> List[Dict]:
+        """Latest record of every cell in matrix order"""
+        return [self.completed[cell_key(cell)] for cell in self.cells if cell_key(cell) in self.completed]
+
+    def write_table(self):
+        """Write the combined results table (read by compare_results.py --matrix)"""
+        rows = []
+        for record in self.records():
+            summary = record.get('summary') or {}
+            rows.append({
+                'label': cell_label(record),
+                'model': record['model'],
+                'format': record['format'],
+                'input_size': record['input_size'],
+                'threads': record['threads'],
+                'status': record['status'],
+                'error': record.get('error'),
+                'results_path': record.get('results_path'),
+                'start_temperature': record.get('start_temperature'),
+                'avg_fps': summary.get('avg_fps'),
+                'p50_inference_ms': summary.get('p50_inference_ms'),
+                'p99_inference_ms': summary.get('p99_inference_ms'),
+                'cpu_ms_per_frame': summary.get('cpu_ms_per_frame'),
+                'peak_rss_mb': summary.get('peak_rss_mb'),
+                'max_temperature': summary.get('max_temperature'),
+                'burst_fps': summary.get('burst_fps'),
+                'sustained_fps': summary.get('sustained_fps')
+            })
+        table = {
+            'generated': datetime.now().isoformat(),
+            'source': self.source,
+            'cells': rows
+        }
+        tmp_path = self.table_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(table, f, indent=2)
+        os.replace(tmp_path, self.table_path)
+
+
+def print_table(records: List[Dict]):
+    """Print the combined matrix results"""
+    print("\n" + "=" * 80)
+    print("BENCHMARK MATRIX")
+    print("=" * 80)
+    print(f"{'Model':10s} {'Format':6s} {'Size':>5s} {'Thr':>4s} {'FPS':>7s} {'p50':>8s} "
+          f"{'p99':>8s} {'CPU/frm':>8s} {'RSS':>6s}  Status")
+    print("-" * 80)
+    for record in records:
+        summary = record.get('summary') or {}
+        if record['status'] == 'ok':
+            print(f"{record['model']:10s} {record['format']:6s} {record['input_size']:5d} "
+                  f"{record['threads']:4d} {summary.get('avg_fps', 0):7.2f} "
+                  f"{summary.get('p50_inference_ms', 0):6.1f}ms {summary.get('p99_inference_ms', 0):6.1f}ms "
+                  f"{summary.get('cpu_ms_per_frame', 0):6.1f}ms {summary.get('peak_rss_mb', 0):4.0f}MB  ok")
+        else:
+            print(f"{record['model']:10s} {record['format']:6s} {record['input_size']:5d} "
+                  f"{record['threads']:4d} {'':45s}  {record['status']}: {record.get('error')}")
+    print("=" * 80)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run a benchmark matrix (model x format x input size x threads), one process per cell'
+    )
+    parser.add_argument('--matrix', type=str, default=None,
+                        help='JSON file declaring models, formats, sizes and threads')
+    parser.add_argument('--models', type=str, nargs='+', default=None,
+                        help=f"Model names (default: {' '.join(DEFAULT_MATRIX['models'])})")
+    parser.add_argument('--formats', type=str, nargs='+', default=None, choices=FORMATS,
+                        help=f"Model formats (default: {' '.join(DEFAULT_MATRIX['formats'])})")
+    parser.add_argument('--sizes', type=int, nargs='+', default=None,
+                        help=f"Input sizes (default: {' '.join(map(str, DEFAULT_MATRIX['sizes']))})")
+    parser.add_argument('--threads', type=int, nargs='+', default=None,
+                        help=f"Thread counts (default: {' '.join(map(str, DEFAULT_MATRIX['threads']))})")
+    parser.add_argument('--model-dir', type=str, default='models',
+                        help='Directory with exported models (default: models)')
+    parser.add_argument('--image', type=str, default=None,
+                        help='Benchmark on a static image')
+    parser.add_argument('--iterations', type=int, default=100,
+                        help='Iterations per cell in image mode (default: 100)')
+    parser.add_argument('--video', type=str, default=None,
+                        help='Benchmark on a video file')
+    parser.add_argument('--synthetic', type=str, default='640x480@0', metavar='WxH@0',
+                        help='Unpaced synthetic source when no image/video is given (default: 640x480@0)')
+    parser.add_argument('--duration', type=int, default=60,
+                        help='Seconds per cell for video/synthetic sources (default: 60)')
+    parser.add_argument('--cooldown', type=float, default=60.0,
+                        help='Seconds to idle between cells (default: 60)')
+    parser.add_argument('--cooldown-temp', type=float, default=None, metavar='CELSIUS',
+                        help='Instead of a fixed idle, wait before every cell until the CPU is at '
+                             'or below this temperature')
+    parser.add_argument('--cooldown-timeout', type=float, default=DEFAULT_COOLDOWN_TIMEOUT,
+                        help=f'Maximum seconds to wait for --cooldown-temp '
+                             f'(default: {DEFAULT_COOLDOWN_TIMEOUT:.0f})')
+    parser.add_argument('--cell-timeout', type=float, default=None,
+                        help='Kill a cell after this many seconds (default: 3x duration + 120s)')
+    parser.add_argument('--output-dir', type=str, default='logs/matrix',
+                        help='Directory for the resume state and combined table (default: logs/matrix)')
+    parser.add_argument('--retry-failed', action='store_true',
+                        help='Run cells that failed in an earlier session again')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='List the cells and their model files without running them')
+
+    args = parser.parse_args()
+
+    matrix = dict(DEFAULT_MATRIX)
+    if args.matrix:
+        with open(args.matrix, 'r') as f:
+            matrix.update(json.load(f))
+    for key in ('models', 'formats', 'sizes', 'threads'):
+        if getattr(args, key):
+            matrix[key] = getattr(args, key)
+    unknown = set(matrix['formats']) - set(FORMATS)
+    if unknown:
+        ConsoleLogger.error(f"Unknown formats: {', '.join(sorted(unknown))}")
+        return
+
+    if args.image:
+        source = {'image': args.image, 'iterations': args.iterations}
+    elif args.video:
+        source = {'video': args.video, 'duration': args.duration}
+    else:
+        # A paced source would cap every cell at its frame rate
+        try:
+            fps = parse_synthetic_spec(args.synthetic)[2]
+        except ValueError as e:
+            ConsoleLogger.error(str(e))
+            return
+        if fps:
+            ConsoleLogger.error(f"--synthetic {args.synthetic} is paced at {fps:g} FPS, which caps every cell; "
+                                f"use an unpaced source such as 640x480@0")
+            return
+        source = {'synthetic': args.synthetic, 'duration': args.duration}
+
+    cells = build_cells(matrix, args.model_dir)
+    ConsoleLogger.info(f"Matrix: {len(matrix['models'])} models x {len(matrix['formats'])} formats x "
+                       f"{len(matrix['sizes'])} sizes x {len(matrix['threads'])} thread counts "
+                       f"= {len(cells)} cells")
+
+    if args.dry_run:
+        for cell in cells:
+            print(f"  {cell_label(cell):30s} {cell['model_path'] or '(model export not found)'}")
+        return
+
+    cell_timeout = args.cell_timeout
+    if cell_timeout is None and 'duration' in source:
+        cell_timeout = source['duration'] * 3 + 120
+
+    runner = MatrixRunner(cells, source, args.output_dir, cooldown=args.cooldown,
+                          cell_timeout=cell_timeout, retry_failed=args.retry_failed,
+                          cooldown_temp=args.cooldown_temp, cooldown_timeout=args.cooldown_timeout)
+    try:
+        records = runner.run()
+    except KeyboardInterrupt:
+        ConsoleLogger.warning("\nMatrix interrupted; run the same command again to resume")
+        records = runner.records()
+
+    print_table(records)
+    ConsoleLogger.info(f"Combined table: {runner.table_path}")
+    ConsoleLogger.info(f"Compare cells: python3 src/compare_results.py --matrix {runner.table_path}")
+
+
+if __name__ == '__main__':
+    main()
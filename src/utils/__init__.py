@@ -2,14 +2,69 @@
 Utils package for YOLO benchmarking
 """
 
-from .monitor import SystemMonitor
+from .monitor import SystemMonitor, SysfsMonitor, create_monitor
 from .logger import BenchmarkLogger, ConsoleLogger
+from .log_writer import LogWriter
 from .fps import FPSCalculator, InferenceTimer
+from .iobinding import IOBindingRunner
+from .model_cache import OptimizedModelCache
+from .postprocess import YOLODecoder
+from .capture import FrameRingBuffer, ThreadedCapture
+from .pipeline import StagedPipeline
+from .histogram import LatencyHistogram
+from .running_stats import RunningStats, P2Quantile
+from .trace import TraceRecorder
+from .op_profile import parse_ort_profile, compare_op_profiles
+from .bootstrap import bootstrap_histogram, bootstrap_mean, rank_runs
+from .thermal import PlateauDetector, wait_for_cooldown
+from .letterbox import LetterboxPreprocessor
+from .worker_pool import InferenceWorkerPool
+from .sources import FrameSource, CameraSource, VideoFileSource, ImageDirectorySource, SyntheticSource
+from .sources import parse_synthetic_spec, open_source
+from .shm_ring import SharedFrameRing, SharedMemoryCaptureSource
+from .autotune import SessionAutotuner, SessionProfileStore, apply_session_settings, format_session_settings
+from .benchmark import YOLOBenchmark
 
 __all__ = [
     'SystemMonitor',
+    'SysfsMonitor',
+    'create_monitor',
     'BenchmarkLogger',
     'ConsoleLogger',
+    'LogWriter',
     'FPSCalculator',
-    'InferenceTimer'
+    'InferenceTimer',
+    'IOBindingRunner',
+    'SessionAutotuner',
+    'SessionProfileStore',
+    'apply_session_settings',
+    'format_session_settings',
+    'OptimizedModelCache',
+    'YOLODecoder',
+    'FrameRingBuffer',
+    'ThreadedCapture',
+    'StagedPipeline',
+    'FrameSource',
+    'CameraSource',
+    'VideoFileSource',
+    'ImageDirectorySource',
+    'SyntheticSource',
+    'parse_synthetic_spec',
+    'open_source',
+    'SharedFrameRing',
+    'SharedMemoryCaptureSource',
+    'LatencyHistogram',
+    'RunningStats',
+    'P2Quantile',
+    'TraceRecorder',
+    'parse_ort_profile',
+    'compare_op_profiles',
+    'bootstrap_histogram',
+    'bootstrap_mean',
+    'rank_runs',
+    'PlateauDetector',
+    'wait_for_cooldown',
+    'LetterboxPreprocessor',
+    'InferenceWorkerPool',
+    'YOLOBenchmark'
 ]
@@ -0,0 +1,315 @@
+"""
+Session Autotuning Module for ONNX Runtime
+Sweeps thread and execution-mode settings and persists the best per-model profile
+"""
+
+import os
+import json
+import time
+import hashlib
+import functools
+import platform
+import itertools
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import onnxruntime as ort
+
+from .letterbox import LAYOUT_NHWC, input_layout, input_shape
+
+
+DEFAULT_PROFILE_PATH = 'profiles/session_profiles.json'
+
+# Settings used when no tuned profile exists
+DEFAULT_SESSION_SETTINGS = {
+    'intra_op_num_threads': 4,  # Use all 4 cores of Pi 4B
+    'inter_op_num_threads': 1,
+    'execution_mode': 'sequential',
+    'allow_spinning': True
+}
+
+
+def file_hash(path: str) -> str:
+    """Compute SHA-256 of a file
+
+    Results are memoized on (path, mtime, size) so repeated lookups during
+    startup do not re-read the model.
+
+    Args:
+        path: File path
+
+    Returns:
+        Hex digest
+    """
+    stat = os.stat(path)
+    return _file_hash(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _file_hash(path: str, mtime_ns: int, size: int, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_cpu_model() -> str:
+    """Get a human-readable CPU model string
+
+    Returns:
+        CPU model (e.g. 'Raspberry Pi 4 Model B Rev 1.4' or 'Intel(R) Xeon(R) ...')
+    """
+    # Raspberry Pi boards report the board name in the device tree
+    try:
+        with open('/proc/device-tree/model', 'r') as f:
+            model = f.read().strip('\x00\n ')
+            if model:
+                return model
+    except (FileNotFoundError, PermissionError):
+        pass
+
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key.strip() in ('model name', 'Model', 'Hardware'):
+                    return value.strip()
+    except FileNotFoundError:
+        pass
+
+    return platform.processor() or platform.machine() or 'unknown'
+
+
+def apply_session_settings(sess_options: ort.SessionOptions, settings: Dict):
+    """Apply thread/execution-mode settings to ONNX Runtime session options
+
+    Args:
+        sess_options: Session options to modify
+        settings: Settings dictionary (see DEFAULT_SESSION_SETTINGS)
+    """
+    sess_options.intra_op_num_threads = settings['intra_op_num_threads']
+    sess_options.inter_op_num_threads = settings['inter_op_num_threads']
+
+    if settings['execution_mode'] == 'parallel':
+        sess_options.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+    else:
+        sess_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+
+    spinning = '1' if settings['allow_spinning'] else '0'
+    sess_options.add_session_config_entry('session.intra_op.allow_spinning', spinning)
+    sess_options.add_session_config_entry('session.inter_op.allow_spinning', spinning)
+
+
+def format_session_settings(settings: Dict) -> str:
+    """Format settings as a short one-line description"""
+    return (f"intra={settings['intra_op_num_threads']} "
+            f"inter={settings['inter_op_num_threads']} "
+            f"mode={settings['execution_mode']} "
+            f"spin={'on' if settings['allow_spinning'] else 'off'}")
+
+
+class SessionProfileStore:
+    """JSON file of tuned session settings keyed by model hash and CPU model"""
+
+    def __init__(self, profile_path: str = DEFAULT_PROFILE_PATH):
+        """Initialize profile store
+
+        Args:
+            profile_path: Path to the JSON profile file
+        """
+        self.profile_path = Path(profile_path)
+
+    @staticmethod
+    def make_key(model_path: str, input_size: int) -> str:
+        """Build the profile key for a model on this machine
+
+        Args:
+            model_path: Path to ONNX model
+            input_size: Model input size
+
+        Returns:
+            Profile key
+        """
+        return f"{file_hash(model_path)}|{get_cpu_model()}|{input_size}"
+
+    def _read(self) -> Dict:
+        if not self.profile_path.exists():
+            return {}
+        try:
+            with open(self.profile_path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    def load(self, model_path: str, input_size: int) -> Optional[Dict]:
+        """Load tuned profile for a model
+
+        Args:
+            model_path: Path to ONNX model
+            input_size: Model input size
+
+        Returns:
+            Profile dictionary or None if the model was never tuned here
+        """
+        return self._read().get(self.make_key(model_path, input_size))
+
+    def save(self, model_path: str, input_size: int, profile: Dict):
+        """Save tuned profile for a model
+
+        Args:
+            model_path: Path to ONNX model
+            input_size: Model input size
+            profile: Profile dictionary (must contain 'settings')
+        """
+        profiles = self._read()
+        profiles[self.make_key(model_path, input_size)] = profile
+
+        self.profile_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.profile_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(profiles, f, indent=2)
+        os.replace(tmp_path, self.profile_path)
+
+
+class SessionAutotuner:
+    """Sweep ONNX Runtime session settings on the actual model"""
+
+    def __init__(self, model_path: str, input_size: int = 640,
+                 warmup_iterations: int = 3, iterations: int = 20):
+        """Initialize autotuner
+
+        Args:
+            model_path: Path to ONNX model
+            input_size: Model input size
+            warmup_iterations: Untimed runs per candidate
+            iterations: Timed runs per candidate
+        """
+        self.model_path = model_path
+        self.input_size = input_size
+        self.warmup_iterations = warmup_iterations
+        self.iterations = iterations
+
+    @staticmethod
+    def candidate_settings(cpu_count: Optional[int] = None) -> List[Dict]:
+        """Build the grid of settings to sweep
+
+        Args:
+            cpu_count: Number of logical CPUs (default: detected)
+
+        Returns:
+            List of settings dictionaries
+        """
+        cpu_count = cpu_count or os.cpu_count() or 1
+
+        intra_options = sorted({n for n in (1, 2, 4, 8, 16) if n <= cpu_count} | {cpu_count})
+        inter_options = sorted({n for n in (2, 4) if n <= cpu_count}) or [1]
+
+        candidates = []
+        for intra, spin in itertools.product(intra_options, (True, False)):
+            candidates.append({
+                'intra_op_num_threads': intra,
+                'inter_op_num_threads': 1,
+                'execution_mode': 'sequential',
+                'allow_spinning': spin
+            })
+            for inter in inter_options:
+                candidates.append({
+                    'intra_op_num_threads': intra,
+                    'inter_op_num_threads': inter,
+                    'execution_mode': 'parallel',
+                    'allow_spinning': spin
+                })
+        return candidates
+
+    def measure(self, settings: Dict, input_tensor: np.ndarray) -> Dict:
+        """Measure throughput and latency for one candidate
+
+        Args:
+            settings: Session settings
+            input_tensor: Model input
+
+        Returns:
+            Result dictionary with fps and latency percentiles
+        """
+        sess_options = ort.SessionOptions()
+        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        apply_session_settings(sess_options, settings)
+
+        session = ort.InferenceSession(
+            self.model_path,
+            sess_options=sess_options,
+            providers=['CPUExecutionProvider']
+        )
+        feed = {session.get_inputs()[0].name: input_tensor}
+
+        for _ in range(self.warmup_iterations):
+            session.run(None, feed)
+
+        latencies = np.empty(self.iterations, dtype=np.float64)
+        start = time.perf_counter()
+        for i in range(self.iterations):
+            t0 = time.perf_counter()
+            session.run(None, feed)
+            latencies[i] = time.perf_counter() - t0
+        total = time.perf_counter() - start
+
+        return {
+            'settings': settings,
+            'fps': self.iterations / total if total > 0 else 0.0,
+            'p50_ms': float(np.percentile(latencies, 50) * 1000),
+            'p95_ms': float(np.percentile(latencies, 95) * 1000)
+        }
+
+    def tune(self, metric: str = 'fps', candidates: Optional[List[Dict]] = None,
+             verbose: bool = True) -> Dict:
+        """Sweep candidates and pick the best one
+
+        Args:
+            metric: 'fps' (highest throughput) or 'p95' (lowest p95 latency)
+            candidates: Settings to try (default: candidate_settings())
+            verbose: Print one line per candidate
+
+        Returns:
+            Profile dictionary with the best settings and all results
+        """
+        if metric not in ('fps', 'p95'):
+            raise ValueError(f"Unknown autotune metric: {metric}")
+
+        candidates = candidates or self.candidate_settings()
+        # Float NCHW, or uint8 NHWC for models with folded preprocessing
+        probe = ort.InferenceSession(self.model_path, providers=['CPUExecutionProvider'])
+        layout = input_layout(probe.get_inputs()[0])
+        del probe
+        if layout == LAYOUT_NHWC:
+            input_tensor = np.random.randint(0, 256, input_shape(layout, self.input_size), dtype=np.uint8)
+        else:
+            input_tensor = np.random.rand(*input_shape(layout, self.input_size)).astype(np.float32)
+
+        results = []
+        for i, settings in enumerate(candidates):
+            result = self.measure(settings, input_tensor)
+            results.append(result)
+            if verbose:
+                print(f"  [{i+1:2d}/{len(candidates)}] {format_session_settings(settings):45s} "
+                      f"FPS: {result['fps']:6.2f} | p95: {result['p95_ms']:6.1f}ms")
+
+        if metric == 'fps':
+            best = max(results, key=lambda r: r['fps'])
+        else:
+            best = min(results, key=lambda r: r['p95_ms'])
+
+        return {
+            'settings': best['settings'],
+            'metric': metric,
+            'fps': best['fps'],
+            'p95_ms': best['p95_ms'],
+            'cpu_model': get_cpu_model(),
+            'onnxruntime_version': ort.__version__,
+            'model_path': str(self.model_path),
+            'input_size': self.input_size,
+            'tuned_at': datetime.now().isoformat(),
+            'results': results
+        }
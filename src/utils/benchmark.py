@@ -0,0 +1,1707 @@
+"""
+Benchmark Engine Module
+ONNX Runtime benchmark runner and command line shared by the YOLOv8n and YOLO11n scripts
+"""
+
+import os
+import time
+import argparse
+import json
+import platform
+import resource
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import cv2
+import numpy as np
+import onnxruntime as ort
+
+from .monitor import create_monitor
+from .logger import BenchmarkLogger, ConsoleLogger
+from .fps import FPSCalculator, InferenceTimer
+from .iobinding import IOBindingRunner
+from .autotune import SessionAutotuner, SessionProfileStore, apply_session_settings, format_session_settings
+from .autotune import DEFAULT_PROFILE_PATH, DEFAULT_SESSION_SETTINGS
+from .model_cache import OptimizedModelCache, DEFAULT_CACHE_DIR
+from .postprocess import YOLODecoder
+from .capture import ThreadedCapture
+from .pipeline import StagedPipeline
+from .sources import parse_synthetic_spec, open_source
+from .shm_ring import SharedMemoryCaptureSource
+from .histogram import LatencyHistogram, DEFAULT_PERCENTILES, percentile_key
+from .trace import TraceRecorder
+from .thermal import PlateauDetector, wait_for_cooldown
+from .thermal import DEFAULT_COOLDOWN_TIMEOUT, DEFAULT_PLATEAU_WINDOW, DEFAULT_PLATEAU_SLOPE
+from .letterbox import LetterboxPreprocessor, stretch_preprocess, stretch_to_source, measure_allocations
+from .letterbox import input_layout, input_shape, input_dtype, LAYOUT_NHWC
+from .worker_pool import InferenceWorkerPool
+from .op_profile import parse_ort_profile, format_op_profile
+
+
+class YOLOBenchmark:
+    """ONNX Runtime benchmark runner, subclassed per model family by the run_*.py scripts"""
+    
+    # Set by each model family's subclass: display name, log directory / file prefix, default --model
+    model_name = 'YOLO'
+    log_name = 'yolo'
+    default_model = None
+    
+    def __init__(self, model_path: str, input_size: int = 640, conf_threshold: float = 0.25,
+                 use_iobinding: bool = False, profile_path: str = DEFAULT_PROFILE_PATH,
+                 cache_dir: str = DEFAULT_CACHE_DIR, iou_threshold: float = 0.45,
+                 top_k: int = None, sampler: str = 'sysfs', sample_interval: float = 1.0,
+                 log_flush_interval: float = 1.0, log_flush_lines: int = 256,
+                 live_summary_interval: float = 60.0, trace_path: str = None,
+                 trace_capacity: int = 65536, profile_ops: bool = False,
+                 session_settings: dict = None, cooldown_temp: float = None,
+                 cooldown_timeout: float = DEFAULT_COOLDOWN_TIMEOUT,
+                 plateau_window: float = DEFAULT_PLATEAU_WINDOW,
+                 plateau_slope: float = DEFAULT_PLATEAU_SLOPE, preprocess: str = 'letterbox',
+                 batch_size: int = 1, workers: int = 0, pool_threads: int = None,
+                 shm_slots: int = 0):
+        """Initialize benchmark
+        
+        Args:
+            model_path: Path to ONNX model
+            input_size: Input image size (default 640)
+            conf_threshold: Confidence threshold for detections
+            use_iobinding: Bind preallocated input/output buffers once and reuse them
+            profile_path: Tuned session profile file (None to always use defaults)
+            cache_dir: Optimized model cache directory (None to disable the cache)
+            iou_threshold: IoU threshold for class-aware NMS
+            top_k: Keep only the top-k candidates before NMS (None to disable)
+            sampler: System sampler, 'sysfs' (no subprocesses) or 'legacy' (psutil + vcgencmd)
+            sample_interval: Seconds between system samples
+            log_flush_interval: Seconds between background text log flushes
+            log_flush_lines: Flush the text log once this many lines are pending
+            live_summary_interval: Seconds between mid-run summaries (0 to disable)
+            trace_path: Write a Chrome/Perfetto trace of per-frame spans here (None to disable)
+            trace_capacity: Trace ring buffer size in events
+            profile_ops: Enable ONNX Runtime per-operator profiling (adds overhead per node)
+            session_settings: Fixed thread/execution settings (skips the tuned profile)
+            cooldown_temp: Wait until the CPU is at or below this temperature (°C) before the run
+            cooldown_timeout: Maximum seconds to wait for the cool-down
+            plateau_window: Seconds of temperature samples used to detect thermal steady state
+            plateau_slope: Temperature slope (°C/min) below which the run counts as steady
+            preprocess: 'letterbox' (aspect-preserving, preallocated tensor) or 'stretch' (legacy resize)
+            batch_size: Frames per inference call for video/image-directory sources
+                        (needs a dynamic-batch model, or one exported with this batch size)
+            workers: Run preprocess/inference/decode in this many worker processes (0: in-process)
+            pool_threads: Intra-op threads shared by the workers (default: CPU count)
+            shm_slots: Capture in a separate process that hands frames over through a
+                       shared-memory ring with this many slots (0: capture in-process)
+        """
+        self.model_path = model_path
+        self.input_size = input_size
+        self.conf_threshold = conf_threshold
+        self.use_iobinding = use_iobinding
+        self.profile_path = None if session_settings else profile_path
+        self.session_settings = dict(session_settings or DEFAULT_SESSION_SETTINGS)
+        self.model_cache = OptimizedModelCache(cache_dir) if cache_dir else None
+        self.startup_info = {}
+        
+        # Operator-level profiling (warm-up runs are excluded from the report)
+        self.profile_ops = profile_ops
+        self.warmup_runs = 0
+        
+        self.preprocess_mode = preprocess
+        self.preprocess_alloc_bytes = None
+        self.batch_size = batch_size
+        self.batch_stats = {}
+        self.workers = workers
+        self.pool_threads = pool_threads
+        self.pool_stats = {}
+        self.shm_slots = shm_slots
+        self.shm_stats = {}
+        
+        # Decode + NMS stage (part of the timed loop, like in production)
+        self.decoder = YOLODecoder(conf_threshold, iou_threshold, top_k)
+        
+        # Span tracer (every call is a no-op when disabled)
+        self.trace_path = trace_path
+        self.tracer = TraceRecorder(trace_capacity, enabled=trace_path is not None)
+        
+        ConsoleLogger.info(f"Initializing {self.model_name} Benchmark")
+        ConsoleLogger.info(f"Model: {model_path}")
+        ConsoleLogger.info(f"Input Size: {input_size}x{input_size}")
+        
+        # Initialize ONNX Runtime
+        self.session = self._load_model()
+        
+        # Get model input/output details
+        self.input_name = self.session.get_inputs()[0].name
+        self.output_names = [output.name for output in self.session.get_outputs()]
+        
+        # uint8 NHWC models (fold_preprocess.py) take letterboxed frames as they are
+        self.input_layout = input_layout(self.session.get_inputs()[0])
+        self.input_shape = input_shape(self.input_layout, self.input_size, batch_size)
+        if self.input_layout == LAYOUT_NHWC:
+            ConsoleLogger.info("uint8 NHWC input: normalization and layout conversion run in the model")
+        
+        # Batches need a dynamic batch axis (export_dynamic_batch.py) or a matching fixed one
+        model_batch = self.session.get_inputs()[0].shape[0]
+        if isinstance(model_batch, int) and model_batch != batch_size:
+            raise ValueError(f"{model_path} has a fixed batch size of {model_batch}; "
+                             f"export a dynamic-batch model for batch size {batch_size}")
+        if batch_size > 1:
+            ConsoleLogger.info(f"Batch size: {batch_size}")
+        
+        # Letterbox into reused tensors; 'stretch' keeps the allocating legacy path
+        self.preprocessor = None
+        if preprocess == 'letterbox':
+            self.preprocessor = LetterboxPreprocessor(input_size, layout=self.input_layout,
+                                                      batch_size=batch_size)
+        
+        # Optional zero-allocation inference path
+        self.io_runner = None
+        if self.use_iobinding:
+            self.io_runner = IOBindingRunner(self.session, self.input_shape)
+            ConsoleLogger.info(f"IOBinding enabled "
+                               f"({self.io_runner.get_buffer_bytes() / (1024 * 1024):.1f} MB bound)")
+            if self.preprocessor is not None:
+                # Letterbox straight into the bound input: no copy before session.run
+                self.preprocessor.set_buffers([self.io_runner.input_buffer])
+        
+        # Buffers allocated by inference calls (outputs, rebinds)
+        self.inference_allocations = 0
+        
+        # Initialize monitoring
+        self.monitor = create_monitor(sampler)
+        self.sample_interval = sample_interval
+        self.logger = None
+        self.log_flush_interval = log_flush_interval
+        self.log_flush_lines = log_flush_lines
+        self.live_summary_interval = live_summary_interval
+        
+        # Performance tracking
+        self.fps_calc = FPSCalculator(window_size=30)
+        self.inference_timer = InferenceTimer()
+        self.postprocess_timer = InferenceTimer()
+        
+        # Per-frame stage latencies (every frame, fixed memory); batched runs
+        # record the amortized share of the batch and the whole batch separately
+        stages = ('capture', 'preprocess', 'inference', 'postprocess', 'end_to_end')
+        if batch_size > 1:
+            stages += ('batch',)
+        self.latency_histograms = {stage: LatencyHistogram() for stage in stages}
+        self.capture_stats = {}
+        self.pipeline_stats = {}
+        self.cpu_start = None
+        self.cpu_time = None
+        
+        # Thermal control: inference latency before (burst) and after (sustained) the plateau
+        self.cooldown_temp = cooldown_temp
+        self.cooldown_timeout = cooldown_timeout
+        self.cooldown_info = None
+        self.plateau = PlateauDetector(plateau_window, plateau_slope)
+        self.phase_histograms = {'burst': LatencyHistogram(), 'sustained': LatencyHistogram()}
+        self.thermal_phase = 'burst'
+        self.plateau_frames = None
+        self.plateau_elapsed = None
+        self.start_temperature = None
+        
+        # Threading control (the monitor waits on the event, so stopping it is immediate)
+        self.monitor_stop = threading.Event()
+        self.monitor_thread = None
+        
+    def _load_model(self):
+        """Load ONNX model with optimizations"""
+        ConsoleLogger.progress("Loading ONNX model...")
+        
+        # Session options for optimization
+        sess_options = ort.SessionOptions()
+        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        
+        # Use the autotuned thread settings for this model/CPU if available
+        if self.profile_path:
+            profile = SessionProfileStore(self.profile_path).load(self.model_path, self.input_size)
+            if profile:
+                self.session_settings = profile['settings']
+                ConsoleLogger.info(f"Using tuned session profile: "
+                                   f"{format_session_settings(self.session_settings)}")
+        
+        apply_session_settings(sess_options, self.session_settings)
+        
+        if self.profile_ops:
+            sess_options.enable_profiling = True
+            sess_options.profile_file_prefix = f"ort_profile_{Path(self.model_path).stem}"
+        
+        # Create inference session (from the optimized model cache if enabled)
+        if self.model_cache:
+            session, self.startup_info = self.model_cache.create_session(
+                self.model_path, sess_options, ['CPUExecutionProvider']
+            )
+        else:
+            load_start = time.perf_counter()
+            session = ort.InferenceSession(
+                self.model_path,
+                sess_options=sess_options,
+                providers=['CPUExecutionProvider']
+            )
+            self.startup_info = {
+                'model_cache': 'disabled',
+                'model_load_ms': (time.perf_counter() - load_start) * 1000
+            }
+        
+        ConsoleLogger.success(f"Model loaded successfully in {self.startup_info['model_load_ms']:.0f}ms "
+                              f"(cache: {self.startup_info['model_cache']})")
+        return session
+    
+    def _preprocess(self, image: np.ndarray) -> np.ndarray:
+        """Preprocess image for YOLO
+        
+        Args:
+            image: Input image (BGR format)
+            
+        Returns:
+            Preprocessed image tensor
+        """
+        start = time.perf_counter()
+        
+        if self.preprocessor is not None:
+            # Letterbox (keep aspect ratio) into a preallocated 1x3xSxS tensor
+            img = self.preprocessor(image)
+        else:
+            # Stretch to a square (distorts aspect ratio, allocates per step)
+            img = stretch_preprocess(image, self.input_size, self.input_layout)
+        
+        self.tracer.complete('preprocess', start)
+        return img
+    
+    def _preprocess_batch(self, frames) -> np.ndarray:
+        """Preprocess up to batch_size frames into one input tensor
+        
+        Args:
+            frames: List of BGR frames
+            
+        Returns:
+            Full (batch_size, ...) tensor; slots past len(frames) hold stale data
+        """
+        start = time.perf_counter()
+        
+        if self.preprocessor is not None:
+            tensor = self.preprocessor.batch(frames)
+        else:
+            tensor = np.zeros(self.input_shape, dtype=input_dtype(self.input_layout))
+            for slot, frame in enumerate(frames):
+                tensor[slot] = stretch_preprocess(frame, self.input_size, self.input_layout)[0]
+        
+        self.tracer.complete('preprocess', start)
+        return tensor
+    
+    def _measure_preprocess(self, width: int, height: int):
+        """Measure bytes allocated by one steady-state preprocess call at this resolution"""
+        frame = np.zeros((height, width, 3), dtype=np.uint8)
+        self.preprocess_alloc_bytes = measure_allocations(self._preprocess, frame)
+        ConsoleLogger.info(f"Preprocess ({self.preprocess_mode}): "
+                           f"{self.preprocess_alloc_bytes / 1024:.0f} KB allocated per frame")
+    
+    def _inference(self, input_tensor: np.ndarray):
+        """Run inference
+        
+        Args:
+            input_tensor: Preprocessed input tensor
+            
+        Returns:
+            Model output
+        """
+        start = time.perf_counter()
+        if self.io_runner is not None:
+            reallocations = self.io_runner.reallocation_count
+            outputs = self.io_runner.run(input_tensor)
+            self.inference_allocations += self.io_runner.reallocation_count - reallocations
+        else:
+            outputs = self.session.run(
+                self.output_names,
+                {self.input_name: input_tensor}
+            )
+            self.inference_allocations += len(outputs)
+        self.tracer.complete('session.run', start)
+        return outputs
+    
+    def _postprocess(self, outputs, shape, index: int = 0) -> np.ndarray:
+        """Decode boxes, filter by confidence, run class-aware NMS and map boxes to the source frame
+        
+        Args:
+            outputs: Model outputs
+            shape: Shape of the source frame (height, width[, channels])
+            index: Frame of the batch to decode
+            
+        Returns:
+            Detections array (N, 6): x1, y1, x2, y2 (source frame pixels), score, class_id
+        """
+        start = time.perf_counter()
+        detections = self.decoder.decode(outputs[0][index])
+        if self.preprocessor is not None:
+            self.preprocessor.to_source(detections, shape[0], shape[1])
+        else:
+            stretch_to_source(detections, shape[0], shape[1], self.input_size)
+        self.tracer.complete('postprocess', start)
+        return detections
+    
+    def _warmup(self, num_iterations: int = 10):
+        """Warm up the model
+        
+        Args:
+            num_iterations: Number of warm-up iterations
+        """
+        ConsoleLogger.progress("Warming up model...")
+        
+        if self.input_layout == LAYOUT_NHWC:
+            dummy_input = np.random.randint(0, 256, self.input_shape, dtype=np.uint8)
+        else:
+            dummy_input = np.random.rand(*self.input_shape).astype(np.float32)
+        
+        for _ in range(num_iterations):
+            self._inference(dummy_input)
+        self.warmup_runs += num_iterations
+        if self.preprocessor is not None:
+            # Warm-up input was copied over the (shared) bound buffer's padding
+            self.preprocessor.invalidate()
+        
+        # Only count allocations made by the measured frames
+        self.inference_allocations = 0
+        
+        ConsoleLogger.success("Warm-up complete")
+    
+    def _record_inference(self, inference_time: float):
+        """Record one inference latency in the run and thermal phase histograms"""
+        self.latency_histograms['inference'].record(inference_time)
+        self.phase_histograms[self.thermal_phase].record(inference_time)
+    
+    def _cool_down(self):
+        """Wait for the SoC to cool to the target so runs start from the same state"""
+        if self.cooldown_temp is None:
+            return
+        ConsoleLogger.progress(f"Waiting for CPU temperature <= {self.cooldown_temp:.1f}°C "
+                               f"(max {self.cooldown_timeout:.0f}s)...")
+        self.cooldown_info = wait_for_cooldown(self.monitor, self.cooldown_temp, self.cooldown_timeout)
+        if self.cooldown_info['reached'] is None:
+            ConsoleLogger.warning("No temperature sensor, skipping cool-down")
+        elif self.cooldown_info['reached']:
+            ConsoleLogger.success(f"Cooled to {self.cooldown_info['end_c']:.1f}°C "
+                                  f"in {self.cooldown_info['waited_s']:.0f}s")
+        else:
+            ConsoleLogger.warning(f"Cool-down timed out at {self.cooldown_info['end_c']:.1f}°C")
+    
+    def _update_plateau(self, timestamp: float, temperature: float):
+        """Feed the plateau detector; switch to the sustained phase once steady"""
+        if self.cpu_start is None or self.cpu_time is not None:
+            return  # Not measuring (yet, or any more)
+        if self.start_temperature is None:
+            self.start_temperature = temperature
+        if self.plateau.update(timestamp, temperature):
+            self.plateau_frames = self.fps_calc.get_frame_count()
+            self.plateau_elapsed = self.fps_calc.get_elapsed_time()
+            self.thermal_phase = 'sustained'
+            self.tracer.complete('thermal plateau', timestamp, timestamp)
+            self.logger.log_thermal_plateau(self.plateau_elapsed, self.plateau_frames,
+                                            self.plateau.plateau_temperature, self.plateau.slope)
+    
+    def _thermal_summary(self, total_frames: int, elapsed: float) -> dict:
+        """Burst (before the plateau) and sustained (after it) performance"""
+        def phase(hist, frames, duration):
+            if not hist.count or duration <= 0:
+                return None
+            percentiles = hist.percentiles((50.0, 99.0))
+            return {
+                'frames': frames,
+                'duration_s': duration,
+                'fps': frames / duration,
+                'mean_inference_ms': hist.mean() * 1000,
+                'p50_inference_ms': percentiles[50.0] * 1000,
+                'p99_inference_ms': percentiles[99.0] * 1000
+            }
+        
+        thermal = self.plateau.to_dict()
+        thermal['cooldown'] = self.cooldown_info
+        thermal['start_temperature'] = self.start_temperature
+        if self.plateau.reached:
+            thermal['plateau_elapsed_s'] = self.plateau_elapsed
+            thermal['burst'] = phase(self.phase_histograms['burst'], self.plateau_frames, self.plateau_elapsed)
+            thermal['sustained'] = phase(self.phase_histograms['sustained'], total_frames - self.plateau_frames,
+                                         elapsed - self.plateau_elapsed)
+        else:
+            # The whole run was still heating up (or there is no sensor)
+            thermal['burst'] = phase(self.phase_histograms['burst'], total_frames, elapsed)
+            thermal['sustained'] = None
+        return thermal
+    
+    def _start_monitoring(self):
+        """Start system monitoring thread"""
+        self.monitor_stop.clear()
+        
+        def monitor_loop():
+            last_live = time.perf_counter()
+            while not self.monitor_stop.is_set():
+                sample_start = time.perf_counter()
+                snapshot = self.monitor.sample()
+                self.tracer.complete('monitor.sample', sample_start)
+                self.logger.log_system_snapshot(snapshot)
+                
+                # Counter tracks next to the frame spans
+                self.tracer.counter('temperature_c', snapshot.get('temperature'), sample_start)
+                if snapshot.get('temperature') is not None:
+                    self._update_plateau(sample_start, snapshot['temperature'])
+                if snapshot.get('frequency'):
+                    self.tracer.counter('cpu_freq_mhz', snapshot['frequency']['current_mhz'], sample_start)
+                self.tracer.counter('cpu_percent', snapshot['cpu']['overall'], sample_start)
+                
+                # Running statistics make a mid-run summary O(1)
+                if self.live_summary_interval and sample_start - last_live >= self.live_summary_interval:
+                    self.logger.log_live_summary(self._live_summary())
+                    last_live = sample_start
+                
+                self.monitor_stop.wait(max(0.0, self.sample_interval - (time.perf_counter() - sample_start)))
+        
+        self.monitor_thread = threading.Thread(target=monitor_loop, name='monitor', daemon=True)
+        self.monitor_thread.start()
+    
+    def _live_summary(self) -> dict:
+        """Build a mid-run summary from running statistics and histograms"""
+        running = self.logger.running
+        inference = self.latency_histograms['inference'].percentiles((50.0, 99.0))
+        return {
+            'elapsed_s': self.fps_calc.get_elapsed_time(),
+            'frames': self.fps_calc.get_frame_count(),
+            'avg_fps': self.fps_calc.get_average_fps(),
+            'p50_inference_ms': inference[50.0] * 1000,
+            'p99_inference_ms': inference[99.0] * 1000,
+            'avg_cpu': running['cpu_percent'].mean,
+            'avg_memory': running['memory_percent'].mean,
+            'max_temperature': running['temperature'].max if running['temperature'].count else None,
+            'throttle_events': self.logger.throttle_samples
+        }
+    
+    def _stop_timing(self) -> float:
+        """Stop the throughput clock and CPU timer as the timed loop exits
+        
+        Teardown (capture threads, workers, monitor, source release, profile
+        collection) runs afterwards and is not part of the measured run.
+        
+        Returns:
+            Seconds spent in the timed loop
+        """
+        elapsed = self.fps_calc.stop()
+        if self.cpu_start is not None:
+            self.cpu_time = time.process_time() - self.cpu_start
+        return elapsed
+    
+    def _stop_monitoring(self):
+        """Stop system monitoring thread"""
+        self.monitor_stop.set()
+        if self.monitor_thread:
+            self.monitor_thread.join(timeout=2.0)
+    
+    def run_camera_benchmark(self, duration: int = 60, camera_index: int = 0,
+                             capture_policy: str = 'latest', buffer_size: int = 2,
+                             pipelined: bool = False):
+        """Run benchmark using camera input
+        
+        Args:
+            duration: Benchmark duration in seconds
+            camera_index: Camera device index
+            capture_policy: 'latest' or 'fifo' (capture thread + ring buffer),
+                            or 'sync' (read on the inference thread)
+            buffer_size: Ring buffer capacity for the capture thread
+                         (inter-stage queue capacity when pipelined)
+            pipelined: Run capture/preprocess/infer/postprocess as pipelined stages
+        """
+        # Open camera
+        ConsoleLogger.progress(f"Opening camera {camera_index}...")
+        source = self._open_source('camera', capture_policy, camera_index=camera_index,
+                                   width=640, height=480, fps=30)
+        
+        if not source.isOpened():
+            ConsoleLogger.error("Failed to open camera with any backend")
+            ConsoleLogger.info("For Raspberry Pi with libcamera, ensure:")
+            ConsoleLogger.info("  1. Camera is enabled: sudo raspi-config")
+            ConsoleLogger.info("  2. v4l2 driver loaded: sudo modprobe bcm2835-v4l2")
+            ConsoleLogger.info("  3. Or use --image, --video or --synthetic mode for testing")
+            return
+        
+        ConsoleLogger.success(f"Camera opened using {source.backend_name} backend")
+        self.run_stream_benchmark(source, duration, capture_policy, buffer_size, pipelined)
+    
+    def run_video_benchmark(self, video_path: str, duration: int = 60,
+                            buffer_size: int = 2, pipelined: bool = False):
+        """Run benchmark on a video file (decoded ahead, no dropped frames)
+        
+        Args:
+            video_path: Path to video file
+            duration: Maximum benchmark duration in seconds (stops at end of file)
+            buffer_size: Inter-stage queue capacity when pipelined
+            pipelined: Run capture/preprocess/infer/postprocess as pipelined stages
+        """
+        ConsoleLogger.progress(f"Opening video: {video_path}")
+        source = self._open_source('video', path=video_path)
+        
+        if not source.isOpened():
+            ConsoleLogger.error("Failed to open video file")
+            return
+        
+        ConsoleLogger.success("Video opened")
+        self.run_stream_benchmark(source, duration, 'sync', buffer_size, pipelined)
+    
+    def run_image_dir_benchmark(self, image_dir: str, duration: int = 60,
+                                buffer_size: int = 2, pipelined: bool = False):
+        """Run benchmark over the images of a directory (decoded ahead, no dropped frames)
+        
+        Args:
+            image_dir: Directory of images
+            duration: Maximum benchmark duration in seconds (stops after the last image)
+            buffer_size: Inter-stage queue capacity when pipelined
+            pipelined: Run capture/preprocess/infer/postprocess as pipelined stages
+        """
+        ConsoleLogger.progress(f"Opening image directory: {image_dir}")
+        source = self._open_source('image_dir', path=image_dir)
+        
+        if not source.isOpened():
+            ConsoleLogger.error("No readable images found")
+            return
+        
+        ConsoleLogger.success(f"Found {len(source.files)} images")
+        self.run_stream_benchmark(source, duration, 'sync', buffer_size, pipelined)
+    
+    def run_synthetic_benchmark(self, spec: str, duration: int = 60,
+                                capture_policy: str = 'latest', buffer_size: int = 2,
+                                pipelined: bool = False):
+        """Run benchmark on generated frames paced like a camera
+        
+        Args:
+            spec: Source spec 'WxH@fps' (e.g. '640x480@30')
+            duration: Benchmark duration in seconds
+            capture_policy: 'latest', 'fifo' or 'sync' (see run_camera_benchmark)
+            buffer_size: Ring buffer / inter-stage queue capacity
+            pipelined: Run capture/preprocess/infer/postprocess as pipelined stages
+        """
+        width, height, fps = parse_synthetic_spec(spec)
+        source = self._open_source('synthetic', capture_policy, width=width, height=height, fps=fps)
+        self.run_stream_benchmark(source, duration, capture_policy, buffer_size, pipelined)
+    
+    def _open_source(self, kind: str, capture_policy: str = 'sync', **kwargs):
+        """Open a frame source in this process, or in a capture process behind a shared-memory ring
+        
+        Args:
+            kind: Source kind ('camera', 'video', 'image_dir', 'synthetic')
+            capture_policy: Drop policy of the ring for live sources (shared-memory capture only)
+            **kwargs: Source constructor arguments
+        
+        Returns:
+            FrameSource (check isOpened())
+        """
+        if not self.shm_slots:
+            return open_source(kind, **kwargs)
+        if kind == 'video':
+            kwargs['prefetch'] = 0  # Decode straight into the ring slots, which are the read-ahead
+        ConsoleLogger.progress(f"Starting capture process ({self.shm_slots} shared-memory slots)...")
+        source = SharedMemoryCaptureSource(kind, self.shm_slots, capture_policy, **kwargs)
+        if source.error:
+            ConsoleLogger.warning(f"Capture process: {source.error.strip().splitlines()[-1]}")
+        return source
+    
+    def run_stream_benchmark(self, source, duration: int = 60, capture_policy: str = 'latest',
+                             buffer_size: int = 2, pipelined: bool = False):
+        """Run benchmark on any frame source (camera, video file, synthetic)
+        
+        Every source produces the same metrics and log format.
+        
+        Args:
+            source: Opened FrameSource
+            duration: Benchmark duration in seconds
+            capture_policy: 'latest', 'fifo' or 'sync' (ignored for non-live sources,
+                            which decode ahead themselves)
+            buffer_size: Ring buffer / inter-stage queue capacity
+            pipelined: Run capture/preprocess/infer/postprocess as pipelined stages
+        """
+        shm_capture = isinstance(source, SharedMemoryCaptureSource)
+        if shm_capture and (pipelined or self.batch_size > 1 or self.workers):
+            ConsoleLogger.error("Shared-memory capture hands out one frame at a time and "
+                                "cannot be combined with pipelined, batched or worker-pool inference")
+            source.release()
+            return
+        if not source.live or shm_capture:
+            # Shared-memory capture: the capture process applies the drop policy
+            capture_policy = 'sync'
+        if self.batch_size > 1 and (source.live or pipelined):
+            ConsoleLogger.error("Batched inference needs a video or image-directory source without --pipeline")
+            source.release()
+            return
+        if self.workers and (pipelined or self.batch_size > 1):
+            ConsoleLogger.error("The worker pool cannot be combined with pipelined or batched inference")
+            source.release()
+            return
+        
+        # Initialize logger
+        self.logger = BenchmarkLogger(self.log_name, flush_interval=self.log_flush_interval,
+                                      flush_lines=self.log_flush_lines,
+                                      tracer=self.tracer if self.tracer.enabled else None)
+        
+        config = {
+            'model_path': self.model_path,
+            'input_size': f'{self.input_size}x{self.input_size}',
+            'backend': 'ONNX Runtime',
+            'input_source': source.describe(),
+            'duration_seconds': duration,
+            'capture_policy': source.policy if shm_capture else capture_policy,
+            'capture_buffer': buffer_size,
+            'shm_slots': self.shm_slots if shm_capture else 0,
+            'pipelined': pipelined,
+            'conf_threshold': self.conf_threshold,
+            'iou_threshold': self.decoder.iou_threshold,
+            'top_k': self.decoder.top_k,
+            'io_binding': self.use_iobinding,
+            'session_settings': format_session_settings(self.session_settings),
+            'sampler': self.monitor.name,
+            'sample_interval': self.sample_interval,
+            'profile_ops': self.profile_ops,
+            'cooldown_temp': self.cooldown_temp,
+            'preprocess': self.preprocess_mode,
+            'input_layout': self.input_layout,
+            'batch_size': self.batch_size,
+            'workers': self.workers
+        }
+        
+        self.logger.write_header(config)
+        ConsoleLogger.info(f"Log file: {self.logger.get_log_path()}")
+        
+        # Start from the same thermal state as other runs
+        self._cool_down()
+        
+        # Warm up model
+        self._warmup()
+        
+        width, height = source.get_resolution()
+        ConsoleLogger.info(f"Source resolution: {width}x{height}")
+        if width and height:
+            self._measure_preprocess(width, height)
+        # Start monitoring
+        self._start_monitoring()
+        
+        ConsoleLogger.info(f"Starting benchmark for {duration} seconds...")
+        
+        try:
+            if pipelined:
+                self._run_pipelined_loop(source, duration, buffer_size, live=source.live)
+            elif self.batch_size > 1:
+                self._run_batched_loop(source, duration)
+            elif self.workers:
+                self._run_worker_pool_loop(source, duration)
+            else:
+                self._run_sequential_loop(source, duration, capture_policy, buffer_size)
+        
+        except KeyboardInterrupt:
+            ConsoleLogger.warning("\nBenchmark interrupted by user")
+        
+        finally:
+            print()  # New line after progress
+            
+            # Stop monitoring and release its /proc and sysfs descriptors
+            self._stop_monitoring()
+            self.monitor.close()
+            
+            # Release source
+            source.release()
+            if shm_capture:
+                self.shm_stats = source.get_stats()
+            
+            # Calculate summary
+            self._write_summary()
+            
+            ConsoleLogger.success("Benchmark complete!")
+            ConsoleLogger.info(f"Results saved to: {self.logger.get_log_path()}")
+    
+    def _run_sequential_loop(self, cap, duration: int, capture_policy: str, buffer_size: int):
+        """Capture, preprocess, infer and postprocess one frame at a time
+        
+        Args:
+            cap: Frame source with a cv2.VideoCapture-style read()
+            duration: Benchmark duration in seconds
+            capture_policy: 'latest'/'fifo' (capture thread) or 'sync'
+            buffer_size: Ring buffer capacity for the capture thread
+        """
+        # Start capture producer
+        capture = None
+        if capture_policy != 'sync':
+            capture = ThreadedCapture(cap, buffer_size, capture_policy,
+                                      histogram=self.latency_histograms['capture'],
+                                      tracer=self.tracer)
+            capture.start()
+            ConsoleLogger.info(f"Capture thread started (policy: {capture_policy}, buffer: {buffer_size})")
+        
+        # Start FPS calculation
+        self.fps_calc.start()
+        self.cpu_start = time.process_time()
+        
+        start_time = time.time()
+        frame_count = 0
+        frame_age_total = 0.0
+        frame_age_max = 0.0
+        
+        try:
+            while time.time() - start_time < duration:
+                # Capture frame
+                if capture:
+                    item = capture.read(timeout=1.0)
+                    if item is None:
+                        if not capture.is_alive():
+                            ConsoleLogger.warning("Capture thread stopped delivering frames")
+                            break
+                        continue
+                    _, captured_at, frame = item
+                else:
+                    read_start = time.perf_counter()
+                    ret, frame = cap.read()
+                    captured_at = time.perf_counter()
+                    if ret:
+                        self.latency_histograms['capture'].record(captured_at - read_start)
+                        self.tracer.complete('capture', read_start, captured_at)
+                        # A capture process stamps frames when they were captured
+                        captured_at = getattr(cap, 'frame_timestamp', None) or captured_at
+                    if not ret:
+                        if getattr(cap, 'finished', False):
+                            ConsoleLogger.info("\nEnd of stream")
+                            break
+                        ConsoleLogger.warning("Failed to capture frame")
+                        continue
+                
+                # Preprocess
+                preprocess_start = time.perf_counter()
+                input_tensor = self._preprocess(frame)
+                preprocess_end = time.perf_counter()
+                self.latency_histograms['preprocess'].record(preprocess_end - preprocess_start)
+                
+                # Frame age when it reaches the model
+                frame_age = preprocess_end - captured_at
+                frame_age_total += frame_age
+                frame_age_max = max(frame_age_max, frame_age)
+                
+                # Inference
+                self.inference_timer.start()
+                outputs = self._inference(input_tensor)
+                inference_time = self.inference_timer.stop()
+                self._record_inference(inference_time)
+                
+                # Postprocess
+                self.postprocess_timer.start()
+                detections = self._postprocess(outputs, frame.shape)
+                postprocess_time = self.postprocess_timer.stop()
+                self.latency_histograms['postprocess'].record(postprocess_time)
+                self.latency_histograms['end_to_end'].record(time.perf_counter() - captured_at)
+                
+                # Update FPS
+                fps = self.fps_calc.update()
+                
+                # Log inference
+                frame_count += 1
+                self.logger.log_detections(frame_count, len(detections))
+                if frame_count % 30 == 0:  # Log every 30 frames
+                    self.logger.log_inference(frame_count, inference_time, fps,
+                                              postprocess_time, len(detections),
+                                              frame_age=frame_age,
+                                              dropped_frames=capture.buffer.dropped if capture else None)
+                    
+                    # Console update
+                    elapsed = time.time() - start_time
+                    remaining = duration - elapsed
+                    print(f"\rFrame {frame_count} | FPS: {fps:.2f} | "
+                          f"Inference: {inference_time*1000:.1f}ms | "
+                          f"Post: {postprocess_time*1000:.1f}ms | "
+                          f"Detections: {len(detections)} | "
+                          f"Remaining: {remaining:.0f}s", end='', flush=True)
+        
+        finally:
+            self._stop_timing()
+            
+            # Stop capture thread
+            if capture:
+                capture.stop()
+                self.capture_stats = capture.get_stats()
+            elif isinstance(cap, SharedMemoryCaptureSource):
+                ring_stats = cap.get_stats()
+                self.capture_stats = {'drop_policy': f"shared-memory {ring_stats['policy']}",
+                                      'frames_dropped': ring_stats['frames_dropped']}
+            else:
+                self.capture_stats = {'drop_policy': 'sync', 'frames_dropped': 0}
+            self.capture_stats['avg_frame_age_ms'] = (frame_age_total / frame_count * 1000) if frame_count else 0
+            self.capture_stats['max_frame_age_ms'] = frame_age_max * 1000
+    
+    def _run_pipelined_loop(self, cap, duration: int, queue_size: int, live: bool = True):
+        """Run capture -> preprocess -> infer -> postprocess as pipelined stages
+        
+        Each stage has its own worker thread and a bounded queue to the next,
+        so frame N+1 is preprocessed while frame N is in inference.
+        
+        Args:
+            cap: Frame source with a cv2.VideoCapture-style read()
+            duration: Benchmark duration in seconds
+            queue_size: Capacity of each inter-stage queue
+            live: Drop the oldest captured frame instead of blocking capture
+        """
+        def capture_stage():
+            for _ in range(100):
+                read_start = time.perf_counter()
+                ret, frame = cap.read()
+                if ret:
+                    captured_at = time.perf_counter()
+                    self.latency_histograms['capture'].record(captured_at - read_start)
+                    self.tracer.complete('capture', read_start, captured_at)
+                    return {'captured_at': captured_at, 'frame': frame, 'shape': frame.shape}
+                if getattr(cap, 'finished', False):
+                    break
+            return None  # Source stopped delivering frames
+        
+        def preprocess_stage(ctx):
+            preprocess_start = time.perf_counter()
+            ctx['input'] = self._preprocess(ctx.pop('frame'))
+            self.latency_histograms['preprocess'].record(time.perf_counter() - preprocess_start)
+            return ctx
+        
+        def inference_stage(ctx):
+            ctx['infer_start'] = time.perf_counter()
+            self.inference_timer.start()
+            ctx['outputs'] = self._inference(ctx.pop('input'))
+            ctx['inference_time'] = self.inference_timer.stop()
+            self._record_inference(ctx['inference_time'])
+            if self.io_runner is not None:
+                # Bound output buffers are reused by the next run: decode them here
+                postprocess_stage(ctx)
+            return ctx
+        
+        def postprocess_stage(ctx):
+            self.postprocess_timer.start()
+            ctx['detections'] = self._postprocess(ctx.pop('outputs'), ctx['shape'])
+            ctx['postprocess_time'] = self.postprocess_timer.stop()
+            self.latency_histograms['postprocess'].record(ctx['postprocess_time'])
+            return ctx
+        
+        if self.preprocessor is not None:
+            # One tensor per frame in flight: preprocessing, queued, in inference
+            self.preprocessor.set_buffer_count(queue_size + 2)
+        
+        pipeline = StagedPipeline(queue_size)
+        pipeline.add_stage('capture', capture_stage, drop_when_full=live)
+        pipeline.add_stage('preprocess', preprocess_stage)
+        pipeline.add_stage('inference', inference_stage)
+        if self.io_runner is None:
+            pipeline.add_stage('postprocess', postprocess_stage)
+        
+        ConsoleLogger.info(f"Pipeline started: {' -> '.join(st.name for st in pipeline.stages)} "
+                           f"(queue size: {queue_size})")
+        
+        # Start FPS calculation
+        self.fps_calc.start()
+        self.cpu_start = time.process_time()
+        pipeline.start()
+        
+        start_time = time.time()
+        frame_count = 0
+        frame_age_total = 0.0
+        frame_age_max = 0.0
+        latency_total = 0.0
+        
+        try:
+            for ctx in pipeline.results():
+                if time.time() - start_time >= duration:
+                    break
+                
+                # End-to-end FPS and latency
+                fps = self.fps_calc.update()
+                latency = time.perf_counter() - ctx['captured_at']
+                latency_total += latency
+                self.latency_histograms['end_to_end'].record(latency)
+                frame_age = ctx['infer_start'] - ctx['captured_at']
+                frame_age_total += frame_age
+                frame_age_max = max(frame_age_max, frame_age)
+                
+                frame_count += 1
+                detections = ctx['detections']
+                self.logger.log_detections(frame_count, len(detections))
+                if frame_count % 30 == 0:  # Log every 30 frames
+                    stage_stats = pipeline.get_stats()
+                    self.logger.log_inference(frame_count, ctx['inference_time'], fps,
+                                              ctx['postprocess_time'], len(detections),
+                                              frame_age=frame_age,
+                                              dropped_frames=stage_stats['capture']['dropped'])
+                    self.logger.log_pipeline_stats(stage_stats)
+                    
+                    # Console update
+                    remaining = duration - (time.time() - start_time)
+                    print(f"\rFrame {frame_count} | FPS: {fps:.2f} | "
+                          f"Inference: {ctx['inference_time']*1000:.1f}ms | "
+                          f"Post: {ctx['postprocess_time']*1000:.1f}ms | "
+                          f"Detections: {len(detections)} | "
+                          f"Remaining: {remaining:.0f}s", end='', flush=True)
+        
+        finally:
+            self._stop_timing()
+            pipeline.stop()
+            self.pipeline_stats = pipeline.get_stats()
+            self.capture_stats = {
+                'drop_policy': 'pipeline',
+                'frames_captured': self.pipeline_stats['capture']['items'],
+                'frames_dropped': self.pipeline_stats['capture']['dropped'],
+                'avg_frame_age_ms': (frame_age_total / frame_count * 1000) if frame_count else 0,
+                'max_frame_age_ms': frame_age_max * 1000,
+                'avg_e2e_latency_ms': (latency_total / frame_count * 1000) if frame_count else 0
+            }
+    
+    def _run_batched_loop(self, cap, duration: int):
+        """Read batch_size frames, run them through the model as one batch and decode each
+        
+        Throughput comes from fewer, larger inference calls. A frame's
+        end-to-end latency includes waiting for the rest of its batch; the
+        per-frame inference time is the batch time divided by its frames.
+        
+        Args:
+            cap: Non-live frame source with a cv2.VideoCapture-style read()
+            duration: Maximum benchmark duration in seconds
+        """
+        ConsoleLogger.info(f"Batched inference: {self.batch_size} frames per call")
+        
+        # Start FPS calculation
+        self.fps_calc.start()
+        self.cpu_start = time.process_time()
+        
+        start_time = time.time()
+        frame_count = 0
+        batch_count = 0
+        partial_batches = 0
+        end_of_stream = False
+        
+        try:
+            while not end_of_stream and time.time() - start_time < duration:
+                # Capture one batch
+                frames = []
+                captured = []
+                while len(frames) < self.batch_size:
+                    read_start = time.perf_counter()
+                    ret, frame = cap.read()
+                    captured_at = time.perf_counter()
+                    if not ret:
+                        if getattr(cap, 'finished', False):
+                            ConsoleLogger.info("\nEnd of stream")
+                            end_of_stream = True
+                            break
+                        ConsoleLogger.warning("Failed to capture frame")
+                        continue
+                    self.latency_histograms['capture'].record(captured_at - read_start)
+                    self.tracer.complete('capture', read_start, captured_at)
+                    frames.append(frame)
+                    captured.append(captured_at)
+                
+                if not frames:
+                    break
+                count = len(frames)
+                if count < self.batch_size:
+                    partial_batches += 1  # Padded with stale slots, only real frames count
+                
+                # Preprocess into one tensor
+                preprocess_start = time.perf_counter()
+                input_tensor = self._preprocess_batch(frames)
+                preprocess_time = (time.perf_counter() - preprocess_start) / count
+                
+                # One inference call for the whole batch
+                self.inference_timer.start()
+                outputs = self._inference(input_tensor)
+                batch_time = self.inference_timer.stop()
+                self.latency_histograms['batch'].record(batch_time)
+                inference_time = batch_time / count
+                batch_count += 1
+                
+                # Split the outputs back per frame
+                for index in range(count):
+                    self.latency_histograms['preprocess'].record(preprocess_time)
+                    self._record_inference(inference_time)
+                    
+                    self.postprocess_timer.start()
+                    detections = self._postprocess(outputs, frames[index].shape, index)
+                    postprocess_time = self.postprocess_timer.stop()
+                    self.latency_histograms['postprocess'].record(postprocess_time)
+                    self.latency_histograms['end_to_end'].record(time.perf_counter() - captured[index])
+                    
+                    fps = self.fps_calc.update()
+                    frame_count += 1
+                    self.logger.log_detections(frame_count, len(detections))
+                    if frame_count % 30 == 0:  # Log every 30 frames
+                        self.logger.log_inference(frame_count, inference_time, fps,
+                                                  postprocess_time, len(detections))
+                        
+                        # Console update
+                        remaining = duration - (time.time() - start_time)
+                        print(f"\rFrame {frame_count} | FPS: {fps:.2f} | "
+                              f"Batch: {batch_time*1000:.1f}ms | "
+                              f"Inference/frame: {inference_time*1000:.1f}ms | "
+                              f"Detections: {len(detections)} | "
+                              f"Remaining: {remaining:.0f}s", end='', flush=True)
+        
+        finally:
+            # Throughput from this loop's own clock: frames over the time it ran
+            elapsed = self._stop_timing()
+            self.capture_stats = {'drop_policy': 'sync', 'frames_dropped': 0}
+            self.batch_stats = {
+                'batch_size': self.batch_size,
+                'batches': batch_count,
+                'partial_batches': partial_batches,
+                'frames': frame_count,
+                'elapsed_s': elapsed,
+                'throughput_fps': (frame_count / elapsed) if elapsed > 0 else 0.0
+            }
+    
+    def _run_worker_pool_loop(self, cap, duration: int):
+        """Capture here; preprocess, infer and decode in a pool of worker processes
+        
+        Frames are handed out round-robin and come back in capture order.
+        Stage times are measured inside the workers; end-to-end latency runs
+        from capture to the in-order result.
+        
+        Args:
+            cap: Frame source with a cv2.VideoCapture-style read()
+            duration: Benchmark duration in seconds
+        """
+        pool = InferenceWorkerPool(self.model_path, self.workers, self.pool_threads, self.input_size,
+                                   self.session_settings, self.preprocess_mode, self.conf_threshold,
+                                   self.decoder.iou_threshold, self.decoder.top_k)
+        ConsoleLogger.progress(f"Starting {self.workers} inference workers "
+                               f"({pool.threads} of {pool.total_threads} threads each)...")
+        pool.start()
+        ConsoleLogger.success(f"Workers ready in {pool.startup_s:.1f}s")
+        
+        # Start FPS calculation
+        self.fps_calc.start()
+        self.cpu_start = time.process_time()
+        
+        start_time = time.time()
+        frame_count = 0
+        end_of_stream = False
+        captured = {}
+        
+        try:
+            while True:
+                # Keep every worker busy; only block on results once all are
+                if not end_of_stream and time.time() - start_time < duration and pool.pending < pool.capacity:
+                    read_start = time.perf_counter()
+                    ret, frame = cap.read()
+                    captured_at = time.perf_counter()
+                    if ret:
+                        self.latency_histograms['capture'].record(captured_at - read_start)
+                        self.tracer.complete('capture', read_start, captured_at)
+                        captured[pool.submit(frame)] = captured_at
+                    elif getattr(cap, 'finished', False):
+                        ConsoleLogger.info("\nEnd of stream")
+                        end_of_stream = True
+                    else:
+                        ConsoleLogger.warning("Failed to capture frame")
+                    if not pool.pending:
+                        continue
+                    result = pool.get(block=False)
+                elif pool.pending:
+                    result = pool.get()
+                else:
+                    break
+                if result is None:
+                    continue
+                
+                self.latency_histograms['preprocess'].record(result['preprocess'])
+                self._record_inference(result['inference'])
+                self.latency_histograms['postprocess'].record(result['postprocess'])
+                self.latency_histograms['end_to_end'].record(time.perf_counter() - captured.pop(result['seq']))
+                
+                fps = self.fps_calc.update()
+                frame_count += 1
+                detections = result['detections']
+                self.logger.log_detections(frame_count, len(detections))
+                if frame_count % 30 == 0:  # Log every 30 frames
+                    self.logger.log_inference(frame_count, result['inference'], fps,
+                                              result['postprocess'], len(detections))
+                    
+                    # Console update
+                    remaining = duration - (time.time() - start_time)
+                    print(f"\rFrame {frame_count} | FPS: {fps:.2f} | "
+                          f"Inference: {result['inference']*1000:.1f}ms | "
+                          f"Post: {result['postprocess']*1000:.1f}ms | "
+                          f"Detections: {len(detections)} | "
+                          f"Remaining: {remaining:.0f}s", end='', flush=True)
+        
+        finally:
+            self._stop_timing()
+            pool.stop()
+            self.pool_stats = pool.get_stats()
+            self.capture_stats = {'drop_policy': 'sync', 'frames_dropped': 0}
+    
+    def run_image_benchmark(self, image_path: str, num_iterations: int = 100):
+        """Run benchmark using static image
+        
+        Args:
+            image_path: Path to test image
+            num_iterations: Number of iterations
+        """
+        # Initialize logger
+        self.logger = BenchmarkLogger(self.log_name, flush_interval=self.log_flush_interval,
+                                      flush_lines=self.log_flush_lines,
+                                      tracer=self.tracer if self.tracer.enabled else None)
+        
+        config = {
+            'model_path': self.model_path,
+            'input_size': f'{self.input_size}x{self.input_size}',
+            'backend': 'ONNX Runtime',
+            'input_source': f'Image: {image_path}',
+            'num_iterations': num_iterations,
+            'conf_threshold': self.conf_threshold,
+            'iou_threshold': self.decoder.iou_threshold,
+            'top_k': self.decoder.top_k,
+            'io_binding': self.use_iobinding,
+            'session_settings': format_session_settings(self.session_settings),
+            'sampler': self.monitor.name,
+            'sample_interval': self.sample_interval,
+            'profile_ops': self.profile_ops,
+            'cooldown_temp': self.cooldown_temp,
+            'preprocess': self.preprocess_mode,
+            'input_layout': self.input_layout,
+            'batch_size': self.batch_size,
+            'workers': self.workers
+        }
+        
+        self.logger.write_header(config)
+        ConsoleLogger.info(f"Log file: {self.logger.get_log_path()}")
+        
+        # Load image
+        ConsoleLogger.progress(f"Loading image: {image_path}")
+        image = cv2.imread(image_path)
+        if image is None:
+            ConsoleLogger.error("Failed to load image")
+            return
+        
+        ConsoleLogger.success("Image loaded")
+        
+        # Start from the same thermal state as other runs
+        self._cool_down()
+        
+        # Warm up model
+        self._warmup()
+        
+        self._measure_preprocess(image.shape[1], image.shape[0])
+        
+        # Preprocess once
+        preprocess_start = time.perf_counter()
+        input_tensor = self._preprocess(image)
+        self.latency_histograms['preprocess'].record(time.perf_counter() - preprocess_start)
+        
+        # Start monitoring
+        self._start_monitoring()
+        
+        # Start FPS calculation
+        self.fps_calc.start()
+        self.cpu_start = time.process_time()
+        
+        ConsoleLogger.info(f"Running {num_iterations} iterations...")
+        
+        try:
+            for i in range(num_iterations):
+                # Inference
+                self.inference_timer.start()
+                outputs = self._inference(input_tensor)
+                inference_time = self.inference_timer.stop()
+                self._record_inference(inference_time)
+                
+                # Postprocess
+                self.postprocess_timer.start()
+                detections = self._postprocess(outputs, image.shape)
+                postprocess_time = self.postprocess_timer.stop()
+                self.latency_histograms['postprocess'].record(postprocess_time)
+                
+                # Update FPS
+                fps = self.fps_calc.update()
+                
+                # Log
+                self.logger.log_detections(i + 1, len(detections))
+                if (i + 1) % 10 == 0:
+                    self.logger.log_inference(i + 1, inference_time, fps,
+                                              postprocess_time, len(detections))
+                    print(f"\rIteration {i+1}/{num_iterations} | FPS: {fps:.2f} | "
+                          f"Inference: {inference_time*1000:.1f}ms | "
+                          f"Post: {postprocess_time*1000:.1f}ms", end='', flush=True)
+        
+        except KeyboardInterrupt:
+            ConsoleLogger.warning("\nBenchmark interrupted by user")
+        
+        finally:
+            self._stop_timing()
+            print()  # New line
+            
+            # Stop monitoring and release its /proc and sysfs descriptors
+            self._stop_monitoring()
+            self.monitor.close()
+            
+            # Calculate summary
+            self._write_summary()
+            
+            ConsoleLogger.success("Benchmark complete!")
+            ConsoleLogger.info(f"Results saved to: {self.logger.get_log_path()}")
+    
+    def _collect_op_profile(self) -> dict:
+        """Stop ORT profiling and summarize the measured runs per operator
+        
+        Returns:
+            Summary fields ('op_profile', 'op_profile_path'), empty on failure
+        """
+        profile_path = self.session.end_profiling()
+        if not profile_path or not os.path.exists(profile_path):
+            ConsoleLogger.warning("ONNX Runtime profile was not written")
+            return {}
+        
+        # Keep the raw profile next to the run's log
+        log_path = Path(self.logger.get_log_path())
+        target = log_path.with_name(f"{log_path.stem}_ort_profile.json")
+        os.replace(profile_path, target)
+        
+        # The IOBinding shape probe runs before warm-up and is not a measured frame either
+        probe_runs = self.io_runner.probe_runs if self.io_runner is not None else 0
+        op_profile = parse_ort_profile(str(target), skip_runs=self.warmup_runs + probe_runs)
+        ConsoleLogger.info(f"Operator profile ({op_profile['runs']} runs): {target}")
+        for line in format_op_profile(op_profile, top=5)[1:]:
+            if line:
+                print(f"    {line}")
+        return {'op_profile': op_profile, 'op_profile_path': str(target)}
+    
+    def _write_summary(self):
+        """Calculate and write summary statistics"""
+        # Per-frame latency distributions
+        inference_hist = self.latency_histograms['inference']
+        postprocess_hist = self.latency_histograms['postprocess']
+        
+        # Running statistics accumulated on every log call
+        running = self.logger.get_running_summary()
+        fps_stats = running['fps']
+        detection_stats = running['detections']
+        cpu_stats = running['cpu_percent']
+        memory_stats = running['memory_percent']
+        temp_stats = running['temperature']
+        freq_stats = running['cpu_freq_mhz']
+        throttle_count = self.logger.throttle_samples
+        
+        total_frames = self.fps_calc.get_frame_count()
+        elapsed = self.fps_calc.get_elapsed_time()
+        
+        summary = {
+            'total_frames': total_frames,
+            'elapsed_s': elapsed,
+            'avg_fps': self.fps_calc.get_average_fps(),
+            'min_fps': fps_stats['min'],
+            'max_fps': fps_stats['max'],
+            'avg_inference_ms': inference_hist.mean() * 1000,
+            'min_inference_ms': (inference_hist.min * 1000) if inference_hist.count else 0,
+            'max_inference_ms': inference_hist.max * 1000,
+            'avg_postprocess_ms': postprocess_hist.mean() * 1000,
+            'max_postprocess_ms': postprocess_hist.max * 1000,
+            'avg_detections': detection_stats['mean'],
+            'max_detections': int(detection_stats['max']),
+            'avg_cpu': cpu_stats['mean'],
+            'max_cpu': cpu_stats['max'],
+            'avg_memory': memory_stats['mean'],
+            'max_memory': memory_stats['max'],
+            'throttle_events': throttle_count,
+            'io_binding': self.use_iobinding,
+            'allocations_per_frame': (self.inference_allocations / total_frames) if total_frames else 0,
+            'preprocess': self.preprocess_mode,
+            'input_layout': self.input_layout,
+            'batch_size': self.batch_size,
+            'workers': self.workers,
+            'shm_slots': self.shm_slots if self.shm_stats else 0,
+            'preprocess_alloc_bytes_per_frame': self.preprocess_alloc_bytes,
+            'model_cache': self.startup_info.get('model_cache'),
+            'model_load_ms': self.startup_info.get('model_load_ms'),
+            'startup_cold_ms': self.startup_info.get('startup_cold_ms'),
+            'startup_warm_ms': self.startup_info.get('startup_warm_ms')
+        }
+        
+        # Tail latency per stage
+        summary['latency'] = {stage: hist.summary()
+                              for stage, hist in self.latency_histograms.items() if hist.count}
+        for p, value in inference_hist.percentiles(DEFAULT_PERCENTILES).items():
+            summary[f'{percentile_key(p)}_inference_ms'] = value * 1000
+        end_to_end_hist = self.latency_histograms['end_to_end']
+        if end_to_end_hist.count:
+            for p, value in end_to_end_hist.percentiles((50.0, 99.0)).items():
+                summary[f'{percentile_key(p)}_frame_latency_ms'] = value * 1000
+        self.logger.log_histograms(dict(self.latency_histograms,
+                                        **{f'inference_{phase}': hist
+                                           for phase, hist in self.phase_histograms.items()}))
+        
+        # Capture thread / pipeline statistics (camera mode)
+        summary.update(self.capture_stats)
+        if self.pipeline_stats:
+            summary['pipeline_stages'] = self.pipeline_stats
+        
+        # Batched inference: throughput vs whole-batch and per-frame latency
+        if self.batch_stats:
+            batch_hist = self.latency_histograms['batch']
+            summary['batch'] = dict(self.batch_stats,
+                                    avg_batch_inference_ms=batch_hist.mean() * 1000,
+                                    p50_batch_inference_ms=batch_hist.percentiles((50.0,))[50.0] * 1000,
+                                    p50_frame_latency_ms=summary.get('p50_frame_latency_ms'),
+                                    p99_frame_latency_ms=summary.get('p99_frame_latency_ms'))
+        
+        if freq_stats['count']:
+            summary['avg_cpu_freq_mhz'] = freq_stats['mean']
+            summary['min_cpu_freq_mhz'] = freq_stats['min']
+        
+        if self.preprocessor is not None:
+            summary['letterbox'] = self.preprocessor.get_stats()
+        
+        summary['running_stats'] = running
+        
+        # Worker pool: per-worker frames, ordering and the workers' own CPU time
+        if self.pool_stats:
+            summary['worker_pool'] = self.pool_stats
+        
+        # Shared-memory capture: slot waits on both sides, overruns and torn frames
+        if self.shm_stats:
+            summary['shm_ring'] = self.shm_stats
+        
+        # Process CPU time (all threads, pool workers and capture process) per frame and peak memory
+        if self.cpu_time is not None:
+            cpu_time = (self.cpu_time + self.pool_stats.get('worker_cpu_s', 0.0)
+                        + self.shm_stats.get('capture_cpu_s', 0.0))
+            summary['process_cpu_s'] = cpu_time
+            summary['cpu_ms_per_frame'] = (cpu_time / total_frames * 1000) if total_frames else 0
+        # ru_maxrss is reported in kilobytes on Linux
+        summary['peak_rss_mb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        
+        # Cost of the system sampler itself
+        summary.update(self.monitor.get_sampler_stats(self.sample_interval))
+        
+        if temp_stats['count']:
+            summary['avg_temperature'] = temp_stats['mean']
+            summary['max_temperature'] = temp_stats['max']
+            summary['temp_rise'] = temp_stats['max'] - self.logger.running['temperature'].first
+        
+        # Burst vs sustained performance around the thermal plateau
+        thermal = self._thermal_summary(total_frames, elapsed)
+        summary['thermal'] = thermal
+        for phase in ('burst', 'sustained'):
+            if thermal[phase]:
+                summary[f'{phase}_fps'] = thermal[phase]['fps']
+                summary[f'{phase}_p50_inference_ms'] = thermal[phase]['p50_inference_ms']
+        if thermal['sustained']:
+            ConsoleLogger.info(f"Thermal plateau after {thermal['plateau_elapsed_s']:.0f}s: "
+                               f"burst {thermal['burst']['fps']:.2f} FPS, "
+                               f"sustained {thermal['sustained']['fps']:.2f} FPS")
+        
+        # Per-operator hot spots
+        if self.profile_ops:
+            summary.update(self._collect_op_profile())
+        
+        # Chrome/Perfetto trace
+        if self.tracer.enabled:
+            summary.update(self.tracer.save(self.trace_path))
+            ConsoleLogger.info(f"Trace saved to: {self.trace_path}")
+        # Unhook the GC callback so sweeps do not pile up recorders
+        self.tracer.close()
+        
+        self.logger.write_summary(summary)
+        self.logger.save_json()
+
+
+def sweep_fps(summary: dict) -> float:
+    """Throughput of one sweep point over its timed loop only (startup and teardown excluded)"""
+    elapsed = summary.get('elapsed_s')
+    return summary['total_frames'] / elapsed if elapsed else 0.0
+
+
+def print_sweep(parameter: str, summaries: dict):
+    """Print throughput and per-frame latency per value of a swept parameter
+    
+    Args:
+        parameter: Swept parameter ('batch' or 'workers')
+        summaries: Run summary per parameter value
+    """
+    print("\n" + "=" * 88)
+    print(f"{parameter.upper()} SWEEP ({platform.machine()}, {os.cpu_count()} CPUs)")
+    print("=" * 88)
+    print(f"{parameter.capitalize():>7s} {'Frames':>7s} {'Time':>7s} {'FPS':>8s} {'Speedup':>8s} {'Infer p50':>10s} "
+          f"{'Latency p50':>12s} {'p99':>9s} {'CPU/frame':>10s}")
+    print("-" * 88)
+    base_fps = sweep_fps(summaries[min(summaries)])
+    for value, summary in sorted(summaries.items()):
+        fps = sweep_fps(summary)
+        speedup = fps / base_fps if base_fps else 0
+        print(f"{value:7d} {summary['total_frames']:7d} {summary.get('elapsed_s', 0):6.2f}s {fps:8.2f} {speedup:7.2f}x "
+              f"{summary.get('p50_inference_ms', 0):8.1f}ms {summary.get('p50_frame_latency_ms', 0):10.1f}ms "
+              f"{summary.get('p99_frame_latency_ms', 0):7.1f}ms {summary.get('cpu_ms_per_frame', 0):8.1f}ms")
+    print("-" * 88)
+    best = max(summaries, key=lambda value: sweep_fps(summaries[value]))
+    print(f"Best throughput: {parameter} {best} at {sweep_fps(summaries[best]):.2f} FPS (timed loop only)")
+    print("=" * 88)
+
+
+def save_sweep(parameter: str, summaries: dict, results_paths: dict, log_dir: str) -> str:
+    """Save a sweep's per-value results and best throughput point with the host it ran on
+    
+    Args:
+        parameter: Swept parameter ('batch' or 'workers')
+        summaries: Run summary per parameter value
+        results_paths: Results stream per parameter value
+        log_dir: Directory for the report
+        
+    Returns:
+        Path of the JSON report
+    """
+    fields = ('total_frames', 'elapsed_s', 'avg_fps', 'p50_inference_ms', 'p50_frame_latency_ms',
+              'p99_frame_latency_ms', 'cpu_ms_per_frame', 'peak_rss_mb', 'max_temperature')
+    best = max(summaries, key=lambda value: sweep_fps(summaries[value]))
+    report = {
+        'parameter': parameter,
+        'timestamp': datetime.now().isoformat(),
+        'host': {'hostname': platform.node(), 'machine': platform.machine(), 'cpu_count': os.cpu_count()},
+        'best': {parameter: best, 'avg_fps': sweep_fps(summaries[best])},
+        'runs': [dict({parameter: value, 'results': results_paths[value]},
+                      **{field: summary.get(field) for field in fields})
+                 for value, summary in sorted(summaries.items())]
+    }
+    Path(log_dir).mkdir(parents=True, exist_ok=True)
+    path = Path(log_dir) / f"{parameter}_sweep_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json"
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+    return str(path)
+
+
+def create_benchmark(benchmark_class, args, batch_size: int = 1, workers: int = 0,
+                     sweep: str = None) -> YOLOBenchmark:
+    """Create a benchmark from parsed command-line arguments
+    
+    Args:
+        benchmark_class: YOLOBenchmark subclass of the model family
+        args: Parsed arguments
+        batch_size: Frames per inference call
+        workers: Worker processes (0: in-process)
+        sweep: Tag of this sweep point (e.g. 'batch4'), added to the trace file name
+    """
+    trace_path = args.trace
+    if trace_path and sweep:
+        trace = Path(trace_path)
+        trace_path = str(trace.with_name(f"{trace.stem}_{sweep}{trace.suffix}"))
+    return benchmark_class(
+        model_path=args.model,
+        input_size=args.input_size,
+        conf_threshold=args.conf,
+        iou_threshold=args.iou,
+        top_k=args.top_k,
+        use_iobinding=args.iobinding,
+        profile_path=args.profile_file,
+        cache_dir=None if args.no_model_cache else args.cache_dir,
+        sampler=args.sampler,
+        sample_interval=args.sample_interval,
+        log_flush_interval=args.log_flush_interval,
+        log_flush_lines=args.log_flush_lines,
+        live_summary_interval=args.live_summary,
+        trace_path=trace_path,
+        trace_capacity=args.trace_capacity,
+        profile_ops=args.profile_ops,
+        cooldown_temp=args.cooldown_temp,
+        cooldown_timeout=args.cooldown_timeout,
+        plateau_window=args.plateau_window,
+        plateau_slope=args.plateau_slope,
+        preprocess=args.preprocess,
+        batch_size=batch_size,
+        workers=workers,
+        pool_threads=args.pool_threads,
+        shm_slots=args.shm_slots if args.shm_capture else 0
+    )
+
+
+def run_cli(benchmark_class, argv=None):
+    """Command line of the model benchmark scripts
+    
+    Args:
+        benchmark_class: YOLOBenchmark subclass of the model family
+        argv: Arguments (default: sys.argv)
+    """
+    name = benchmark_class.model_name
+    parser = argparse.ArgumentParser(description=f'{name} Benchmark for Raspberry Pi 4B')
+    parser.add_argument('--model', type=str, default=benchmark_class.default_model,
+                        help=f'Path to {name} ONNX model')
+    parser.add_argument('--input-size', type=int, default=640,
+                       help='Input image size (default: 640)')
+    parser.add_argument('--duration', type=int, default=60,
+                       help='Benchmark duration in seconds (default: 60)')
+    parser.add_argument('--camera', type=int, default=0,
+                       help='Camera device index (default: 0)')
+    parser.add_argument('--capture-policy', type=str, default='latest',
+                       choices=['latest', 'fifo', 'sync'],
+                       help='Camera capture: threaded ring buffer (latest/fifo) or inline (sync) (default: latest)')
+    parser.add_argument('--capture-buffer', type=int, default=2,
+                       help='Capture ring buffer size (default: 2)')
+    parser.add_argument('--pipeline', action='store_true',
+                       help='Run capture/preprocess/inference/postprocess as pipelined stages')
+    parser.add_argument('--image', type=str, default=None,
+                       help='Path to test image (alternative to camera)')
+    parser.add_argument('--video', type=str, default=None,
+                       help='Path to video file (alternative to camera)')
+    parser.add_argument('--image-dir', type=str, default=None,
+                       help='Directory of images, processed once in name order (alternative to camera)')
+    parser.add_argument('--synthetic', type=str, default=None, metavar='WxH@FPS',
+                       help='Synthetic frames paced like a camera, e.g. 640x480@30')
+    parser.add_argument('--iterations', type=int, default=100,
+                       help='Number of iterations for image mode (default: 100)')
+    parser.add_argument('--conf', type=float, default=0.25,
+                       help='Confidence threshold (default: 0.25)')
+    parser.add_argument('--iou', type=float, default=0.45,
+                       help='NMS IoU threshold (default: 0.45)')
+    parser.add_argument('--top-k', type=int, default=None,
+                       help='Keep only the top-k candidates before NMS (default: off)')
+    parser.add_argument('--iobinding', action='store_true',
+                       help='Reuse preallocated input/output buffers via ONNX Runtime IOBinding')
+    parser.add_argument('--autotune', action='store_true',
+                       help='Sweep ONNX Runtime thread/execution settings and save the best profile')
+    parser.add_argument('--autotune-metric', type=str, default='fps', choices=['fps', 'p95'],
+                       help='Autotune objective: highest FPS or lowest p95 latency (default: fps)')
+    parser.add_argument('--profile-file', type=str, default=DEFAULT_PROFILE_PATH,
+                       help=f'Tuned session profile file (default: {DEFAULT_PROFILE_PATH})')
+    parser.add_argument('--cache-dir', type=str, default=DEFAULT_CACHE_DIR,
+                       help=f'Optimized model cache directory (default: {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--no-model-cache', action='store_true',
+                       help='Always run graph optimization instead of using the model cache')
+    parser.add_argument('--sampler', type=str, default='sysfs', choices=['sysfs', 'legacy'],
+                       help='System sampler: direct sysfs/proc reads or psutil + vcgencmd (default: sysfs)')
+    parser.add_argument('--sample-interval', type=float, default=1.0,
+                       help='Seconds between system samples (default: 1.0)')
+    parser.add_argument('--log-flush-interval', type=float, default=1.0,
+                       help='Seconds between background text log flushes (default: 1.0)')
+    parser.add_argument('--log-flush-lines', type=int, default=256,
+                       help='Flush the text log once this many lines are pending (default: 256)')
+    parser.add_argument('--live-summary', type=float, default=60.0,
+                       help='Seconds between mid-run summaries in the log, 0 to disable (default: 60)')
+    parser.add_argument('--trace', type=str, default=None, metavar='OUT_JSON',
+                       help='Write a Chrome/Perfetto trace of per-frame spans to this file '
+                            '(sweeps write one per value, e.g. trace_batch4.json)')
+    parser.add_argument('--trace-capacity', type=int, default=65536,
+                       help='Trace ring buffer size in events (default: 65536)')
+    parser.add_argument('--profile-ops', action='store_true',
+                       help='Profile every ONNX Runtime operator and report the hottest ops and op types')
+    parser.add_argument('--preprocess', type=str, default='letterbox', choices=['letterbox', 'stretch'],
+                       help='Letterbox into a preallocated tensor, or the legacy allocating stretch resize '
+                            '(default: letterbox)')
+    parser.add_argument('--cooldown-temp', type=float, default=None, metavar='CELSIUS',
+                       help='Wait until the CPU is at or below this temperature before the run')
+    parser.add_argument('--cooldown-timeout', type=float, default=DEFAULT_COOLDOWN_TIMEOUT,
+                       help=f'Maximum seconds to wait for the cool-down (default: {DEFAULT_COOLDOWN_TIMEOUT:.0f})')
+    parser.add_argument('--plateau-window', type=float, default=DEFAULT_PLATEAU_WINDOW,
+                       help=f'Seconds of temperature samples for steady-state detection '
+                            f'(default: {DEFAULT_PLATEAU_WINDOW:.0f})')
+    parser.add_argument('--plateau-slope', type=float, default=DEFAULT_PLATEAU_SLOPE,
+                       help=f'Slope in °C/min below which temperature counts as steady '
+                            f'(default: {DEFAULT_PLATEAU_SLOPE})')
+    parser.add_argument('--batch', type=int, nargs='+', default=[1], metavar='N',
+                       help='Frames per inference call with --video/--image-dir; several sizes run '
+                            'one after another and are compared (default: 1)')
+    parser.add_argument('--workers', type=int, nargs='+', default=None, metavar='K',
+                       help='Run preprocess/inference/decode in K worker processes with their own session; '
+                            'several values run one after another and are compared (default: in-process)')
+    parser.add_argument('--pool-threads', type=int, default=None,
+                       help='Intra-op threads split across the workers (default: CPU count)')
+    parser.add_argument('--shm-capture', action='store_true',
+                       help='Capture in a separate process and hand frames over through shared memory')
+    parser.add_argument('--shm-slots', type=int, default=4,
+                       help='Frame slots of the shared-memory ring with --shm-capture (default: 4)')
+    
+    args = parser.parse_args(argv)
+    
+    # Check if model exists
+    if not os.path.exists(args.model):
+        ConsoleLogger.error(f"Model not found: {args.model}")
+        ConsoleLogger.info(f"Please download {name} ONNX model first")
+        return
+    
+    if args.synthetic:
+        try:
+            parse_synthetic_spec(args.synthetic)
+        except ValueError as e:
+            ConsoleLogger.error(str(e))
+            return
+    
+    if min(args.batch) < 1:
+        ConsoleLogger.error("--batch sizes must be at least 1")
+        return
+    if max(args.batch) > 1 and not (args.video or args.image_dir):
+        ConsoleLogger.error("--batch sizes above 1 need --video or --image-dir")
+        return
+    if max(args.batch) > 1 and args.pipeline:
+        ConsoleLogger.error("--batch cannot be combined with --pipeline")
+        return
+    if args.workers:
+        if min(args.workers) < 1:
+            ConsoleLogger.error("--workers must be at least 1")
+            return
+        if args.image or args.pipeline or max(args.batch) > 1:
+            ConsoleLogger.error("--workers needs a stream source and cannot be combined with --pipeline or --batch")
+            return
+    if args.shm_capture:
+        if args.shm_slots < 2:
+            ConsoleLogger.error("--shm-slots must be at least 2")
+            return
+        if args.image or args.pipeline or args.workers or max(args.batch) > 1:
+            ConsoleLogger.error("--shm-capture needs a stream source and cannot be combined with "
+                                "--pipeline, --batch or --workers")
+            return
+    
+    # Tune session settings; the benchmark picks up the saved profile
+    if args.autotune:
+        ConsoleLogger.progress("Autotuning ONNX Runtime session settings...")
+        tuner = SessionAutotuner(args.model, args.input_size)
+        profile = tuner.tune(metric=args.autotune_metric)
+        SessionProfileStore(args.profile_file).save(args.model, args.input_size, profile)
+        ConsoleLogger.success(f"Best settings ({args.autotune_metric}): "
+                              f"{format_session_settings(profile['settings'])}")
+        ConsoleLogger.info(f"Profile saved to: {args.profile_file}")
+    
+    # One run, or one per swept batch size / worker count
+    if args.workers:
+        parameter, values = 'workers', args.workers
+    else:
+        parameter, values = 'batch', args.batch
+    
+    summaries = {}
+    results_paths = {}
+    for value in values:
+        # Create benchmark
+        try:
+            sweep = f"{parameter}{value}" if len(values) > 1 else None
+            if parameter == 'workers':
+                benchmark = create_benchmark(benchmark_class, args, workers=value, sweep=sweep)
+            else:
+                benchmark = create_benchmark(benchmark_class, args, batch_size=value, sweep=sweep)
+        except ValueError as e:
+            ConsoleLogger.error(str(e))
+            ConsoleLogger.info("Export one with: python3 src/export_dynamic_batch.py --model " + args.model)
+            return
+        
+        # Run benchmark
+        if args.image:
+            benchmark.run_image_benchmark(args.image, args.iterations)
+        elif args.video:
+            benchmark.run_video_benchmark(args.video, args.duration, args.capture_buffer,
+                                          pipelined=args.pipeline)
+        elif args.image_dir:
+            benchmark.run_image_dir_benchmark(args.image_dir, args.duration, args.capture_buffer,
+                                              pipelined=args.pipeline)
+        elif args.synthetic:
+            benchmark.run_synthetic_benchmark(args.synthetic, args.duration,
+                                              args.capture_policy, args.capture_buffer,
+                                              pipelined=args.pipeline)
+        else:
+            benchmark.run_camera_benchmark(args.duration, args.camera,
+                                           args.capture_policy, args.capture_buffer,
+                                           pipelined=args.pipeline)
+        
+        if benchmark.logger is not None and benchmark.logger.summary is not None:
+            summaries[value] = benchmark.logger.summary
+            results_paths[value] = benchmark.logger.get_json_path()
+    
+    if len(summaries) > 1:
+        print_sweep(parameter, summaries)
+        # Next to the model log directories, like the quantization and matrix reports
+        log_root = Path(next(iter(results_paths.values()))).parent.parent
+        report_path = save_sweep(parameter, summaries, results_paths, str(log_root / 'sweeps'))
+        ConsoleLogger.info(f"Sweep saved to: {report_path}")
@@ -0,0 +1,171 @@
+"""
+Bootstrap Statistics Module
+Vectorized bootstrap confidence intervals and significance tests for benchmark runs
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .histogram import LatencyHistogram
+
+
+DEFAULT_RESAMPLES = 2000
+DEFAULT_CONFIDENCE = 0.95
+
+
+def bootstrap_mean(values: np.ndarray, n_boot: int = DEFAULT_RESAMPLES,
+                   rng: Optional[np.random.Generator] = None,
+                   max_elements: int = 1 << 22) -> np.ndarray:
+    """Bootstrap replicates of the mean of a sample
+
+    Resampling indices are drawn as one (block, n) matrix per block of
+    replicates, so memory stays under max_elements however large n_boot is.
+
+    Args:
+        values: 1-D sample
+        n_boot: Number of bootstrap replicates
+        rng: Random generator (default: fresh unseeded generator)
+        max_elements: Upper bound on indices drawn at once
+
+    Returns:
+        Array of n_boot replicate means (empty if values is empty)
+    """
+    rng = rng or np.random.default_rng()
+    values = np.asarray(values, dtype=np.float64)
+    if values.size == 0:
+        return np.empty(0)
+    block = max(1, max_elements // values.size)
+    replicates = np.empty(n_boot)
+    for start in range(0, n_boot, block):
+        stop = min(n_boot, start + block)
+        indices = rng.integers(0, values.size, size=(stop - start, values.size))
+        replicates[start:stop] = values[indices].mean(axis=1)
+    return replicates
+
+
+def bootstrap_histogram(hist: LatencyHistogram, percentiles: Iterable[float] = (50.0, 99.0),
+                        n_boot: int = DEFAULT_RESAMPLES,
+                        rng: Optional[np.random.Generator] = None) -> Dict:
+    """Bootstrap replicates of the mean and percentiles of a latency histogram
+
+    Resampling n frames with replacement from a histogram is a multinomial
+    draw over its buckets, so each replicate costs one row of bucket counts
+    instead of n samples: cost is independent of the number of frames.
+
+    Args:
+        hist: Histogram of per-frame values (seconds)
+        percentiles: Percentiles (0-100) to replicate
+        n_boot: Number of bootstrap replicates
+        rng: Random generator (default: fresh unseeded generator)
+
+    Returns:
+        Dictionary mapping 'mean' and each percentile to an array of n_boot
+        replicates in seconds (empty dict for an empty histogram)
+    """
+    rng = rng or np.random.default_rng()
+    if hist.count == 0:
+        return {}
+
+    # Only occupied buckets can be drawn
+    occupied = np.flatnonzero(hist.counts)
+    counts = hist.counts[occupied]
+    values = np.clip(hist.bucket_values()[occupied], hist.min, hist.max)
+    resampled = rng.multinomial(hist.count, counts / hist.count, size=n_boot)
+
+    # Centre the bucket-midpoint means on the exact mean
+    replicates = {'mean': resampled @ values / hist.count + (hist.mean() - counts @ values / hist.count)}
+    cumulative = np.cumsum(resampled, axis=1)
+    for p in percentiles:
+        rank = max(1, int(math.ceil(p / 100.0 * hist.count)))
+        replicates[p] = values[np.argmax(cumulative >= rank, axis=1)]
+    return replicates
+
+
+def confidence_interval(replicates: np.ndarray, confidence: float = DEFAULT_CONFIDENCE) -> tuple:
+    """Percentile-method interval of bootstrap replicates
+
+    Returns:
+        Tuple of (low, high)
+    """
+    alpha = 1.0 - confidence
+    low, high = np.quantile(replicates, [alpha / 2, 1 - alpha / 2])
+    return float(low), float(high)
+
+
+def rank_runs(estimates: Dict[str, float], replicates: Dict[str, np.ndarray],
+              lower_is_better: bool = False, confidence: float = DEFAULT_CONFIDENCE) -> Dict:
+    """Pick the best run and test it against every other run
+
+    The best point estimate wins only if, for every other run, the bootstrap
+    interval of the difference excludes zero. Intervals use a Bonferroni
+    correction for the N-1 comparisons. Runs without replicates cannot be
+    tested and are reported as untested.
+
+    Args:
+        estimates: Point estimate per run
+        replicates: Bootstrap replicates per run (same length for all runs)
+        lower_is_better: True for latencies, False for throughput
+        confidence: Family-wise confidence level
+
+    Returns:
+        Dictionary with 'best', 'winner' (None unless significant), 'significant',
+        'tied' (runs not separable from the best) and 'untested'
+    """
+    if not estimates:
+        return {'best': None, 'winner': None, 'significant': False, 'tied': [], 'untested': []}
+
+    pick = min if lower_is_better else max
+    best = pick(estimates, key=estimates.get)
+    others = [name for name in estimates if name != best]
+    if len(replicates.get(best, ())) > 0:
+        tested = [name for name in others if len(replicates.get(name, ())) > 0]
+    else:
+        tested = []
+    untested = [name for name in others if name not in tested]
+
+    tied: List[str] = []
+    if tested:
+        # (runs, replicates) matrix: every comparison in one quantile call
+        sign = -1.0 if lower_is_better else 1.0
+        diffs = sign * (replicates[best][None, :] - np.stack([replicates[name] for name in tested]))
+        alpha = (1.0 - confidence) / len(others)
+        lower_bounds = np.quantile(diffs, alpha / 2, axis=1)
+        tied = [name for name, bound in zip(tested, lower_bounds) if bound <= 0]
+
+    significant = bool(others) and not tied and not untested
+    return {
+        'best': best,
+        'winner': best if significant or not others else None,
+        'significant': significant,
+        'tied': tied,
+        'untested': untested
+    }
+
+
+if __name__ == '__main__':
+    # Two close and one clearly slower run: python3 -m utils.bootstrap (from src/)
+    import time
+
+    rng = np.random.default_rng(0)
+    runs = {'a': (0.080, 20000), 'b': (0.0805, 20000), 'c': (0.090, 20000)}
+    hists = {}
+    for name, (median, n) in runs.items():
+        hist = LatencyHistogram()
+        for value in rng.lognormal(np.log(median), 0.2, n):
+            hist.record(value)
+        hists[name] = hist
+
+    start = time.perf_counter()
+    replicates = {name: bootstrap_histogram(hist, (50.0, 99.0), rng=rng) for name, hist in hists.items()}
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    for stat in ('mean', 50.0, 99.0):
+        estimates = {name: float(np.median(reps[stat])) for name, reps in replicates.items()}
+        ranking = rank_runs(estimates, {name: reps[stat] for name, reps in replicates.items()},
+                            lower_is_better=True)
+        intervals = {name: tuple(round(v * 1000, 2) for v in confidence_interval(reps[stat]))
+                     for name, reps in replicates.items()}
+        print(f"{stat}: {intervals} -> {ranking}")
+    print(f"Bootstrap of {len(hists)} runs: {elapsed_ms:.0f}ms")
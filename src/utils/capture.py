@@ -0,0 +1,190 @@
+"""
+Threaded Capture Module
+Reads frames on a producer thread into a bounded ring buffer
+"""
+
+import time
+import threading
+from collections import deque
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+# (frame_index, capture_time, frame); capture_time is time.perf_counter()
+CapturedFrame = Tuple[int, float, np.ndarray]
+
+
+class FrameRingBuffer:
+    """Bounded frame buffer shared by one producer and one consumer
+
+    Drop policies:
+        'latest': the consumer always gets the newest frame; anything older is dropped
+        'fifo':   frames are consumed in order; the oldest is dropped when full
+    """
+
+    POLICIES = ('latest', 'fifo')
+
+    def __init__(self, capacity: int = 2, drop_policy: str = 'latest'):
+        """Initialize ring buffer
+
+        Args:
+            capacity: Maximum number of buffered frames
+            drop_policy: 'latest' or 'fifo'
+        """
+        if drop_policy not in self.POLICIES:
+            raise ValueError(f"Unknown drop policy: {drop_policy}")
+
+        self.capacity = max(1, capacity)
+        self.drop_policy = drop_policy
+        self.frames = deque(maxlen=self.capacity)
+        self.cond = threading.Condition()
+        self.closed = False
+
+        self.put_count = 0
+        self.dropped = 0
+
+    def put(self, item: CapturedFrame):
+        """Add a frame, dropping the oldest one if the buffer is full"""
+        with self.cond:
+            if len(self.frames) == self.capacity:
+                self.dropped += 1
+            self.frames.append(item)
+            self.put_count += 1
+            self.cond.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[CapturedFrame]:
+        """Take the next frame according to the drop policy
+
+        Args:
+            timeout: Seconds to wait for a frame (None waits forever)
+
+        Returns:
+            Captured frame, or None on timeout / when closed and empty
+        """
+        with self.cond:
+            if not self.cond.wait_for(lambda: self.frames or self.closed, timeout):
+                return None
+            if not self.frames:
+                return None
+
+            if self.drop_policy == 'latest':
+                item = self.frames.pop()
+                self.dropped += len(self.frames)
+                self.frames.clear()
+                return item
+            return self.frames.popleft()
+
+    def depth(self) -> int:
+        """Get number of buffered frames"""
+        return len(self.frames)
+
+    def close(self):
+        """Wake up any waiting consumer"""
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+
+class ThreadedCapture:
+    """Capture producer thread feeding a FrameRingBuffer
+
+    Works with any source exposing cv2.VideoCapture's read() -> (ret, frame).
+    """
+
+    def __init__(self, cap, buffer_size: int = 2, drop_policy: str = 'latest',
+                 max_consecutive_failures: int = 100, histogram=None, tracer=None):
+        """Initialize threaded capture
+
+        Args:
+            cap: Frame source (e.g. cv2.VideoCapture)
+            buffer_size: Ring buffer capacity
+            drop_policy: 'latest' or 'fifo'
+            max_consecutive_failures: Stop after this many failed reads in a row
+            histogram: Optional LatencyHistogram recording every read() duration
+            tracer: Optional TraceRecorder receiving a 'capture' span per read()
+        """
+        self.cap = cap
+        self.buffer = FrameRingBuffer(buffer_size, drop_policy)
+        self.max_consecutive_failures = max_consecutive_failures
+        self.histogram = histogram
+        self.tracer = tracer
+
+        self.running = False
+        self.thread = None
+
+        self.frames_captured = 0
+        self.read_failures = 0
+        self.capture_time_total = 0.0
+
+    def start(self):
+        """Start capture thread"""
+        self.running = True
+        self.thread = threading.Thread(target=self._capture_loop, name='capture', daemon=True)
+        self.thread.start()
+
+    def _capture_loop(self):
+        consecutive_failures = 0
+
+        while self.running:
+            read_start = time.perf_counter()
+            ret, frame = self.cap.read()
+            captured_at = time.perf_counter()
+
+            if not ret:
+                self.read_failures += 1
+                consecutive_failures += 1
+                if consecutive_failures >= self.max_consecutive_failures:
+                    break
+                time.sleep(0.005)
+                continue
+
+            consecutive_failures = 0
+            self.capture_time_total += captured_at - read_start
+            if self.histogram is not None:
+                self.histogram.record(captured_at - read_start)
+            if self.tracer is not None:
+                self.tracer.complete('capture', read_start, captured_at)
+            self.buffer.put((self.frames_captured, captured_at, frame))
+            self.frames_captured += 1
+
+        self.running = False
+        self.buffer.close()
+
+    def read(self, timeout: Optional[float] = 1.0) -> Optional[CapturedFrame]:
+        """Get the next frame from the ring buffer
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            (frame_index, capture_time, frame) or None
+        """
+        return self.buffer.get(timeout)
+
+    def is_alive(self) -> bool:
+        """Check whether the producer is still delivering frames"""
+        return self.running or self.buffer.depth() > 0
+
+    def stop(self):
+        """Stop capture thread"""
+        self.running = False
+        self.buffer.close()
+        if self.thread:
+            self.thread.join(timeout=2.0)
+
+    def get_stats(self) -> dict:
+        """Get capture statistics
+
+        Returns:
+            Dictionary with captured, dropped and failed frame counts
+        """
+        avg_capture = (self.capture_time_total / self.frames_captured) if self.frames_captured else 0
+        return {
+            'frames_captured': self.frames_captured,
+            'frames_dropped': self.buffer.dropped,
+            'read_failures': self.read_failures,
+            'drop_policy': self.buffer.drop_policy,
+            'buffer_size': self.buffer.capacity,
+            'avg_capture_ms': avg_capture * 1000
+        }
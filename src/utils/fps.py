@@ -21,15 +21,27 @@ class FPSCalculator:
         self.frame_times = deque(maxlen=window_size)
         self.frame_count = 0
         self.start_time = None
+        self.stop_time = None
         self.last_frame_time = None
         
     def start(self):
         """Start FPS calculation"""
         self.start_time = time.time()
+        self.stop_time = None
         self.last_frame_time = self.start_time
         self.frame_count = 0
         self.frame_times.clear()
     
+    def stop(self) -> float:
+        """Stop the clock (call when the timed loop exits, before any teardown)
+        
+        Returns:
+            Elapsed time in seconds
+        """
+        if self.start_time is not None and self.stop_time is None:
+            self.stop_time = time.time()
+        return self.get_elapsed_time()
+    
     def update(self) -> float:
         """Update FPS calculation with new frame
         
@@ -63,7 +75,7 @@ class FPSCalculator:
         return 0.0
     
     def get_average_fps(self) -> float:
-        """Get overall average FPS since start
+        """Get overall average FPS from start until now (or until stop())
         
         Returns:
             Overall average FPS
@@ -71,7 +83,7 @@ class FPSCalculator:
         if self.start_time is None or self.frame_count == 0:
             return 0.0
         
-        elapsed = time.time() - self.start_time
+        elapsed = self.get_elapsed_time()
         if elapsed > 0:
             return self.frame_count / elapsed
         return 0.0
@@ -81,20 +93,21 @@ class FPSCalculator:
         return self.frame_count
     
     def get_elapsed_time(self) -> float:
-        """Get elapsed time since start
+        """Get elapsed time since start (until stop() once stopped)
         
         Returns:
             Elapsed time in seconds
         """
         if self.start_time is None:
             return 0.0
-        return time.time() - self.start_time
+        return (self.stop_time or time.time()) - self.start_time
     
     def reset(self):
         """Reset FPS calculator"""
         self.frame_times.clear()
         self.frame_count = 0
         self.start_time = None
+        self.stop_time = None
         self.last_frame_time = None
 
 
@@ -186,6 +199,8 @@ if __name__ == '__main__':
         fps = fps_calc.update()
         if i % 10 == 0:
             print(f"Frame {i}: Current FPS: {fps:.2f}, Average FPS: {fps_calc.get_average_fps():.2f}")
+    fps_calc.stop()
+    time.sleep(0.2)  # Teardown after the loop is not counted
     
     print(f"\nFinal Statistics:")
     print(f"Total Frames: {fps_calc.get_frame_count()}")
@@ -0,0 +1,105 @@
+"""
+IOBinding Module for ONNX Runtime
+Runs inference against preallocated input/output buffers bound once per session
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+
+# ONNX tensor type strings to numpy dtypes
+ONNX_TO_NUMPY = {
+    'tensor(float)': np.float32,
+    'tensor(float16)': np.float16,
+    'tensor(double)': np.float64,
+    'tensor(uint8)': np.uint8,
+    'tensor(int8)': np.int8,
+    'tensor(int32)': np.int32,
+    'tensor(int64)': np.int64,
+}
+
+
+class IOBindingRunner:
+    """Zero-allocation inference using ONNX Runtime IOBinding
+
+    The input and output buffers are allocated once and bound to the session.
+    Every call to run() copies the frame into the bound input buffer and lets
+    ONNX Runtime write its results straight into the bound output buffers, so
+    the steady state allocates nothing per frame.
+
+    Note: run() returns the same output arrays every time. Callers that keep
+    results across frames must copy them first.
+    """
+
+    def __init__(self, session, input_shape: Tuple[int, ...]):
+        """Initialize IOBinding runner
+
+        Args:
+            session: ONNX Runtime InferenceSession
+            input_shape: Shape of the input tensor (e.g. (1, 3, 640, 640))
+        """
+        self.session = session
+        self.input_name = session.get_inputs()[0].name
+        self.input_dtype = ONNX_TO_NUMPY.get(session.get_inputs()[0].type, np.float32)
+        self.output_names = [output.name for output in session.get_outputs()]
+        self.binding = session.io_binding()
+
+        self.input_buffer: np.ndarray = None
+        self.output_buffers: List[np.ndarray] = []
+
+        # Buffers (re)allocated after the initial bind, e.g. on a shape change
+        self.reallocation_count = 0
+        self.run_count = 0
+        # Plain session.run() calls made to learn output shapes (they show up in profiles)
+        self.probe_runs = 0
+
+        self._bind(tuple(input_shape))
+
+    def _bind(self, input_shape: Tuple[int, ...]):
+        """Allocate buffers for the given input shape and bind them
+
+        Args:
+            input_shape: Shape of the input tensor
+        """
+        self.input_buffer = np.zeros(input_shape, dtype=self.input_dtype)
+
+        # Probe once to learn the concrete output shapes (dynamic axes included)
+        probe = self.session.run(self.output_names, {self.input_name: self.input_buffer})
+        self.probe_runs += 1
+        self.output_buffers = [np.empty_like(output) for output in probe]
+
+        self.binding.clear_binding_inputs()
+        self.binding.clear_binding_outputs()
+
+        self.binding.bind_input(
+            self.input_name, 'cpu', 0, self.input_buffer.dtype,
+            list(self.input_buffer.shape), self.input_buffer.ctypes.data
+        )
+        for name, buffer in zip(self.output_names, self.output_buffers):
+            self.binding.bind_output(
+                name, 'cpu', 0, buffer.dtype, list(buffer.shape), buffer.ctypes.data
+            )
+
+    def run(self, input_tensor: np.ndarray) -> List[np.ndarray]:
+        """Run inference on the bound buffers
+
+        Args:
+            input_tensor: Preprocessed input tensor, or the bound input buffer itself
+
+        Returns:
+            List of (reused) output arrays
+        """
+        if input_tensor is not self.input_buffer:
+            if input_tensor.shape != self.input_buffer.shape:
+                self._bind(input_tensor.shape)
+                self.reallocation_count += 1 + len(self.output_buffers)
+            np.copyto(self.input_buffer, input_tensor, casting='unsafe')
+
+        self.session.run_with_iobinding(self.binding)
+        self.run_count += 1
+        return self.output_buffers
+
+    def get_buffer_bytes(self) -> int:
+        """Get total size of the bound buffers in bytes"""
+        return self.input_buffer.nbytes + sum(b.nbytes for b in self.output_buffers)
@@ -0,0 +1,342 @@
+"""
+Letterbox Preprocessing Module
+Aspect-preserving resize + pad written straight into a preallocated model input tensor
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+# Ultralytics pads letterboxed images with gray (114, 114, 114)
+DEFAULT_PAD_VALUE = 114
+
+# Input layouts: float32 RGB CHW in [0, 1], or raw uint8 BGR HWC frames for
+# models with the normalization folded into the graph (fold_preprocess.py)
+LAYOUT_NCHW = 'nchw'
+LAYOUT_NHWC = 'nhwc'
+
+
+def input_layout(input_meta) -> str:
+    """Detect the input layout of an ONNX Runtime session input
+
+    Args:
+        input_meta: session.get_inputs()[0]
+
+    Returns:
+        LAYOUT_NHWC for uint8 inputs with 3 trailing channels, else LAYOUT_NCHW
+    """
+    shape = input_meta.shape
+    if input_meta.type == 'tensor(uint8)' and len(shape) == 4 and shape[-1] == 3:
+        return LAYOUT_NHWC
+    return LAYOUT_NCHW
+
+
+def input_shape(layout: str, input_size: int, batch: int = 1) -> Tuple[int, int, int, int]:
+    """Model input shape for a layout"""
+    if layout == LAYOUT_NHWC:
+        return batch, input_size, input_size, 3
+    return batch, 3, input_size, input_size
+
+
+def input_dtype(layout: str):
+    """Model input dtype for a layout"""
+    return np.uint8 if layout == LAYOUT_NHWC else np.float32
+
+
+class LetterboxPreprocessor:
+    """Letterbox BGR frames into reusable Nx3xSxS float32 (or NxSxSx3 uint8) tensors
+
+    Scale and padding are computed once per source resolution and cached
+    together with a uint8 resize scratch buffer. Per frame, cv2.resize writes
+    into the scratch buffer, a strided cast copies it as RGB CHW float32
+    straight into the output tensor and an in-place multiply scales it to
+    [0, 1]. Neither step needs a temporary (a mixed-dtype ufunc would
+    allocate numpy's casting buffers), so the steady state allocates only
+    array views. The padding of a buffer is only rewritten when its geometry
+    changes. to_source() maps detections back with the same geometry.
+
+    In the NHWC layout the frame stays uint8 BGR: cv2.resize writes straight
+    into the tensor when the resized rows are contiguous there (full-width
+    frames) and is copied in otherwise.
+
+    With batch_size N, batch() letterboxes up to N frames into the slots of
+    one (N, ...) tensor; padding is tracked per slot.
+
+    Buffers rotate round-robin. A returned tensor stays valid for the next
+    num_buffers - 1 calls, so pipelined callers need one buffer per frame in
+    flight. Callers that keep a tensor longer must copy it.
+    """
+
+    def __init__(self, input_size: int, pad_value: int = DEFAULT_PAD_VALUE, num_buffers: int = 1,
+                 layout: str = LAYOUT_NCHW, batch_size: int = 1):
+        """Initialize letterbox preprocessor
+
+        Args:
+            input_size: Square model input size
+            pad_value: Padding value on the 0-255 scale
+            num_buffers: Output tensors to rotate through
+            layout: LAYOUT_NCHW (float32 RGB) or LAYOUT_NHWC (uint8 BGR)
+            batch_size: Frames per output tensor
+        """
+        self.input_size = input_size
+        self.layout = layout
+        self.batch_size = batch_size
+        self.shape = input_shape(layout, input_size, batch_size)
+        self.dtype = input_dtype(layout)
+        self.pad_value = np.uint8(pad_value) if layout == LAYOUT_NHWC else np.float32(pad_value / 255.0)
+        self.scale = np.float32(1.0 / 255.0)
+        self.geometries: Dict[Tuple[int, int], Dict] = {}
+
+        self.buffers: List[np.ndarray] = []
+        self.buffer_keys: List[List[Optional[Tuple[int, int]]]] = []
+        self.next_buffer = 0
+        self.set_buffer_count(num_buffers)
+
+        # Resize scratch buffers allocated (one per source resolution)
+        self.allocations = 0
+        self.frames = 0
+
+    def set_buffer_count(self, count: int):
+        """Allocate count fresh output tensors"""
+        self.set_buffers([np.empty(self.shape, dtype=self.dtype) for _ in range(max(1, count))])
+
+    def set_buffers(self, buffers: List[np.ndarray]):
+        """Write into caller-owned tensors (e.g. an IOBinding input buffer)
+
+        Args:
+            buffers: Contiguous arrays of the layout's shape and dtype
+        """
+        for buffer in buffers:
+            if buffer.shape != self.shape or buffer.dtype != self.dtype or not buffer.flags['C_CONTIGUOUS']:
+                raise ValueError(f"Letterbox buffers must be contiguous {np.dtype(self.dtype).name} "
+                                 f"{self.shape}, got {buffer.dtype} {buffer.shape}")
+        self.buffers = list(buffers)
+        self.next_buffer = 0
+        self.invalidate()
+
+    def invalidate(self):
+        """Mark every buffer's padding as stale (after something else wrote into it)"""
+        self.buffer_keys = [[None] * self.batch_size for _ in self.buffers]
+
+    def geometry(self, height: int, width: int) -> Dict:
+        """Get (and cache) the letterbox geometry for a source resolution
+
+        Returns:
+            Dictionary with scale, resized width/height, left/top padding and
+            the uint8 resize scratch buffer (None when no resize is needed)
+        """
+        key = (height, width)
+        geometry = self.geometries.get(key)
+        if geometry is None:
+            ratio = min(self.input_size / height, self.input_size / width)
+            new_w = max(1, int(round(width * ratio)))
+            new_h = max(1, int(round(height * ratio)))
+            left = (self.input_size - new_w) // 2
+            top = (self.input_size - new_h) // 2
+            scratch = None
+            if (new_h, new_w) != (height, width):
+                scratch = np.empty((new_h, new_w, 3), dtype=np.uint8)
+                self.allocations += 1
+            geometry = self.geometries[key] = {
+                'scale': ratio,
+                'width': new_w,
+                'height': new_h,
+                'left': left,
+                'top': top,
+                'scratch': scratch
+            }
+        return geometry
+
+    def __call__(self, image: np.ndarray) -> np.ndarray:
+        """Letterbox one BGR frame
+
+        Args:
+            image: HxWx3 uint8 BGR frame
+
+        Returns:
+            (1, 3, S, S) float32 RGB tensor in [0, 1], or (1, S, S, 3) uint8 BGR
+            tensor in the NHWC layout (a reused buffer; with batch_size > 1 the
+            frame is in slot 0)
+        """
+        return self.batch((image,))
+
+    def batch(self, images) -> np.ndarray:
+        """Letterbox up to batch_size BGR frames into one tensor
+
+        Args:
+            images: Sequence of HxWx3 uint8 BGR frames
+
+        Returns:
+            The whole (batch_size, ...) reused buffer; slots past len(images)
+            keep whatever they held before
+        """
+        if len(images) > self.batch_size:
+            raise ValueError(f"Got {len(images)} frames for a batch of {self.batch_size}")
+        index = self.next_buffer
+        self.next_buffer = (index + 1) % len(self.buffers)
+        tensor = self.buffers[index]
+        keys = self.buffer_keys[index]
+
+        for slot, image in enumerate(images):
+            key = image.shape[:2]
+            # Padding only changes with the geometry
+            if keys[slot] != key:
+                tensor[slot].fill(self.pad_value)
+                keys[slot] = key
+            self._write(tensor[slot], image, self.geometry(*key))
+        return tensor
+
+    def _write(self, tensor: np.ndarray, image: np.ndarray, geometry: Dict):
+        """Resize one frame into its (3, S, S) or (S, S, 3) slot"""
+        top, left = geometry['top'], geometry['left']
+        if self.layout == LAYOUT_NHWC:
+            region = tensor[top:top + geometry['height'], left:left + geometry['width']]
+            if geometry['scratch'] is None:
+                np.copyto(region, image)
+            elif region.flags['C_CONTIGUOUS']:
+                cv2.resize(image, (geometry['width'], geometry['height']),
+                           dst=region, interpolation=cv2.INTER_LINEAR)
+            else:
+                np.copyto(region, cv2.resize(image, (geometry['width'], geometry['height']),
+                                             dst=geometry['scratch'], interpolation=cv2.INTER_LINEAR))
+            self.frames += 1
+            return
+
+        resized = image
+        if geometry['scratch'] is not None:
+            resized = cv2.resize(image, (geometry['width'], geometry['height']),
+                                 dst=geometry['scratch'], interpolation=cv2.INTER_LINEAR)
+
+        region = tensor[:, top:top + geometry['height'], left:left + geometry['width']]
+        # BGR -> RGB, HWC -> CHW and uint8 -> float32 as one strided cast, then [0, 1] in place
+        np.copyto(region, resized[:, :, ::-1].transpose(2, 0, 1), casting='unsafe')
+        np.multiply(region, self.scale, out=region)
+
+        self.frames += 1
+
+    def to_source(self, boxes: np.ndarray, height: int, width: int) -> np.ndarray:
+        """Map x1, y1, x2, y2 boxes from model input space back to the source frame
+
+        Args:
+            boxes: (N, >=4) array, modified in place
+            height: Source frame height
+            width: Source frame width
+
+        Returns:
+            The same array
+        """
+        geometry = self.geometry(height, width)
+        boxes[:, [0, 2]] = ((boxes[:, [0, 2]] - geometry['left']) / geometry['scale']).clip(0, width)
+        boxes[:, [1, 3]] = ((boxes[:, [1, 3]] - geometry['top']) / geometry['scale']).clip(0, height)
+        return boxes
+
+    def get_buffer_bytes(self) -> int:
+        """Get the size of the output tensors and resize scratch buffers in bytes"""
+        scratch = sum(g['scratch'].nbytes for g in self.geometries.values() if g['scratch'] is not None)
+        return sum(buffer.nbytes for buffer in self.buffers) + scratch
+
+    def get_stats(self) -> Dict:
+        """Get cached geometries and buffer statistics"""
+        return {
+            'frames': self.frames,
+            'layout': self.layout,
+            'batch_size': self.batch_size,
+            'buffers': len(self.buffers),
+            'buffer_bytes': self.get_buffer_bytes(),
+            'allocations': self.allocations,
+            'geometries': {f"{w}x{h}": {'scale': g['scale'], 'resized': f"{g['width']}x{g['height']}",
+                                        'pad_left': g['left'], 'pad_top': g['top']}
+                           for (h, w), g in self.geometries.items()}
+        }
+
+
+def stretch_preprocess(image: np.ndarray, input_size: int, layout: str = LAYOUT_NCHW) -> np.ndarray:
+    """Legacy preprocessing: stretch to a square, allocating at every step
+
+    Args:
+        image: HxWx3 uint8 BGR frame
+        input_size: Square model input size
+        layout: LAYOUT_NCHW or LAYOUT_NHWC (resize only)
+
+    Returns:
+        (1, 3, S, S) float32 RGB tensor in [0, 1] (non-contiguous view), or
+        (1, S, S, 3) uint8 BGR tensor in the NHWC layout
+    """
+    img = cv2.resize(image, (input_size, input_size))
+    if layout == LAYOUT_NHWC:
+        return img[np.newaxis]
+    img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    img = img.astype(np.float32) / 255.0
+    img = np.transpose(img, (2, 0, 1))
+    return np.expand_dims(img, axis=0)
+
+
+def stretch_to_source(boxes: np.ndarray, height: int, width: int, input_size: int) -> np.ndarray:
+    """Map x1, y1, x2, y2 boxes from a stretched model input back to the source frame
+
+    Args:
+        boxes: (N, >=4) array, modified in place
+        height: Source frame height
+        width: Source frame width
+        input_size: Square model input size
+
+    Returns:
+        The same array
+    """
+    boxes[:, [0, 2]] *= width / input_size
+    boxes[:, [1, 3]] *= height / input_size
+    return boxes
+
+
+def measure_allocations(preprocess, image: np.ndarray) -> int:
+    """Bytes a steady-state preprocess call allocates (peak traced memory)
+
+    The first call populates any caches; the second one is measured.
+
+    Args:
+        preprocess: Callable taking a frame
+        image: Representative frame
+
+    Returns:
+        Peak bytes allocated during the call, including temporaries freed before it returns
+    """
+    import tracemalloc
+
+    preprocess(image)
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        preprocess(image)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - before)
+
+
+if __name__ == '__main__':
+    # Compare with the legacy stretch path on a 640x480 camera frame
+    import time
+
+    frame = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+    letterbox = LetterboxPreprocessor(640)
+
+    for name, fn in (('stretch', lambda image: stretch_preprocess(image, 640)),
+                     ('letterbox', letterbox),
+                     ('nhwc uint8', LetterboxPreprocessor(640, layout=LAYOUT_NHWC))):
+        allocated = measure_allocations(fn, frame)
+        start = time.perf_counter()
+        for _ in range(200):
+            fn(frame)
+        elapsed_ms = (time.perf_counter() - start) / 200 * 1000
+        print(f"{name:10s}: {elapsed_ms:.2f} ms/frame, {allocated / 1024:.0f} KB allocated/frame")
+
+    tensor = letterbox(frame)
+    print(letterbox.get_stats()['geometries'], tensor.flags['C_CONTIGUOUS'],
+          float(tensor[0, 0, 0, 0]) * 255, tensor[0, :, 80:560].max() <= 1.0)
+
+    batched = LetterboxPreprocessor(640, batch_size=4)
+    batch = batched.batch([frame, frame[:, :320], frame])
+    print(batch.shape, np.array_equal(batch[0], tensor[0]), np.array_equal(batch[2], tensor[0]),
+          float(batch[1, 0, 320, 100]) * 255)
@@ -0,0 +1,221 @@
+"""
+Background Log Writer Module
+Moves log file I/O off the benchmark loop onto a writer thread
+"""
+
+import os
+import time
+import queue
+import threading
+from typing import Callable, Dict, Optional, Union
+
+
+# Sentinel asking the writer thread to drain and exit
+_CLOSE = object()
+
+
+class LogWriter:
+    """Buffered append-only writer fed through a bounded queue
+
+    write() never blocks: records go into a bounded queue and a writer
+    thread formats them, batches them and flushes every flush_interval
+    seconds or flush_lines lines, whichever comes first. When the queue is
+    full the record is dropped and counted, so a slow disk can never stall
+    the caller. Records a run cannot do without (e.g. its final summary)
+    are written with block=True and wait for room instead.
+    """
+
+    def __init__(self, path: str, formatter: Optional[Callable[[Dict], str]] = None,
+                 queue_size: int = 4096, flush_interval: float = 1.0, flush_lines: int = 256,
+                 fsync: bool = False, name: str = 'log-writer', tracer=None):
+        """Initialize log writer
+
+        Args:
+            path: File to append to (opened on the first flush)
+            formatter: Turns a record into a line; strings are written as-is
+            queue_size: Maximum number of queued records
+            flush_interval: Maximum seconds a record waits before being flushed
+            flush_lines: Flush as soon as this many lines are batched
+            fsync: Force every flush to storage (survives power loss)
+            name: Writer thread name
+            tracer: Optional TraceRecorder receiving a span per flush
+        """
+        self.path = path
+        self.formatter = formatter
+        self.flush_interval = flush_interval
+        self.flush_lines = max(1, flush_lines)
+        self.fsync = fsync
+        self.name = name
+        self.tracer = tracer
+        self.queue = queue.Queue(maxsize=max(1, queue_size))
+
+        self.thread = None
+        self.closed = False
+        self.error: Optional[BaseException] = None
+
+        # Metrics
+        self.records = 0
+        self.dropped = 0
+        self.lines_written = 0
+        self.flushes = 0
+        self.flush_time_total = 0.0
+        self.flush_time_max = 0.0
+        self.max_queue_depth = 0
+
+    def start(self):
+        """Start writer thread"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self.thread.start()
+
+    def write(self, record: Union[str, Dict], block: bool = False) -> bool:
+        """Queue a record
+
+        Args:
+            record: Preformatted text or a record for the formatter
+            block: Wait for room in a full queue instead of dropping the record
+                   (gives up only if the writer thread has stopped)
+
+        Returns:
+            True if queued, False if dropped
+        """
+        if self.closed:
+            self.dropped += 1
+            return False
+        try:
+            if not block:
+                self.queue.put_nowait(record)
+            else:
+                while True:
+                    try:
+                        self.queue.put(record, timeout=0.1)
+                        break
+                    except queue.Full:
+                        if self.thread is None or not self.thread.is_alive():
+                            raise
+        except queue.Full:
+            self.dropped += 1
+            return False
+        self.records += 1
+        depth = self.queue.qsize()
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+        return True
+
+    def _format(self, record) -> str:
+        if isinstance(record, str):
+            return record
+        return self.formatter(record) if self.formatter else f"{record}\n"
+
+    def _run(self):
+        f = None
+        batch = []
+        deadline = None
+        try:
+            while True:
+                timeout = None if deadline is None else max(0.0, deadline - time.perf_counter())
+                try:
+                    record = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    record = None
+
+                if record is _CLOSE:
+                    # Drain whatever is left, then exit
+                    while True:
+                        try:
+                            leftover = self.queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if leftover is not _CLOSE:
+                            batch.append(self._format(leftover))
+                    break
+
+                if record is not None:
+                    batch.append(self._format(record))
+                    if deadline is None:
+                        deadline = time.perf_counter() + self.flush_interval
+
+                if batch and (len(batch) >= self.flush_lines or time.perf_counter() >= deadline):
+                    if f is None:
+                        f = open(self.path, 'a')
+                    self._flush(f, batch)
+                    batch = []
+                    deadline = None
+
+            if batch:
+                if f is None:
+                    f = open(self.path, 'a')
+                self._flush(f, batch)
+        except BaseException as e:  # Never take the benchmark down with the log
+            self.error = e
+        finally:
+            if f is not None:
+                f.close()
+
+    def _flush(self, f, batch):
+        flush_start = time.perf_counter()
+        f.write(''.join(batch))
+        f.flush()
+        if self.fsync:
+            os.fsync(f.fileno())
+        flush_end = time.perf_counter()
+        elapsed = flush_end - flush_start
+        if self.tracer is not None:
+            self.tracer.complete(f"{self.name} flush", flush_start, flush_end)
+
+        self.lines_written += len(batch)
+        self.flushes += 1
+        self.flush_time_total += elapsed
+        self.flush_time_max = max(self.flush_time_max, elapsed)
+
+    def close(self, timeout: float = 10.0):
+        """Drain the queue, flush and stop the writer thread
+
+        Args:
+            timeout: Seconds to wait for the drain
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if self.thread is not None:
+            # Blocking put is fine here: shutdown is off the hot path
+            self.queue.put(_CLOSE)
+            self.thread.join(timeout=timeout)
+
+    def get_stats(self) -> Dict:
+        """Get writer statistics
+
+        Returns:
+            Dictionary with queued, written and dropped counts and flush times
+        """
+        return {
+            'log_records': self.records,
+            'log_dropped': self.dropped,
+            'log_lines_written': self.lines_written,
+            'log_flushes': self.flushes,
+            'log_avg_flush_ms': (self.flush_time_total / self.flushes * 1000) if self.flushes else 0,
+            'log_max_flush_ms': self.flush_time_max * 1000,
+            'log_max_queue_depth': self.max_queue_depth,
+            'log_queue_size': self.queue.maxsize
+        }
+
+
+if __name__ == '__main__':
+    # Test the writer under a burst larger than its queue
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), 'writer_test.log')
+    writer = LogWriter(path, formatter=lambda r: f"frame {r['frame']}\n",
+                       queue_size=1000, flush_interval=0.5, flush_lines=100)
+    writer.start()
+
+    call_start = time.perf_counter()
+    for i in range(5000):
+        writer.write({'frame': i})
+    call_ms = (time.perf_counter() - call_start) / 5000 * 1000
+    writer.close()
+
+    with open(path) as f:
+        lines = sum(1 for _ in f)
+    print(f"write(): {call_ms * 1000:.1f} us/call")
+    print(f"Lines on disk: {lines}, stats: {writer.get_stats()}")
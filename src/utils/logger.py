@@ -4,38 +4,74 @@ Handles structured logging of benchmark results and system metrics
 """
 
 import os
-import json
+import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Optional
 from pathlib import Path
 
+from .log_writer import LogWriter
+from .op_profile import format_op_profile
+from .result_stream import ResultStreamWriter, STREAM_SUFFIX
+from .running_stats import RunningStats
+
+
+# Fields tracked by running statistics, per record type
+INFERENCE_FIELDS = ('inference_time', 'fps', 'postprocess_time', 'frame_age')
+SYSTEM_FIELDS = ('cpu_percent', 'memory_percent', 'temperature', 'cpu_freq_mhz')
+
 
 class BenchmarkLogger:
     """Logger for YOLO benchmark results"""
     
-    def __init__(self, model_name: str, log_dir: str = 'logs'):
+    def __init__(self, model_name: str, log_dir: str = 'logs', flush_interval: float = 1.0,
+                 flush_lines: int = 256, queue_size: int = 4096, tracer=None):
         """Initialize benchmark logger
         
         Args:
             model_name: Name of the model (e.g., 'yolov8', 'yolov11')
             log_dir: Base directory for logs
+            flush_interval: Seconds between text log flushes
+            flush_lines: Flush the text log as soon as this many lines are pending
+            queue_size: Pending log lines / stream records kept before new ones are dropped
+            tracer: Optional TraceRecorder receiving logging spans
         """
         self.model_name = model_name
         self.log_dir = Path(log_dir) / model_name
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
-        # Create timestamped log filename
+        # Create timestamped log filename (unique if runs start within the same second)
         timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+        base_timestamp, attempt = timestamp, 1
+        while (self.log_dir / f"{model_name}_{timestamp}.log").exists():
+            timestamp = f"{base_timestamp}_{attempt}"
+            attempt += 1
         self.log_filename = f"{model_name}_{timestamp}.log"
         self.log_path = self.log_dir / self.log_filename
         
-        self.json_filename = f"{model_name}_{timestamp}.json"
+        # Results are streamed as JSON Lines while the run progresses
+        self.json_filename = f"{model_name}_{timestamp}{STREAM_SUFFIX}"
         self.json_path = self.log_dir / self.json_filename
         
-        self.metrics_buffer: List[Dict] = []
+        # Running statistics updated on every log call (summary is O(1), memory
+        # stays flat); per-frame rows only go to the text log and results stream
+        self.running: Dict[str, RunningStats] = {
+            name: RunningStats() for name in INFERENCE_FIELDS + SYSTEM_FIELDS + ('detections',)
+        }
+        self.throttle_samples = 0
+        self.histograms: Dict[str, Dict] = {}
         self.run_config: Optional[Dict] = None
         self.summary: Optional[Dict] = None
         
+        self.tracer = tracer
+        
+        # Per-frame lines are written by a background thread
+        self.writer = LogWriter(str(self.log_path), formatter=self._format_metric,
+                                queue_size=queue_size, flush_interval=flush_interval,
+                                flush_lines=flush_lines, tracer=tracer)
+        self.stream = ResultStreamWriter(str(self.json_path), flush_interval=flush_interval,
+                                         flush_lines=flush_lines, queue_size=queue_size,
+                                         tracer=tracer)
+        
     def write_header(self, config: Dict):
         """Write benchmark configuration header
         
@@ -54,7 +90,14 @@ class BenchmarkLogger:
             f.write(f"Backend: {config.get('backend', 'ONNX Runtime')}\n")
             f.write(f"Input Source: {config.get('input_source', 'Camera')}\n")
             f.write(f"Duration: {config.get('duration_seconds', 'N/A')} seconds\n")
+            if config.get('session_settings'):
+                f.write(f"Session: {config['session_settings']}\n")
+            if config.get('sampler'):
+                f.write(f"Sampler: {config['sampler']} every {config.get('sample_interval', 1.0):g}s\n")
             f.write("=" * 80 + "\n\n")
+        
+        self.writer.start()
+        self.stream.write_header(self.model_name, config)
     
     def log_metric(self, metric_data: Dict):
         """Log a single metric entry
@@ -62,34 +105,59 @@ class BenchmarkLogger:
         Args:
             metric_data: Dictionary containing metric information
         """
-        self.metrics_buffer.append(metric_data)
+        log_start = time.perf_counter()
+        for name in INFERENCE_FIELDS:
+            self.running[name].update(metric_data.get(name))
         
-        # Write to log file
-        with open(self.log_path, 'a') as f:
-            timestamp = metric_data.get('timestamp', datetime.now().timestamp())
-            dt = datetime.fromtimestamp(timestamp)
-            
-            f.write(f"[{dt.strftime('%H:%M:%S.%f')[:-3]}] ")
-            
-            if 'fps' in metric_data:
-                f.write(f"FPS: {metric_data['fps']:.2f} | ")
-            
-            if 'inference_time' in metric_data:
-                f.write(f"Inference: {metric_data['inference_time']*1000:.1f}ms | ")
-            
-            if 'cpu_percent' in metric_data:
-                f.write(f"CPU: {metric_data['cpu_percent']:.1f}% | ")
-            
-            if 'memory_percent' in metric_data:
-                f.write(f"RAM: {metric_data['memory_percent']:.1f}% | ")
-            
-            if 'temperature' in metric_data and metric_data['temperature']:
-                f.write(f"Temp: {metric_data['temperature']:.1f}°C | ")
-            
-            if 'throttled' in metric_data and metric_data['throttled']:
-                f.write("⚠️ THROTTLED")
-            
-            f.write("\n")
+        # Formatting and file I/O happen on the writer threads
+        self.writer.write(metric_data)
+        self.stream.write('inference', metric_data)
+        if self.tracer is not None:
+            self.tracer.complete('log', log_start)
+    
+    def _format_metric(self, metric_data: Dict) -> str:
+        """Format a metric entry as one log line (runs on the writer thread)"""
+        parts = []
+        timestamp = metric_data.get('timestamp', datetime.now().timestamp())
+        dt = datetime.fromtimestamp(timestamp)
+        
+        parts.append(f"[{dt.strftime('%H:%M:%S.%f')[:-3]}] ")
+        
+        if 'fps' in metric_data:
+            parts.append(f"FPS: {metric_data['fps']:.2f} | ")
+        
+        if 'inference_time' in metric_data:
+            parts.append(f"Inference: {metric_data['inference_time']*1000:.1f}ms | ")
+        
+        if 'postprocess_time' in metric_data:
+            parts.append(f"Postprocess: {metric_data['postprocess_time']*1000:.1f}ms | ")
+        
+        if 'detections' in metric_data:
+            parts.append(f"Detections: {metric_data['detections']} | ")
+        
+        if 'frame_age' in metric_data:
+            parts.append(f"Frame Age: {metric_data['frame_age']*1000:.1f}ms | ")
+        
+        if 'dropped_frames' in metric_data:
+            parts.append(f"Dropped: {metric_data['dropped_frames']} | ")
+        
+        if 'cpu_percent' in metric_data:
+            parts.append(f"CPU: {metric_data['cpu_percent']:.1f}% | ")
+        
+        if 'memory_percent' in metric_data:
+            parts.append(f"RAM: {metric_data['memory_percent']:.1f}% | ")
+        
+        if 'temperature' in metric_data and metric_data['temperature']:
+            parts.append(f"Temp: {metric_data['temperature']:.1f}°C | ")
+        
+        if metric_data.get('cpu_freq_mhz'):
+            parts.append(f"Freq: {metric_data['cpu_freq_mhz']:.0f}MHz | ")
+        
+        if 'throttled' in metric_data and metric_data['throttled']:
+            parts.append("⚠️ THROTTLED")
+        
+        parts.append("\n")
+        return ''.join(parts)
     
     def log_system_snapshot(self, snapshot: Dict):
         """Log system monitoring snapshot
@@ -105,6 +173,9 @@ class BenchmarkLogger:
             'load_1min': snapshot['load']['load_1min']
         }
         
+        if snapshot.get('frequency'):
+            metric_data['cpu_freq_mhz'] = snapshot['frequency']['current_mhz']
+        
         if snapshot.get('throttling'):
             throttle = snapshot['throttling']
             metric_data['throttled'] = (
@@ -112,15 +183,25 @@ class BenchmarkLogger:
                 throttle.get('under_voltage_now', False)
             )
         
-        self.metrics_buffer.append(metric_data)
+        for name in SYSTEM_FIELDS:
+            self.running[name].update(metric_data.get(name))
+        if metric_data.get('throttled'):
+            self.throttle_samples += 1
+        self.stream.write('system', metric_data)
     
-    def log_inference(self, frame_num: int, inference_time: float, fps: float):
+    def log_inference(self, frame_num: int, inference_time: float, fps: float,
+                      postprocess_time: Optional[float] = None, detections: Optional[int] = None,
+                      frame_age: Optional[float] = None, dropped_frames: Optional[int] = None):
         """Log inference results
         
         Args:
             frame_num: Frame number
             inference_time: Inference time in seconds
             fps: Current FPS
+            postprocess_time: Decode + NMS time in seconds
+            detections: Number of detections in this frame
+            frame_age: Seconds between capture and inference of this frame
+            dropped_frames: Frames dropped by the capture buffer so far
         """
         metric_data = {
             'timestamp': datetime.now().timestamp(),
@@ -128,14 +209,97 @@ class BenchmarkLogger:
             'inference_time': inference_time,
             'fps': fps
         }
+        if postprocess_time is not None:
+            metric_data['postprocess_time'] = postprocess_time
+        if detections is not None:
+            metric_data['detections'] = detections
+        if frame_age is not None:
+            metric_data['frame_age'] = frame_age
+        if dropped_frames is not None:
+            metric_data['dropped_frames'] = dropped_frames
         self.log_metric(metric_data)
     
+    def log_pipeline_stats(self, stage_stats: Dict):
+        """Log per-stage throughput and queue depth of a pipelined run
+        
+        Args:
+            stage_stats: Stage metrics from StagedPipeline.get_stats()
+        """
+        dt = datetime.now()
+        stages = ' | '.join(
+            f"{name}: {st['throughput_fps']:.1f}fps q={st['avg_queue_depth']:.1f}"
+            for name, st in stage_stats.items()
+        )
+        self.writer.write(f"[{dt.strftime('%H:%M:%S.%f')[:-3]}] Stages: {stages}\n")
+    
+    def log_histograms(self, histograms: Dict):
+        """Attach per-stage latency histograms to the JSON output
+        
+        Args:
+            histograms: Mapping of stage name to LatencyHistogram
+        """
+        self.histograms = {stage: hist.to_dict() for stage, hist in histograms.items() if hist.count}
+        self.stream.write('histograms', {'histograms': self.histograms}, required=True)
+    
+    def get_running_summary(self) -> Dict:
+        """Get running statistics of every tracked field (constant time)
+        
+        Returns:
+            Dictionary mapping field name to count/mean/std/min/max/p50/p95
+        """
+        return {name: stats.to_dict() for name, stats in self.running.items()}
+    
+    def log_live_summary(self, live: Dict):
+        """Write a periodic mid-run summary to the text log and results stream
+        
+        Args:
+            live: Live summary from the benchmark runner
+        """
+        dt = datetime.now()
+        line = (f"[{dt.strftime('%H:%M:%S.%f')[:-3]}] Live: {live['frames']} frames in "
+                f"{live['elapsed_s']:.0f}s | FPS: {live['avg_fps']:.2f} | Inference p50/p99: "
+                f"{live['p50_inference_ms']:.1f}/{live['p99_inference_ms']:.1f}ms | "
+                f"CPU: {live['avg_cpu']:.1f}%")
+        if live.get('max_temperature'):
+            line += f" | Temp: {live['max_temperature']:.1f}°C max"
+        self.writer.write(line + "\n")
+        self.stream.write('live_summary', {'summary': live})
+    
+    def log_thermal_plateau(self, elapsed_s: float, frame_num: int, temperature: float, slope: float):
+        """Mark the point where the run reached thermal steady state
+        
+        Args:
+            elapsed_s: Seconds since the measured run started
+            frame_num: Frames completed at the plateau
+            temperature: Mean temperature over the detection window (°C)
+            slope: Fitted temperature slope (°C/min)
+        """
+        dt = datetime.now()
+        self.writer.write(f"[{dt.strftime('%H:%M:%S.%f')[:-3]}] Thermal plateau after {elapsed_s:.0f}s "
+                          f"(frame {frame_num}): {temperature:.1f}°C, slope {slope:+.2f}°C/min\n")
+        self.stream.write('thermal_plateau', {'elapsed_s': elapsed_s, 'frame': frame_num,
+                                              'temperature': temperature, 'slope_c_per_min': slope})
+    
+    def log_detections(self, frame_num: int, count: int):
+        """Record the detection count of every frame
+        
+        Args:
+            frame_num: Frame number (1-based)
+            count: Number of detections after NMS
+        """
+        self.running['detections'].update(count)
+        self.stream.write_detection(frame_num, count)
+    
     def write_summary(self, summary_data: Dict):
         """Write benchmark summary
         
         Args:
             summary_data: Summary statistics
         """
+        # Drain per-frame lines first so the summary comes last
+        self.close()
+        summary_data.update(self.writer.get_stats())
+        summary_data['results_stream_dropped'] = self.stream.writer.dropped
         self.summary = summary_data
         
         with open(self.log_path, 'a') as f:
@@ -146,48 +310,206 @@ class BenchmarkLogger:
             
             f.write("Performance Metrics:\n")
             f.write(f"  Total Frames: {summary_data.get('total_frames', 0)}\n")
+            if 'elapsed_s' in summary_data:
+                f.write(f"  Measured Time: {summary_data['elapsed_s']:.2f}s (timed loop only)\n")
             f.write(f"  Average FPS: {summary_data.get('avg_fps', 0):.2f}\n")
             f.write(f"  Min FPS: {summary_data.get('min_fps', 0):.2f}\n")
             f.write(f"  Max FPS: {summary_data.get('max_fps', 0):.2f}\n")
             f.write(f"  Avg Inference Time: {summary_data.get('avg_inference_ms', 0):.1f}ms\n")
             f.write(f"  Min Inference Time: {summary_data.get('min_inference_ms', 0):.1f}ms\n")
-            f.write(f"  Max Inference Time: {summary_data.get('max_inference_ms', 0):.1f}ms\n\n")
+            f.write(f"  Max Inference Time: {summary_data.get('max_inference_ms', 0):.1f}ms\n")
+            
+            if 'avg_postprocess_ms' in summary_data:
+                f.write(f"  Avg Postprocess Time: {summary_data['avg_postprocess_ms']:.1f}ms\n")
+                f.write(f"  Max Postprocess Time: {summary_data.get('max_postprocess_ms', 0):.1f}ms\n")
+                f.write(f"  Avg Detections/Frame: {summary_data.get('avg_detections', 0):.1f}\n")
+                f.write(f"  Max Detections/Frame: {summary_data.get('max_detections', 0)}\n")
+            
+            if 'allocations_per_frame' in summary_data:
+                mode = 'IOBinding' if summary_data.get('io_binding') else 'session.run'
+                f.write(f"  Allocations/Frame: {summary_data['allocations_per_frame']:.2f} ({mode})\n")
+            
+            if summary_data.get('preprocess_alloc_bytes_per_frame') is not None:
+                preprocess = (summary_data.get('latency') or {}).get('preprocess', {})
+                f.write(f"  Preprocess: {summary_data.get('preprocess')}, "
+                        f"{preprocess.get('mean_ms', 0):.2f}ms avg, "
+                        f"{summary_data['preprocess_alloc_bytes_per_frame'] / 1024:.0f} KB allocated/frame")
+                if summary_data.get('letterbox'):
+                    f.write(f" ({summary_data['letterbox']['buffer_bytes'] / (1024 * 1024):.1f} MB preallocated)")
+                f.write("\n")
+            
+            if summary_data.get('model_load_ms') is not None:
+                f.write(f"  Model Load: {summary_data['model_load_ms']:.0f}ms "
+                        f"(cache: {summary_data.get('model_cache', 'N/A')})\n")
+                if summary_data.get('startup_cold_ms') is not None:
+                    f.write(f"  Startup Cold (cache miss): {summary_data['startup_cold_ms']:.0f}ms\n")
+                if summary_data.get('startup_warm_ms') is not None:
+                    f.write(f"  Startup Warm (cache hit): {summary_data['startup_warm_ms']:.0f}ms\n")
+            f.write("\n")
+            
+            if summary_data.get('latency'):
+                f.write("Latency Percentiles (every frame):\n")
+                f.write(f"  {'Stage':12s} {'Count':>7s} {'Mean':>8s} {'p50':>8s} {'p95':>8s} "
+                        f"{'p99':>8s} {'p99.9':>8s} {'Max':>8s}\n")
+                for stage, lat in summary_data['latency'].items():
+                    f.write(f"  {stage:12s} {lat['count']:7d} {lat['mean_ms']:6.1f}ms {lat['p50_ms']:6.1f}ms "
+                            f"{lat['p95_ms']:6.1f}ms {lat['p99_ms']:6.1f}ms {lat['p999_ms']:6.1f}ms "
+                            f"{lat['max_ms']:6.1f}ms\n")
+                f.write("\n")
+            
+            if 'drop_policy' in summary_data:
+                f.write("Capture Metrics:\n")
+                f.write(f"  Policy: {summary_data['drop_policy']}\n")
+                if 'frames_captured' in summary_data:
+                    f.write(f"  Frames Captured: {summary_data['frames_captured']}\n")
+                f.write(f"  Frames Dropped: {summary_data.get('frames_dropped', 0)}\n")
+                f.write(f"  Avg Frame Age: {summary_data.get('avg_frame_age_ms', 0):.1f}ms\n")
+                f.write(f"  Max Frame Age: {summary_data.get('max_frame_age_ms', 0):.1f}ms\n")
+                if 'avg_e2e_latency_ms' in summary_data:
+                    f.write(f"  Avg End-to-End Latency: {summary_data['avg_e2e_latency_ms']:.1f}ms\n")
+                f.write("\n")
+            
+            if summary_data.get('batch'):
+                batch = summary_data['batch']
+                f.write("Batched Inference:\n")
+                f.write(f"  Batch Size: {batch['batch_size']} ({batch['batches']} batches, "
+                        f"{batch['partial_batches']} partial)\n")
+                f.write(f"  Throughput: {batch['throughput_fps']:.2f} FPS "
+                        f"({batch['frames']} frames in {batch['elapsed_s']:.2f}s)\n")
+                f.write(f"  Batch Inference: {batch['avg_batch_inference_ms']:.1f}ms avg, "
+                        f"{batch['p50_batch_inference_ms']:.1f}ms p50\n")
+                if batch.get('p50_frame_latency_ms') is not None:
+                    f.write(f"  Frame Latency: {batch['p50_frame_latency_ms']:.1f}ms p50, "
+                            f"{batch['p99_frame_latency_ms']:.1f}ms p99 (capture to detections)\n")
+                f.write("\n")
+            
+            if summary_data.get('worker_pool'):
+                pool = summary_data['worker_pool']
+                f.write("Worker Pool:\n")
+                f.write(f"  Workers: {pool['workers']} x {pool['threads_per_worker']} threads "
+                        f"({pool['session_settings']})\n")
+                f.write(f"  Frames per Worker: {', '.join(map(str, pool['worker_frames']))}\n")
+                f.write(f"  Max Reorder Depth: {pool['max_reorder_depth']}, "
+                        f"Avg Submit Wait: {pool['avg_submit_wait_ms']:.1f}ms\n")
+                f.write(f"  Worker CPU: {pool['worker_cpu_s']:.1f}s")
+                if pool.get('worker_peak_rss_mb') is not None:
+                    f.write(f", Peak RSS per Worker: {pool['worker_peak_rss_mb']:.0f}MB")
+                f.write(f", Startup: {pool['startup_s']:.1f}s\n\n")
+            
+            if summary_data.get('shm_ring'):
+                ring = summary_data['shm_ring']
+                f.write("Shared-Memory Capture:\n")
+                f.write(f"  Ring: {ring['slots']} slots x {ring['slot_mb']:.2f}MB ({ring['policy']})\n")
+                f.write(f"  Frames Written: {ring['frames_written']}, Read: {ring['frames_read']}, "
+                        f"Dropped: {ring['frames_dropped']}, Overruns: {ring['overruns']}, "
+                        f"Torn: {ring['torn_frames']}\n")
+                f.write(f"  Writer Slot Waits: {ring['writer_slot_waits']} "
+                        f"(avg {ring['avg_writer_wait_ms']:.2f}ms, max {ring['max_writer_wait_ms']:.1f}ms)\n")
+                f.write(f"  Reader Waits: {ring['reader_waits']} "
+                        f"(avg {ring['avg_reader_wait_ms']:.2f}ms, max {ring['max_reader_wait_ms']:.1f}ms)\n")
+                f.write(f"  Capture: {ring['avg_capture_ms']:.2f}ms/frame, CPU {ring['capture_cpu_s']:.1f}s")
+                if ring['frames_resized']:
+                    f.write(f", Resized: {ring['frames_resized']}")
+                f.write("\n\n")
+            
+            if summary_data.get('pipeline_stages'):
+                f.write("Pipeline Stages:\n")
+                f.write(f"  {'Stage':12s} {'FPS':>7s} {'Busy/Item':>10s} {'Util':>6s} "
+                        f"{'Wait In':>8s} {'Wait Out':>9s} {'Avg Q':>6s} {'Max Q':>6s}\n")
+                for name, st in summary_data['pipeline_stages'].items():
+                    f.write(f"  {name:12s} {st['throughput_fps']:7.2f} {st['busy_ms_per_item']:8.1f}ms "
+                            f"{st['utilization']*100:5.0f}% {st['wait_in_s']:7.1f}s {st['wait_out_s']:8.1f}s "
+                            f"{st['avg_queue_depth']:6.2f} {st['max_queue_depth']:6d}\n")
+                f.write("\n")
+            
+            if summary_data.get('op_profile'):
+                f.write("Operator Profile (ONNX Runtime, warm-up excluded):\n")
+                for line in format_op_profile(summary_data['op_profile'], top=20):
+                    f.write(f"  {line}\n" if line else "\n")
+                f.write("\n")
             
             f.write("System Metrics:\n")
             f.write(f"  Avg CPU: {summary_data.get('avg_cpu', 0):.1f}%\n")
             f.write(f"  Max CPU: {summary_data.get('max_cpu', 0):.1f}%\n")
             f.write(f"  Avg RAM: {summary_data.get('avg_memory', 0):.1f}%\n")
             f.write(f"  Max RAM: {summary_data.get('max_memory', 0):.1f}%\n")
+            if summary_data.get('peak_rss_mb'):
+                f.write(f"  Peak RSS: {summary_data['peak_rss_mb']:.0f} MB\n")
+            if 'cpu_ms_per_frame' in summary_data:
+                f.write(f"  Process CPU: {summary_data['cpu_ms_per_frame']:.1f}ms/frame "
+                        f"({summary_data['process_cpu_s']:.1f}s total)\n")
             
             if summary_data.get('avg_temperature'):
                 f.write(f"  Avg Temperature: {summary_data['avg_temperature']:.1f}°C\n")
                 f.write(f"  Max Temperature: {summary_data.get('max_temperature', 0):.1f}°C\n")
                 f.write(f"  Temperature Rise: {summary_data.get('temp_rise', 0):.1f}°C\n")
             
+            thermal = summary_data.get('thermal')
+            if thermal:
+                if thermal.get('cooldown') and thermal['cooldown'].get('reached') is not None:
+                    cooldown = thermal['cooldown']
+                    f.write(f"  Cool-down: {cooldown['start_c']:.1f}°C -> {cooldown['end_c']:.1f}°C "
+                            f"in {cooldown['waited_s']:.0f}s (target {cooldown['target_c']:.1f}°C"
+                            f"{'' if cooldown['reached'] else ', timed out'})\n")
+                if thermal.get('start_temperature') is not None:
+                    f.write(f"  Start Temperature: {thermal['start_temperature']:.1f}°C\n")
+                if thermal['plateau_reached']:
+                    f.write(f"  Thermal Plateau: after {thermal['plateau_elapsed_s']:.0f}s at "
+                            f"{thermal['plateau_temperature']:.1f}°C\n")
+                elif thermal.get('start_temperature') is not None:
+                    f.write(f"  Thermal Plateau: not reached (run longer for sustained figures)\n")
+                for phase in ('burst', 'sustained'):
+                    if thermal.get(phase):
+                        stats = thermal[phase]
+                        f.write(f"  {phase.capitalize():9s}: {stats['fps']:.2f} FPS, inference p50/p99 "
+                                f"{stats['p50_inference_ms']:.1f}/{stats['p99_inference_ms']:.1f}ms "
+                                f"({stats['frames']} frames in {stats['duration_s']:.0f}s)\n")
+            
+            if summary_data.get('avg_cpu_freq_mhz'):
+                f.write(f"  Avg CPU Freq: {summary_data['avg_cpu_freq_mhz']:.0f} MHz "
+                        f"(min {summary_data.get('min_cpu_freq_mhz', 0):.0f} MHz)\n")
+            
+            if summary_data.get('sampler_samples'):
+                f.write(f"  Sampler ({summary_data['sampler']}): "
+                        f"{summary_data['sampler_cpu_ms_per_sample']:.2f}ms CPU, "
+                        f"{summary_data['sampler_wall_ms_per_sample']:.2f}ms wall per sample "
+                        f"({summary_data.get('sampler_cpu_percent', 0):.2f}% of one core)\n")
+            
+            f.write(f"  Log Writer: {summary_data['log_lines_written']} lines in "
+                    f"{summary_data['log_flushes']} flushes "
+                    f"(avg {summary_data['log_avg_flush_ms']:.2f}ms, max {summary_data['log_max_flush_ms']:.2f}ms), "
+                    f"max queue {summary_data['log_max_queue_depth']}/{summary_data['log_queue_size']}, "
+                    f"{summary_data['log_dropped']} dropped\n")
+            
             if summary_data.get('throttle_events', 0) > 0:
                 f.write(f"\n  ⚠️  Throttling Events: {summary_data['throttle_events']}\n")
             
             f.write("\n" + "=" * 80 + "\n")
     
     def save_json(self):
-        """Save complete benchmark data as JSON"""
-        data = {
-            'model': self.model_name,
-            'timestamp': datetime.now().isoformat(),
-            'config': self.run_config,
-            'metrics': self.metrics_buffer,
-            'summary': self.summary
-        }
+        """Finish the results stream with the summary record
         
-        with open(self.json_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        Everything else was streamed during the run; use
+        utils.result_stream.read_result_stream() to rebuild the full JSON.
+        """
+        self.stream.flush_detections()
+        self.stream.write('summary', {'summary': self.summary}, required=True)
+        self.stream.close()
+        if self.stream.writer.error is not None:
+            ConsoleLogger.warning(f"Results stream failed: {self.stream.writer.error}")
+    
+    def close(self):
+        """Drain and stop the background log writer"""
+        self.writer.close()
+        if self.writer.error is not None:
+            ConsoleLogger.warning(f"Log writer failed: {self.writer.error}")
     
     def get_log_path(self) -> str:
         """Get the path to the current log file"""
         return str(self.log_path)
     
     def get_json_path(self) -> str:
-        """Get the path to the current JSON file"""
+        """Get the path to the current results stream (JSON Lines)"""
         return str(self.json_path)
 
 
@@ -221,7 +543,7 @@ class ConsoleLogger:
 
 
 if __name__ == '__main__':
-    # Test the logger
+    # Write a test log and results stream: python3 -m utils.logger (from src/)
     logger = BenchmarkLogger('test_model')
     
     config = {
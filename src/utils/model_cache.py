@@ -0,0 +1,155 @@
+"""
+Optimized Model Cache for ONNX Runtime
+Stores graph-optimized models on disk so later sessions skip graph optimization
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import onnxruntime as ort
+
+from .autotune import file_hash, get_cpu_model
+
+
+DEFAULT_CACHE_DIR = 'models/.cache'
+
+
+class OptimizedModelCache:
+    """On-disk cache of graph-optimized ONNX models
+
+    Entries are keyed by model file hash, onnxruntime version, optimization
+    level and CPU (ORT_ENABLE_ALL may apply hardware-specific layouts). Any
+    other cached entry for the same model name is stale and gets removed.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR,
+                 optimization_level=ort.GraphOptimizationLevel.ORT_ENABLE_ALL):
+        """Initialize model cache
+
+        Args:
+            cache_dir: Directory for optimized models
+            optimization_level: Graph optimization level used for cached models
+        """
+        self.cache_dir = Path(cache_dir)
+        self.optimization_level = optimization_level
+        self.level_name = str(optimization_level).split('.')[-1]
+
+    def make_key(self, model_path: str) -> str:
+        """Build the cache key for a model
+
+        Args:
+            model_path: Path to ONNX model
+
+        Returns:
+            Cache key (safe to use in a filename)
+        """
+        cpu_tag = hashlib.sha256(get_cpu_model().encode()).hexdigest()[:8]
+        return f"{file_hash(model_path)[:16]}_ort{ort.__version__}_{self.level_name}_{cpu_tag}"
+
+    def entry_path(self, model_path: str) -> Path:
+        """Get the cached optimized model path for a model"""
+        return self.cache_dir / f"{Path(model_path).stem}_{self.make_key(model_path)}.onnx"
+
+    def _manifest_path(self, entry: Path) -> Path:
+        return entry.with_suffix('.json')
+
+    def _read_manifest(self, entry: Path) -> Dict:
+        try:
+            with open(self._manifest_path(entry), 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_manifest(self, entry: Path, manifest: Dict):
+        with open(self._manifest_path(entry), 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+    def invalidate_stale(self, model_path: str) -> List[str]:
+        """Remove cached entries of this model that no longer match its key
+
+        Args:
+            model_path: Path to ONNX model
+
+        Returns:
+            List of removed files
+        """
+        if not self.cache_dir.exists():
+            return []
+
+        current = self.entry_path(model_path)
+        # Only entries of this exact model name (not e.g. 'yolov8n_int8' for 'yolov8n')
+        pattern = re.compile(re.escape(Path(model_path).stem) + r'_[0-9a-f]{16}_ort')
+        removed = []
+        for path in self.cache_dir.glob(f"{Path(model_path).stem}_*"):
+            if path.stem == current.stem or not pattern.match(path.name):
+                continue
+            path.unlink()
+            removed.append(str(path))
+        return removed
+
+    def create_session(self, model_path: str, sess_options: ort.SessionOptions,
+                       providers: List[str]) -> Tuple[ort.InferenceSession, Dict]:
+        """Create a session, using or populating the optimized model cache
+
+        Args:
+            model_path: Path to the raw ONNX model
+            sess_options: Session options (optimization level is set here)
+            providers: Execution providers
+
+        Returns:
+            Tuple of (session, startup info)
+        """
+        self.invalidate_stale(model_path)
+        entry = self.entry_path(model_path)
+
+        if entry.exists():
+            # Already optimized: skip the optimizer on load
+            sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+
+            start = time.perf_counter()
+            session = ort.InferenceSession(str(entry), sess_options=sess_options, providers=providers)
+            load_ms = (time.perf_counter() - start) * 1000
+
+            manifest = self._read_manifest(entry)
+            return session, {
+                'model_cache': 'hit',
+                'model_load_ms': load_ms,
+                'startup_cold_ms': manifest.get('cold_load_ms'),
+                'startup_warm_ms': load_ms,
+                'cache_path': str(entry)
+            }
+
+        # Cache miss: optimize the raw model and write the result next to the cache
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_entry = entry.with_name(entry.name + '.tmp')
+        sess_options.graph_optimization_level = self.optimization_level
+        sess_options.optimized_model_filepath = str(tmp_entry)
+
+        start = time.perf_counter()
+        session = ort.InferenceSession(model_path, sess_options=sess_options, providers=providers)
+        load_ms = (time.perf_counter() - start) * 1000
+
+        if tmp_entry.exists():
+            os.replace(tmp_entry, entry)
+            self._write_manifest(entry, {
+                'source_model': str(model_path),
+                'onnxruntime_version': ort.__version__,
+                'optimization_level': self.level_name,
+                'cpu_model': get_cpu_model(),
+                'cold_load_ms': load_ms,
+                'created': datetime.now().isoformat()
+            })
+
+        return session, {
+            'model_cache': 'miss',
+            'model_load_ms': load_ms,
+            'startup_cold_ms': load_ms,
+            'startup_warm_ms': None,
+            'cache_path': str(entry)
+        }
@@ -3,19 +3,51 @@ System Monitoring Module for Raspberry Pi 4B
 Tracks CPU usage, RAM, temperature, and throttling status
 """
 
+import os
+import glob
 import psutil
 import subprocess
 import time
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+
+def decode_throttled(throttled_value: int) -> Dict:
+    """Decode the firmware get_throttled bit field
+    
+    Args:
+        throttled_value: Raw throttled value
+        
+    Returns:
+        Dictionary with throttling flags
+    """
+    return {
+        'raw_value': hex(throttled_value),
+        'under_voltage_now': bool(throttled_value & 0x1),
+        'freq_capped_now': bool(throttled_value & 0x2),
+        'throttled_now': bool(throttled_value & 0x4),
+        'soft_temp_limit_now': bool(throttled_value & 0x8),
+        'under_voltage_occurred': bool(throttled_value & 0x10000),
+        'freq_capped_occurred': bool(throttled_value & 0x20000),
+        'throttled_occurred': bool(throttled_value & 0x40000),
+        'soft_temp_limit_occurred': bool(throttled_value & 0x80000)
+    }
 
 
 class SystemMonitor:
     """Monitor system resources on Raspberry Pi"""
     
+    name = 'legacy'
+    
     def __init__(self):
         self.is_raspberry_pi = self._check_raspberry_pi()
         self.initial_temp = self.get_cpu_temp() if self.is_raspberry_pi else None
         
+        # Cost of sampling itself (see sample())
+        self.sample_count = 0
+        self.sample_cpu_time = 0.0
+        self.sample_wall_time = 0.0
+        self.sample_wall_max = 0.0
+        
     def _check_raspberry_pi(self) -> bool:
         """Check if running on Raspberry Pi"""
         try:
@@ -112,19 +144,7 @@ class SystemMonitor:
             if result.returncode == 0:
                 # Output format: throttled=0x0
                 throttled_hex = result.stdout.strip().split('=')[1]
-                throttled_value = int(throttled_hex, 16)
-                
-                return {
-                    'raw_value': throttled_hex,
-                    'under_voltage_now': bool(throttled_value & 0x1),
-                    'freq_capped_now': bool(throttled_value & 0x2),
-                    'throttled_now': bool(throttled_value & 0x4),
-                    'soft_temp_limit_now': bool(throttled_value & 0x8),
-                    'under_voltage_occurred': bool(throttled_value & 0x10000),
-                    'freq_capped_occurred': bool(throttled_value & 0x20000),
-                    'throttled_occurred': bool(throttled_value & 0x40000),
-                    'soft_temp_limit_occurred': bool(throttled_value & 0x80000)
-                }
+                return decode_throttled(int(throttled_hex, 16))
         except (FileNotFoundError, subprocess.TimeoutExpired, IndexError, ValueError):
             return None
     
@@ -144,6 +164,17 @@ class SystemMonitor:
             'load_1min_percent': (load1 / cpu_count) * 100 if cpu_count else 0
         }
     
+    def get_cpu_freq(self) -> Optional[Dict]:
+        """Get current CPU frequency
+        
+        Returns:
+            Dictionary with current/max frequency in MHz or None if unavailable
+        """
+        freq = psutil.cpu_freq()
+        if freq is None:
+            return None
+        return {'current_mhz': freq.current, 'max_mhz': freq.max}
+    
     def get_full_snapshot(self) -> Dict:
         """Get complete system snapshot
         
@@ -156,11 +187,65 @@ class SystemMonitor:
             'memory': self.get_memory_usage(),
             'load': self.get_system_load(),
             'temperature': self.get_cpu_temp(),
+            'frequency': self.get_cpu_freq(),
             'throttling': self.get_throttling_status()
         }
         
         return snapshot
     
+    def sample(self) -> Dict:
+        """Take a snapshot and account for its own cost
+        
+        CPU cost is the sampling thread's CPU time plus any CPU time spent in
+        child processes (vcgencmd) during the snapshot.
+        
+        Returns:
+            System snapshot
+        """
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        children_start = os.times()
+        
+        snapshot = self.get_full_snapshot()
+        
+        children_end = os.times()
+        cpu_time = time.thread_time() - cpu_start
+        cpu_time += ((children_end.children_user - children_start.children_user) +
+                     (children_end.children_system - children_start.children_system))
+        wall_time = time.perf_counter() - wall_start
+        
+        self.sample_count += 1
+        self.sample_cpu_time += cpu_time
+        self.sample_wall_time += wall_time
+        self.sample_wall_max = max(self.sample_wall_max, wall_time)
+        return snapshot
+    
+    def get_sampler_stats(self, interval: Optional[float] = None) -> Dict:
+        """Get the sampler's own overhead
+        
+        Args:
+            interval: Sampling interval in seconds, to express cost as CPU share
+            
+        Returns:
+            Dictionary with per-sample CPU and wall time
+        """
+        cpu_ms = (self.sample_cpu_time / self.sample_count * 1000) if self.sample_count else 0
+        stats = {
+            'sampler': self.name,
+            'sampler_samples': self.sample_count,
+            'sampler_cpu_ms_per_sample': cpu_ms,
+            'sampler_wall_ms_per_sample': (self.sample_wall_time / self.sample_count * 1000)
+                                          if self.sample_count else 0,
+            'sampler_max_wall_ms': self.sample_wall_max * 1000
+        }
+        if interval:
+            stats['sampler_interval_s'] = interval
+            stats['sampler_cpu_percent'] = cpu_ms / (interval * 1000) * 100
+        return stats
+    
+    def close(self):
+        """Release the monitor's resources (psutil and vcgencmd keep none open)"""
+    
     def format_snapshot(self, snapshot: Dict) -> str:
         """Format snapshot as human-readable string
         
@@ -183,6 +268,9 @@ class SystemMonitor:
         if snapshot['temperature']:
             lines.append(f"Temp: {snapshot['temperature']:.1f}°C")
         
+        if snapshot.get('frequency'):
+            lines.append(f"Freq: {snapshot['frequency']['current_mhz']:.0f} MHz")
+        
         load = snapshot['load']
         lines.append(f"Load: {load['load_1min']:.2f} ({load['load_1min_percent']:.0f}%)")
         
@@ -194,14 +282,228 @@ class SystemMonitor:
         return '\n'.join(lines)
 
 
+class SysfsMonitor(SystemMonitor):
+    """Low-overhead monitor reading /proc and sysfs directly
+    
+    Never spawns processes and never blocks: CPU usage is the delta of
+    /proc/stat between consecutive samples, temperature, frequency and
+    throttle state come from sysfs files kept open and re-read with pread.
+    """
+    
+    name = 'sysfs'
+    
+    THERMAL_ZONE_GLOB = '/sys/class/thermal/thermal_zone*'
+    CPUFREQ_GLOB = '/sys/devices/system/cpu/cpu[0-9]*/cpufreq'
+    # Exposed by the Raspberry Pi firmware driver (same bits as vcgencmd get_throttled)
+    THROTTLED_PATHS = ('/sys/devices/platform/soc/soc:firmware/get_throttled',
+                       '/sys/devices/platform/soc:firmware/get_throttled')
+    
+    def __init__(self):
+        self.is_raspberry_pi = self._check_raspberry_pi()
+        self.cpu_count = os.cpu_count() or 1
+        
+        self.stat_fd = self._open('/proc/stat')
+        self.meminfo_fd = self._open('/proc/meminfo')
+        self.loadavg_fd = self._open('/proc/loadavg')
+        self.temp_fd = self._open(self._find_thermal_zone())
+        self.freq_fds = [self._open(os.path.join(path, 'scaling_cur_freq'))
+                         for path in sorted(glob.glob(self.CPUFREQ_GLOB))]
+        self.freq_fds = [fd for fd in self.freq_fds if fd is not None]
+        self.max_freq_mhz = self._read_max_freq()
+        self.throttled_fd = None
+        for path in self.THROTTLED_PATHS:
+            self.throttled_fd = self._open(path)
+            if self.throttled_fd is not None:
+                break
+        
+        # Baseline for CPU usage deltas
+        self.prev_cpu_times = self._read_cpu_times()
+        
+        self.initial_temp = self.get_cpu_temp()
+        
+        self.sample_count = 0
+        self.sample_cpu_time = 0.0
+        self.sample_wall_time = 0.0
+        self.sample_wall_max = 0.0
+    
+    @staticmethod
+    def _open(path: Optional[str]) -> Optional[int]:
+        if not path:
+            return None
+        try:
+            return os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _read(fd: Optional[int], size: int = 4096) -> Optional[str]:
+        if fd is None:
+            return None
+        try:
+            return os.pread(fd, size, 0).decode('ascii', 'replace')
+        except OSError:
+            return None
+    
+    def _find_thermal_zone(self) -> Optional[str]:
+        """Prefer the CPU thermal zone, fall back to the first one"""
+        zones = sorted(glob.glob(self.THERMAL_ZONE_GLOB))
+        for zone in zones:
+            try:
+                with open(os.path.join(zone, 'type'), 'r') as f:
+                    if 'cpu' in f.read().lower():
+                        return os.path.join(zone, 'temp')
+            except OSError:
+                continue
+        return os.path.join(zones[0], 'temp') if zones else None
+    
+    def _read_max_freq(self) -> Optional[float]:
+        paths = sorted(glob.glob(os.path.join(self.CPUFREQ_GLOB, 'cpuinfo_max_freq')))
+        if not paths:
+            return None
+        try:
+            with open(paths[0], 'r') as f:
+                return int(f.read().strip()) / 1000.0
+        except (OSError, ValueError):
+            return None
+    
+    def _read_cpu_times(self) -> List[List[int]]:
+        """Read (busy, total) jiffies for overall CPU followed by each core"""
+        text = self._read(self.stat_fd, 8192) or ''
+        times = []
+        for line in text.splitlines():
+            if not line.startswith('cpu'):
+                break
+            fields = [int(v) for v in line.split()[1:]]
+            # idle + iowait are not busy time
+            idle = fields[3] + (fields[4] if len(fields) > 4 else 0)
+            total = sum(fields[:8])
+            times.append([total - idle, total])
+        return times
+    
+    def get_cpu_percent(self, per_core: bool = True) -> Dict:
+        """Get CPU usage since the previous sample (non-blocking)"""
+        current = self._read_cpu_times()
+        usage = []
+        for (busy, total), (prev_busy, prev_total) in zip(current, self.prev_cpu_times):
+            delta_total = total - prev_total
+            usage.append((busy - prev_busy) / delta_total * 100 if delta_total > 0 else 0.0)
+        self.prev_cpu_times = current
+        
+        if not usage:
+            return {'overall': 0.0, 'cores': [], 'core_count': 0} if per_core else {'overall': 0.0}
+        if per_core:
+            return {
+                'overall': usage[0],
+                'cores': usage[1:],
+                'core_count': len(usage) - 1
+            }
+        return {'overall': usage[0]}
+    
+    def get_memory_usage(self) -> Dict:
+        """Get RAM usage from /proc/meminfo"""
+        info = {}
+        for line in (self._read(self.meminfo_fd) or '').splitlines():
+            key, _, value = line.partition(':')
+            if key in ('MemTotal', 'MemAvailable'):
+                info[key] = int(value.split()[0]) / 1024.0
+        total = info.get('MemTotal', 0.0)
+        available = info.get('MemAvailable', 0.0)
+        return {
+            'total_mb': total,
+            'used_mb': total - available,
+            'available_mb': available,
+            'percent': ((total - available) / total * 100) if total else 0.0
+        }
+    
+    def get_system_load(self) -> Dict:
+        """Get load averages from /proc/loadavg"""
+        fields = (self._read(self.loadavg_fd) or '0 0 0').split()
+        load1, load5, load15 = (float(v) for v in fields[:3])
+        return {
+            'load_1min': load1,
+            'load_5min': load5,
+            'load_15min': load15,
+            'load_1min_percent': (load1 / self.cpu_count) * 100
+        }
+    
+    def get_cpu_temp(self) -> Optional[float]:
+        """Get CPU temperature from the thermal zone"""
+        text = self._read(self.temp_fd, 32)
+        try:
+            return int(text.strip()) / 1000.0 if text else None
+        except ValueError:
+            return None
+    
+    def get_cpu_freq(self) -> Optional[Dict]:
+        """Get average current frequency across cores from cpufreq"""
+        values = []
+        for fd in self.freq_fds:
+            text = self._read(fd, 32)
+            try:
+                values.append(int(text.strip()) / 1000.0)
+            except (AttributeError, ValueError):
+                continue
+        if not values:
+            return None
+        return {
+            'current_mhz': sum(values) / len(values),
+            'cores_mhz': values,
+            'max_mhz': self.max_freq_mhz
+        }
+    
+    def get_throttling_status(self) -> Optional[Dict]:
+        """Get throttle flags from the firmware sysfs node"""
+        text = self._read(self.throttled_fd, 32)
+        try:
+            return decode_throttled(int(text.strip(), 16)) if text else None
+        except ValueError:
+            return None
+    
+    def close(self):
+        """Close the sysfs/proc file descriptors"""
+        for fd in [self.stat_fd, self.meminfo_fd, self.loadavg_fd,
+                   self.temp_fd, self.throttled_fd] + self.freq_fds:
+            if fd is not None:
+                os.close(fd)
+        self.freq_fds = []
+        self.stat_fd = self.meminfo_fd = self.loadavg_fd = None
+        self.temp_fd = self.throttled_fd = None
+    
+    def __del__(self):
+        # Monitors dropped without close() (e.g. a run that returned early) must not leak descriptors
+        try:
+            self.close()
+        except AttributeError:
+            pass  # __init__ did not finish
+
+
+def create_monitor(sampler: str = 'sysfs') -> SystemMonitor:
+    """Create a system monitor
+    
+    Args:
+        sampler: 'sysfs' (direct reads, no subprocesses) or 'legacy' (psutil + vcgencmd)
+        
+    Returns:
+        Monitor instance
+    """
+    if sampler == 'sysfs':
+        return SysfsMonitor()
+    if sampler == 'legacy':
+        return SystemMonitor()
+    raise ValueError(f"Unknown sampler: {sampler}")
+
+
 if __name__ == '__main__':
-    # Test the monitor
-    monitor = SystemMonitor()
+    # Test both monitors and compare their cost
     print("System Monitor Test")
     print("=" * 50)
     
-    for i in range(3):
-        snapshot = monitor.get_full_snapshot()
-        print(f"\nSnapshot {i+1}:")
+    for monitor in (SystemMonitor(), SysfsMonitor()):
+        print(f"\n[{monitor.name}]")
+        for i in range(3):
+            snapshot = monitor.sample()
+            time.sleep(0.2)
         print(monitor.format_snapshot(snapshot))
-        time.sleep(1)
+        stats = monitor.get_sampler_stats(interval=1.0)
+        print(f"Cost: {stats['sampler_cpu_ms_per_sample']:.2f} ms CPU, "
+              f"{stats['sampler_wall_ms_per_sample']:.2f} ms wall per sample")
@@ -0,0 +1,149 @@
+"""
+Operator Profile Module
+Hot-op tables from ONNX Runtime profiling output (SessionOptions.enable_profiling)
+"""
+
+import json
+import argparse
+from typing import Dict, List
+
+
+# Suffix ORT appends to the per-node kernel execution event
+_KERNEL_SUFFIX = '_kernel_time'
+
+
+def parse_ort_profile(path: str, skip_runs: int = 0) -> Dict:
+    """Aggregate kernel times of an ONNX Runtime profile per node and per op type
+
+    Args:
+        path: Profile JSON written by InferenceSession.end_profiling()
+        skip_runs: Leading model runs to ignore (e.g. warm-up iterations)
+
+    Returns:
+        Dictionary with the number of profiled runs, total kernel time and
+        'operators' / 'op_types' tables sorted by total time (descending)
+    """
+    with open(path, 'r') as f:
+        events = json.load(f)
+    if isinstance(events, dict):
+        events = events.get('traceEvents', [])
+
+    # Runs are measured from the start of the first run after warm-up
+    run_starts = sorted(e['ts'] for e in events
+                        if e.get('cat') == 'Session' and e.get('name') == 'model_run')
+    runs = run_starts[skip_runs:]
+    first_ts = runs[0] if runs else float('inf')
+    run_us = sum(e['dur'] for e in events if e.get('cat') == 'Session'
+                 and e.get('name') == 'model_run' and e['ts'] >= first_ts)
+
+    operators: Dict[str, Dict] = {}
+    for event in events:
+        name = event.get('name', '')
+        if event.get('cat') != 'Node' or not name.endswith(_KERNEL_SUFFIX) or event['ts'] < first_ts:
+            continue
+        node = name[:-len(_KERNEL_SUFFIX)]
+        op = operators.get(node)
+        if op is None:
+            op = operators[node] = {'name': node, 'op_type': event.get('args', {}).get('op_name', '?'),
+                                    'total_us': 0, 'calls': 0}
+        op['total_us'] += event['dur']
+        op['calls'] += 1
+
+    total_us = sum(op['total_us'] for op in operators.values())
+    op_types: Dict[str, Dict] = {}
+    for op in operators.values():
+        entry = op_types.setdefault(op['op_type'], {'op_type': op['op_type'], 'total_us': 0,
+                                                    'calls': 0, 'nodes': 0})
+        entry['total_us'] += op['total_us']
+        entry['calls'] += op['calls']
+        entry['nodes'] += 1
+
+    def finish(rows: List[Dict]) -> List[Dict]:
+        table = []
+        for row in sorted(rows, key=lambda r: r['total_us'], reverse=True):
+            total = row.pop('total_us')
+            row['total_ms'] = total / 1000
+            row['ms_per_run'] = total / 1000 / len(runs) if runs else 0.0
+            row['share'] = total / total_us if total_us else 0.0
+            table.append(row)
+        return table
+
+    return {
+        'runs': len(runs),
+        'kernel_ms': total_us / 1000,
+        'kernel_ms_per_run': total_us / 1000 / len(runs) if runs else 0.0,
+        'run_ms_per_run': run_us / 1000 / len(runs) if runs else 0.0,
+        'operators': finish(list(operators.values())),
+        'op_types': finish(list(op_types.values()))
+    }
+
+
+def format_op_profile(profile: Dict, top: int = 15) -> List[str]:
+    """Format the op-type table and the hottest nodes as text lines
+
+    Args:
+        profile: Result of parse_ort_profile()
+        top: Number of nodes listed
+
+    Returns:
+        Lines without trailing newlines
+    """
+    lines = [f"{profile['runs']} runs, {profile['kernel_ms_per_run']:.1f}ms kernel time per run "
+             f"({profile['run_ms_per_run']:.1f}ms per model run)",
+             f"{'Op Type':24s} {'ms/run':>8s} {'Share':>6s} {'Calls':>7s} {'Nodes':>6s}"]
+    for row in profile['op_types']:
+        lines.append(f"{row['op_type'][:24]:24s} {row['ms_per_run']:8.2f} {row['share'] * 100:5.1f}% "
+                     f"{row['calls']:7d} {row['nodes']:6d}")
+
+    lines.append('')
+    lines.append(f"{'Node (top ' + str(top) + ')':40s} {'Op Type':16s} {'ms/run':>8s} {'Share':>6s} {'Calls':>7s}")
+    for row in profile['operators'][:top]:
+        lines.append(f"{row['name'][-40:]:40s} {row['op_type'][:16]:16s} {row['ms_per_run']:8.2f} "
+                     f"{row['share'] * 100:5.1f}% {row['calls']:7d}")
+    return lines
+
+
+def compare_op_profiles(profiles: Dict[str, Dict]) -> List[Dict]:
+    """Line up per-op-type time across models
+
+    Args:
+        profiles: Mapping of model name to parse_ort_profile() result
+
+    Returns:
+        One row per op type with 'ms_per_run' and 'share' per model, sorted by
+        the largest time in any model
+    """
+    rows: Dict[str, Dict] = {}
+    for model, profile in profiles.items():
+        for entry in profile['op_types']:
+            row = rows.setdefault(entry['op_type'], {'op_type': entry['op_type'],
+                                                     'ms_per_run': {}, 'share': {}})
+            row['ms_per_run'][model] = entry['ms_per_run']
+            row['share'][model] = entry['share']
+    return sorted(rows.values(), key=lambda r: max(r['ms_per_run'].values()), reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarize ONNX Runtime profiles per operator')
+    parser.add_argument('profiles', type=str, nargs='+', help='ORT profile JSON file(s)')
+    parser.add_argument('--skip-runs', type=int, default=0,
+                        help='Leading model runs to ignore, e.g. warm-up (default: 0)')
+    parser.add_argument('--top', type=int, default=15, help='Hottest nodes to list (default: 15)')
+    args = parser.parse_args()
+
+    profiles = {path: parse_ort_profile(path, args.skip_runs) for path in args.profiles}
+    for path, profile in profiles.items():
+        print(f"\n{path}")
+        for line in format_op_profile(profile, args.top):
+            print(f"  {line}")
+
+    if len(profiles) > 1:
+        names = list(profiles)
+        print(f"\n{'Op Type':24s} " + ' '.join(f"{f'#{i + 1} ms/run':>12s}" for i in range(len(names))))
+        for row in compare_op_profiles(profiles):
+            values = ' '.join(f"{row['ms_per_run'].get(name, 0.0):12.2f}" for name in names)
+            print(f"{row['op_type'][:24]:24s} {values}")
+
+
+if __name__ == '__main__':
+    main()
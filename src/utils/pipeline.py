@@ -0,0 +1,242 @@
+"""
+Pipelined Executor Module
+Runs capture -> preprocess -> infer -> postprocess as stages with bounded queues
+"""
+
+import time
+import queue
+import threading
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+# Sentinel marking the end of the stream
+_END = object()
+
+
+class PipelineStage:
+    """One worker thread between two bounded queues"""
+
+    def __init__(self, name: str, func: Callable, in_queue: Optional[queue.Queue],
+                 out_queue: queue.Queue, drop_when_full: bool = False):
+        """Initialize stage
+
+        Args:
+            name: Stage name
+            func: For the source stage: func() -> item or None at end of stream.
+                  For other stages: func(item) -> item, or None to drop the item.
+            in_queue: Input queue (None for the source stage)
+            out_queue: Output queue
+            drop_when_full: Drop the oldest queued item instead of blocking when
+                            the output queue is full (for live sources)
+        """
+        self.name = name
+        self.func = func
+        self.in_queue = in_queue
+        self.out_queue = out_queue
+        self.drop_when_full = drop_when_full
+
+        self.running = False
+        self.thread = None
+        self.error: Optional[BaseException] = None
+
+        # Metrics
+        self.items = 0
+        self.dropped = 0
+        self.busy_time = 0.0
+        self.wait_in_time = 0.0
+        self.wait_out_time = 0.0
+        self.depth_total = 0
+        self.depth_max = 0
+        self.depth_samples = 0
+        self.start_time = None
+        self.end_time = None
+
+    def start(self):
+        """Start worker thread"""
+        self.running = True
+        self.start_time = time.perf_counter()
+        self.thread = threading.Thread(target=self._run, name=f"stage-{self.name}", daemon=True)
+        self.thread.start()
+
+    def _get(self):
+        wait_start = time.perf_counter()
+        while self.running:
+            try:
+                item = self.in_queue.get(timeout=0.1)
+                break
+            except queue.Empty:
+                continue
+        else:
+            item = _END
+        self.wait_in_time += time.perf_counter() - wait_start
+
+        depth = self.in_queue.qsize()
+        self.depth_total += depth
+        self.depth_max = max(self.depth_max, depth)
+        self.depth_samples += 1
+        return item
+
+    def _put(self, item):
+        wait_start = time.perf_counter()
+        if item is _END:
+            # Always deliver the end marker; once stopped, make room for it
+            while True:
+                try:
+                    self.out_queue.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    if not self.running:
+                        try:
+                            self.out_queue.get_nowait()
+                        except queue.Empty:
+                            pass
+        elif self.drop_when_full:
+            while True:
+                try:
+                    self.out_queue.put_nowait(item)
+                    break
+                except queue.Full:
+                    try:
+                        self.out_queue.get_nowait()
+                        self.dropped += 1
+                    except queue.Empty:
+                        pass
+        else:
+            while self.running:
+                try:
+                    self.out_queue.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+        self.wait_out_time += time.perf_counter() - wait_start
+
+    def _run(self):
+        try:
+            while self.running:
+                if self.in_queue is None:
+                    item = None
+                else:
+                    item = self._get()
+                    if item is _END:
+                        break
+
+                busy_start = time.perf_counter()
+                result = self.func() if self.in_queue is None else self.func(item)
+                self.busy_time += time.perf_counter() - busy_start
+
+                if result is None:
+                    if self.in_queue is None:
+                        break  # Source exhausted
+                    continue
+
+                self.items += 1
+                self._put(result)
+        except BaseException as e:  # Surface worker errors to the consumer
+            self.error = e
+        finally:
+            self.end_time = time.perf_counter()
+            self._put(_END)
+
+    def stop(self):
+        """Ask the worker to stop"""
+        self.running = False
+
+    def join(self, timeout: float = 2.0):
+        """Wait for the worker to exit"""
+        if self.thread:
+            self.thread.join(timeout=timeout)
+
+    def get_stats(self) -> Dict:
+        """Get stage metrics
+
+        Returns:
+            Dictionary with throughput, busy/wait time and queue depth
+        """
+        end = self.end_time or time.perf_counter()
+        elapsed = (end - self.start_time) if self.start_time else 0
+        return {
+            'items': self.items,
+            'dropped': self.dropped,
+            'throughput_fps': (self.items / elapsed) if elapsed > 0 else 0,
+            'busy_ms_per_item': (self.busy_time / self.items * 1000) if self.items else 0,
+            'utilization': (self.busy_time / elapsed) if elapsed > 0 else 0,
+            'wait_in_s': self.wait_in_time,
+            'wait_out_s': self.wait_out_time,
+            'avg_queue_depth': (self.depth_total / self.depth_samples) if self.depth_samples else 0,
+            'max_queue_depth': self.depth_max
+        }
+
+
+class StagedPipeline:
+    """Chain of PipelineStages connected by bounded queues
+
+    Frame N+1 can be preprocessed while frame N is in inference. Items are
+    usually dicts that every stage reads from and adds its result to.
+    """
+
+    def __init__(self, queue_size: int = 2):
+        """Initialize pipeline
+
+        Args:
+            queue_size: Capacity of each inter-stage queue
+        """
+        self.queue_size = queue_size
+        self.stages: List[PipelineStage] = []
+        self.output_queue: Optional[queue.Queue] = None
+
+    def add_stage(self, name: str, func: Callable, drop_when_full: bool = False):
+        """Append a stage; the first stage added is the source
+
+        Args:
+            name: Stage name
+            func: Stage function (see PipelineStage)
+            drop_when_full: Drop oldest output instead of blocking when full
+        """
+        in_queue = self.stages[-1].out_queue if self.stages else None
+        out_queue = queue.Queue(maxsize=self.queue_size)
+        self.stages.append(PipelineStage(name, func, in_queue, out_queue, drop_when_full))
+        self.output_queue = out_queue
+
+    def start(self):
+        """Start all stage workers"""
+        for stage in self.stages:
+            stage.start()
+
+    def results(self, timeout: float = 1.0) -> Iterator:
+        """Yield finished items until the stream ends or the pipeline stops
+
+        Args:
+            timeout: Poll interval in seconds
+
+        Yields:
+            Items produced by the last stage
+        """
+        while True:
+            try:
+                item = self.output_queue.get(timeout=timeout)
+            except queue.Empty:
+                if not any(stage.thread.is_alive() for stage in self.stages):
+                    return
+                continue
+
+            if item is _END:
+                for stage in self.stages:
+                    if stage.error is not None:
+                        raise stage.error
+                return
+            yield item
+
+    def stop(self):
+        """Stop all workers and wait for them"""
+        for stage in self.stages:
+            stage.stop()
+        for stage in self.stages:
+            stage.join()
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Get per-stage metrics
+
+        Returns:
+            Dictionary mapping stage name to its metrics
+        """
+        return {stage.name: stage.get_stats() for stage in self.stages}
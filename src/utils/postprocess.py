@@ -0,0 +1,121 @@
+"""
+Postprocessing Module for YOLOv8/YOLO11 outputs
+Vectorized box decoding, confidence filtering and class-aware NMS
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+class YOLODecoder:
+    """Decode raw YOLO output (1 x (4 + classes) x anchors) into detections
+
+    Detections are returned as an (N, 6) float32 array of
+    [x1, y1, x2, y2, score, class_id] in model input coordinates.
+    """
+
+    def __init__(self, conf_threshold: float = 0.25, iou_threshold: float = 0.45,
+                 top_k: Optional[int] = None, max_detections: int = 300):
+        """Initialize decoder
+
+        Args:
+            conf_threshold: Minimum class score to keep a candidate
+            iou_threshold: IoU above which overlapping boxes of the same class are suppressed
+            top_k: Keep only the k highest-scoring candidates before NMS (None to disable)
+            max_detections: Maximum detections returned per frame
+        """
+        self.conf_threshold = conf_threshold
+        self.iou_threshold = iou_threshold
+        self.top_k = top_k
+        self.max_detections = max_detections
+
+    def decode(self, output: np.ndarray) -> np.ndarray:
+        """Decode one frame of raw model output
+
+        Args:
+            output: Raw output of shape (1, 4 + classes, anchors) or (4 + classes, anchors)
+
+        Returns:
+            Detections array of shape (N, 6)
+        """
+        pred = output[0] if output.ndim == 3 else output
+
+        # Best class per anchor
+        class_scores = pred[4:]
+        class_ids = class_scores.argmax(axis=0)
+        scores = np.take_along_axis(class_scores, class_ids[None, :], axis=0)[0]
+
+        # Confidence filter before touching the boxes
+        keep = np.flatnonzero(scores >= self.conf_threshold)
+        if keep.size == 0:
+            return np.empty((0, 6), dtype=np.float32)
+
+        if self.top_k and keep.size > self.top_k:
+            top = np.argpartition(scores[keep], -self.top_k)[-self.top_k:]
+            keep = keep[top]
+
+        scores = scores[keep]
+        class_ids = class_ids[keep]
+
+        # cx, cy, w, h -> x1, y1, x2, y2
+        cx, cy, w, h = pred[:4, keep]
+        boxes = np.stack((cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2), axis=1)
+
+        selected = self.nms(boxes, scores, class_ids)
+
+        detections = np.empty((selected.size, 6), dtype=np.float32)
+        detections[:, :4] = boxes[selected]
+        detections[:, 4] = scores[selected]
+        detections[:, 5] = class_ids[selected]
+        return detections
+
+    def nms(self, boxes: np.ndarray, scores: np.ndarray, class_ids: np.ndarray) -> np.ndarray:
+        """Class-aware non-maximum suppression
+
+        Boxes of different classes are shifted apart by a per-class offset so a
+        single NMS pass never suppresses across classes.
+
+        Args:
+            boxes: (N, 4) boxes in xyxy format
+            scores: (N,) scores
+            class_ids: (N,) class indices
+
+        Returns:
+            Indices of kept boxes, highest score first
+        """
+        offset = class_ids[:, None].astype(boxes.dtype) * (boxes.max() - boxes.min() + 1)
+        shifted = boxes + offset
+
+        x1, y1, x2, y2 = shifted.T
+        areas = (x2 - x1) * (y2 - y1)
+        order = scores.argsort()[::-1]
+
+        kept = []
+        while order.size > 0 and len(kept) < self.max_detections:
+            i = order[0]
+            kept.append(i)
+            rest = order[1:]
+
+            inter_w = np.maximum(0.0, np.minimum(x2[i], x2[rest]) - np.maximum(x1[i], x1[rest]))
+            inter_h = np.maximum(0.0, np.minimum(y2[i], y2[rest]) - np.maximum(y1[i], y1[rest]))
+            inter = inter_w * inter_h
+            iou = inter / (areas[i] + areas[rest] - inter + 1e-9)
+
+            order = rest[iou <= self.iou_threshold]
+
+        return np.asarray(kept, dtype=np.int64)
+
+
+if __name__ == '__main__':
+    # Test the decoder on a synthetic output
+    rng = np.random.default_rng(0)
+    output = np.zeros((1, 84, 8400), dtype=np.float32)
+    output[0, :2] = rng.uniform(0, 640, (2, 8400))
+    output[0, 2:4] = rng.uniform(10, 100, (2, 8400))
+    output[0, 4:] = rng.uniform(0, 0.3, (80, 8400))
+
+    decoder = YOLODecoder(conf_threshold=0.25, top_k=1000)
+    detections = decoder.decode(output)
+    print(f"Detections: {len(detections)}")
+    print(detections[:5])
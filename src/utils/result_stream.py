@@ -0,0 +1,256 @@
+"""
+Result Stream Module
+Append-only JSON Lines benchmark results that survive crashes mid-run
+"""
+
+import json
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .log_writer import LogWriter
+
+
+STREAM_SUFFIX = '.jsonl'
+STREAM_VERSION = 1
+
+
+def _json_default(value):
+    """Serialize numpy scalars and arrays"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_record(record: Dict) -> str:
+    """Encode one record as a JSON line"""
+    return json.dumps(record, default=_json_default, separators=(',', ':')) + '\n'
+
+
+class ResultStreamWriter:
+    """Writes benchmark results incrementally as JSON Lines
+
+    Every record is one self-contained line tagged with a 'type':
+        header      model, start time and run config (first line)
+        inference   one logged inference row
+        system      one system sample
+        detections  a batch of per-frame detection counts
+        histograms  serialized latency histograms
+        live_summary  periodic mid-run summary
+        summary     final summary (last line of a complete run)
+
+    Lines go through a LogWriter thread and are flushed and fsync'd in
+    batches, so a crash or power loss loses at most the last flush interval.
+    """
+
+    def __init__(self, path: str, flush_interval: float = 1.0, flush_lines: int = 256,
+                 queue_size: int = 4096, detection_batch: int = 256, tracer=None):
+        """Initialize stream writer
+
+        Args:
+            path: Output .jsonl path
+            flush_interval: Maximum seconds between flushes
+            flush_lines: Flush as soon as this many lines are pending
+            queue_size: Pending records kept before new ones are dropped
+            detection_batch: Per-frame detection counts per 'detections' record
+            tracer: Optional TraceRecorder receiving a span per flush
+        """
+        self.path = str(path)
+        self.detection_batch = detection_batch
+        self.pending_frames: List[int] = []
+        self.pending_counts: List[int] = []
+        self.writer = LogWriter(self.path, formatter=encode_record, queue_size=queue_size,
+                                flush_interval=flush_interval, flush_lines=flush_lines, fsync=True,
+                                name='stream-writer', tracer=tracer)
+
+    def write_header(self, model_name: str, config: Optional[Dict]):
+        """Start a new stream with the run header"""
+        # Truncate any previous file with the same name, then stream appends
+        with open(self.path, 'w') as f:
+            f.write(encode_record({
+                'type': 'header',
+                'version': STREAM_VERSION,
+                'model': model_name,
+                'timestamp': datetime.now().isoformat(),
+                'config': config
+            }))
+        self.writer.start()
+
+    def write(self, record_type: str, data: Dict, required: bool = False):
+        """Append a record of the given type
+
+        Args:
+            record_type: Record 'type' tag
+            data: Record fields
+            required: Wait for room instead of dropping the record when the
+                      queue is full (end-of-run records such as the summary)
+        """
+        record = {'type': record_type}
+        record.update(data)
+        self.writer.write(record, block=required)
+
+    def write_detection(self, frame_num: int, count: int):
+        """Buffer one frame's detection count; written in batches"""
+        self.pending_frames.append(frame_num)
+        self.pending_counts.append(count)
+        if len(self.pending_frames) >= self.detection_batch:
+            self.flush_detections()
+
+    def flush_detections(self):
+        """Write buffered detection counts"""
+        if self.pending_frames:
+            self.write('detections', {'frame': self.pending_frames, 'count': self.pending_counts})
+            self.pending_frames = []
+            self.pending_counts = []
+
+    def close(self):
+        """Write pending records, drain and stop the writer"""
+        self.flush_detections()
+        self.writer.close()
+
+    def get_stats(self) -> Dict:
+        """Get writer statistics"""
+        return self.writer.get_stats()
+
+
+def _mean(values: List) -> float:
+    values = [v for v in values if v is not None]
+    return sum(values) / len(values) if values else 0.0
+
+
+def partial_summary(metrics: Dict) -> Dict:
+    """Approximate summary of an interrupted run from its streamed rows
+
+    Args:
+        metrics: Columns rebuilt by read_result_stream()
+
+    Returns:
+        Summary dictionary with the fields that can be recovered
+    """
+    inference = metrics.get('inference', {})
+    system = metrics.get('system', {})
+    detections = metrics.get('detections', {})
+    temps = [t for t in system.get('temperature', []) if t is not None]
+
+    summary = {
+        'total_frames': max([len(detections.get('count', []))] +
+                            [f for f in inference.get('frame', []) if f is not None]),
+        'avg_fps': _mean(inference.get('fps', [])),
+        'avg_inference_ms': _mean(inference.get('inference_time', [])) * 1000,
+        'avg_detections': _mean(detections.get('count', [])),
+        'avg_cpu': _mean(system.get('cpu_percent', [])),
+        'avg_memory': _mean(system.get('memory_percent', [])),
+        'throttle_events': sum(1 for t in system.get('throttled', []) if t),
+        'partial': True
+    }
+    if temps:
+        summary['avg_temperature'] = sum(temps) / len(temps)
+        summary['max_temperature'] = max(temps)
+    return summary
+
+
+def read_result_stream(path: str) -> Dict:
+    """Rebuild the JSON results structure from a stream
+
+    A truncated last line (crash while writing) is ignored. Runs without a
+    summary record are returned with 'complete': False and a partial
+    summary recovered from the streamed rows.
+
+    Args:
+        path: Path to .jsonl stream
+
+    Returns:
+        Dictionary with model, timestamp, config, metrics, histograms, summary
+    """
+    data = {
+        'model': None,
+        'timestamp': None,
+        'config': None,
+        'metrics': {},
+        'histograms': {},
+        'live_summaries': [],
+        'summary': None,
+        'complete': False
+    }
+    rows: Dict[str, List[Dict]] = {}
+    detections = {'frame': [], 'count': []}
+
+    with open(path, 'r') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break  # Partially written tail
+            record_type = record.pop('type', None)
+
+            if record_type == 'header':
+                data['model'] = record.get('model')
+                data['timestamp'] = record.get('timestamp')
+                data['config'] = record.get('config')
+            elif record_type in ('inference', 'system'):
+                rows.setdefault(record_type, []).append(record)
+            elif record_type == 'detections':
+                detections['frame'].extend(record.get('frame', []))
+                detections['count'].extend(record.get('count', []))
+            elif record_type == 'histograms':
+                data['histograms'] = record.get('histograms', {})
+            elif record_type == 'live_summary':
+                data['live_summaries'].append(record.get('summary'))
+            elif record_type == 'summary':
+                data['summary'] = record.get('summary')
+                data['complete'] = True
+
+    # Row records -> columns
+    for stream, stream_rows in rows.items():
+        columns = []
+        for row in stream_rows:
+            columns.extend(key for key in row if key not in columns)
+        data['metrics'][stream] = {key: [row.get(key) for row in stream_rows] for key in columns}
+    if detections['frame']:
+        data['metrics']['detections'] = detections
+
+    if not data['complete']:
+        data['summary'] = partial_summary(data['metrics'])
+
+    return data
+
+
+def load_results(path: str) -> Dict:
+    """Load benchmark results from a .jsonl stream or a .json file
+
+    Args:
+        path: Results path
+
+    Returns:
+        Results dictionary
+    """
+    if Path(path).suffix == STREAM_SUFFIX:
+        return read_result_stream(path)
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild benchmark JSON from a results stream')
+    parser.add_argument('stream', type=str, help='Path to .jsonl results stream')
+    parser.add_argument('--output', '-o', type=str, default=None,
+                        help='Output JSON path (default: stream path with .json suffix)')
+    args = parser.parse_args()
+
+    data = read_result_stream(args.stream)
+    output = args.output or str(Path(args.stream).with_suffix('.json'))
+    with open(output, 'w') as f:
+        json.dump(data, f, indent=2)
+
+    status = 'complete' if data['complete'] else 'incomplete, partial summary recovered'
+    print(f"✓ Rebuilt {output} from {args.stream} ({status})")
+
+
+if __name__ == '__main__':
+    # Relative imports: run as python3 -m utils.result_stream STREAM.jsonl (from src/)
+    main()
@@ -0,0 +1,25 @@
+"""
+Benchmark Runner Lookup Module
+Maps a model file to the ORT benchmark runner class of its family
+"""
+
+from pathlib import Path
+
+
+def get_benchmark_class(model_path: str):
+    """Pick the ORT benchmark runner matching a model file
+
+    The runner scripts live in src/, which every entry point puts on
+    sys.path; they are imported lazily so importing utils stays cheap.
+
+    Args:
+        model_path: Path to ONNX model
+
+    Returns:
+        YOLOv8Benchmark or YOLO11Benchmark class
+    """
+    if 'yolo11' in Path(model_path).name or 'yolov11' in Path(model_path).name:
+        from run_yolov11 import YOLO11Benchmark
+        return YOLO11Benchmark
+    from run_yolov8 import YOLOv8Benchmark
+    return YOLOv8Benchmark
@@ -0,0 +1,182 @@
+"""
+Running Statistics Module
+Constant-memory accumulators (Welford mean/variance, P² quantiles)
+"""
+
+import math
+from typing import Dict, Iterable, Optional
+
+
+class P2Quantile:
+    """Streaming quantile estimate with the P² algorithm (Jain & Chlamtac, 1985)
+
+    Keeps five markers whose heights track the min, p/2, p, (1+p)/2 and max
+    quantiles, adjusted with a piecewise-parabolic fit on every observation.
+    Memory and update cost are constant.
+    """
+
+    def __init__(self, p: float):
+        """Initialize estimator
+
+        Args:
+            p: Quantile in (0, 1), e.g. 0.95
+        """
+        self.p = p
+        self.count = 0
+        self.heights = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def update(self, x: float):
+        """Add one observation"""
+        self.count += 1
+        heights = self.heights
+
+        if self.count <= 5:
+            heights.append(x)
+            if self.count == 5:
+                heights.sort()
+            return
+
+        # Find the cell containing x, extending the extremes if needed
+        if x < heights[0]:
+            heights[0] = x
+            k = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            k = 3
+        else:
+            k = 0
+            while k < 3 and x >= heights[k + 1]:
+                k += 1
+
+        positions = self.positions
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        # Adjust the three middle markers
+        for i in range(1, 4):
+            d = self.desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or \
+               (d <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if d > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        q, n = self.heights, self.positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, d: int) -> float:
+        q, n = self.heights, self.positions
+        return q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+
+    def value(self) -> float:
+        """Get current estimate (exact for the first five observations)"""
+        if self.count == 0:
+            return 0.0
+        if self.count <= 5:
+            ordered = sorted(self.heights)
+            index = min(len(ordered) - 1, max(0, int(math.ceil(self.p * len(ordered))) - 1))
+            return ordered[index]
+        return self.heights[2]
+
+
+class RunningStats:
+    """Welford mean/variance, min/max, first/last and P² quantiles of a stream"""
+
+    def __init__(self, quantiles: Iterable[float] = (0.5, 0.95)):
+        """Initialize accumulator
+
+        Args:
+            quantiles: Quantiles to estimate, each in (0, 1)
+        """
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.first: Optional[float] = None
+        self.last: Optional[float] = None
+        self.quantiles = {q: P2Quantile(q) for q in quantiles}
+
+    def update(self, x: Optional[float]):
+        """Add one observation (None and NaN are ignored)"""
+        if x is None or x != x:
+            return
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+        if self.first is None:
+            self.first = x
+        self.last = x
+        for estimator in self.quantiles.values():
+            estimator.update(x)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation"""
+        return math.sqrt(self.variance)
+
+    def quantile(self, q: float) -> float:
+        """Get the estimate of a tracked quantile"""
+        return self.quantiles[q].value()
+
+    def to_dict(self, scale: float = 1.0) -> Dict:
+        """Get current statistics
+
+        Args:
+            scale: Multiplier applied to every value (e.g. 1000 for s -> ms)
+
+        Returns:
+            Dictionary with count, mean, std, min, max and quantiles ('p50', 'p95', ...)
+        """
+        if self.count == 0:
+            result = {'count': 0, 'mean': 0.0, 'std': 0.0, 'min': 0.0, 'max': 0.0}
+            result.update({f"p{q * 100:g}": 0.0 for q in self.quantiles})
+            return result
+        result = {
+            'count': self.count,
+            'mean': self.mean * scale,
+            'std': self.std * scale,
+            'min': self.min * scale,
+            'max': self.max * scale
+        }
+        result.update({f"p{q * 100:g}": est.value() * scale for q, est in self.quantiles.items()})
+        return result
+
+
+if __name__ == '__main__':
+    # Compare against exact statistics
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    samples = rng.gamma(shape=4.0, scale=0.02, size=50000)
+
+    stats = RunningStats(quantiles=(0.5, 0.95, 0.99))
+    for s in samples:
+        stats.update(float(s))
+
+    print(f"mean {stats.mean:.5f} (exact {samples.mean():.5f}), "
+          f"std {stats.std:.5f} (exact {samples.std(ddof=1):.5f})")
+    for q in (0.5, 0.95, 0.99):
+        print(f"p{q * 100:g}: {stats.quantile(q):.5f} (exact {np.quantile(samples, q):.5f})")
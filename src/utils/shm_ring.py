@@ -0,0 +1,485 @@
+"""
+Shared-Memory Frame Ring Module
+Capture in a separate process, frames handed to inference through fixed slots in shared memory
+"""
+
+import time
+import traceback
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .sources import FrameSource, open_source
+
+
+# Header words (int64) at the start of the shared block
+(_WRITE_SEQ, _READ_SEQ, _HELD_SLOT, _CLOSED, _EOF, _OVERRUNS, _WRITER_WAITS, _WRITER_WAIT_NS,
+ _WRITER_WAIT_MAX_NS, _CAPTURE_NS, _CAPTURE_CPU_NS, _RESIZED, _SOURCE_SKIPPED, _WIDTH, _HEIGHT,
+ _SLOTS) = range(16)
+_HEADER_WORDS = 16
+_ALIGN = 64
+
+# Sleep between polls of the other side's counters
+POLL_INTERVAL = 0.0002
+
+
+def _data_offset(slots: int) -> int:
+    """Byte offset of the frame slots (after header, slot sequences, timestamps and frame shapes)"""
+    offset = (_HEADER_WORDS + 4 * slots) * 8
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class SharedFrameRing:
+    """Single-writer, single-reader ring of frame slots in shared memory
+
+    Layout: an int64 header (counters, reader state, geometry), one sequence
+    number, capture timestamp and frame height/width per slot, then the
+    slots of width x height x 3 bytes each. A slot holds any frame of up to
+    that many pixels, so sources of mixed resolution need no resizing. The
+    writer claims a slot, marks its sequence -1, decodes the frame straight
+    into it and then publishes the sequence; the reader scans the slot
+    sequences for the next one it wants and returns a view of the slot,
+    which it holds (HELD_SLOT) until its next read(). Neither side takes a
+    lock and no frame is copied between processes.
+
+    Sequences are contiguous, so gaps seen by the reader are exactly the
+    frames it lost to overwrites or 'latest' skips. With the overwrite
+    policies the writer may reuse a slot the reader is in the middle of
+    claiming; the reader re-validates the slot sequence when it lets go of a
+    frame and counts a torn frame if it changed. The writer marks a slot
+    before checking HELD_SLOT and the reader sets HELD_SLOT before checking
+    the mark, so such collisions are rare. NumPy stores to shared
+    memory are not atomic operations with ordering guarantees, but aligned
+    8-byte stores are not split on the platforms this runs on (x86-64,
+    AArch64) and the torn-frame check catches what reordering remains.
+
+    Timestamps come from time.perf_counter(), which is the system-wide
+    monotonic clock on Linux, so the reader can compute frame age.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        """Map the ring's arrays onto a shared memory block (use create() or attach())"""
+        self.shm = shm
+        self.owner = owner
+        self.header = np.ndarray((_HEADER_WORDS,), np.int64, shm.buf)
+        self.slots = int(self.header[_SLOTS])
+        self.width = int(self.header[_WIDTH])
+        self.height = int(self.header[_HEIGHT])
+        self.slot_seq = np.ndarray((self.slots,), np.int64, shm.buf, offset=_HEADER_WORDS * 8)
+        self.slot_time = np.ndarray((self.slots,), np.float64, shm.buf,
+                                    offset=(_HEADER_WORDS + self.slots) * 8)
+        self.slot_shape = np.ndarray((self.slots, 2), np.int64, shm.buf,
+                                     offset=(_HEADER_WORDS + 2 * self.slots) * 8)
+        self.data = np.ndarray((self.slots, self.height * self.width * 3), np.uint8, shm.buf,
+                               offset=_data_offset(self.slots))
+
+        # Reader state (only meaningful in the reading process)
+        self.held_slot = -1
+        self.held_seq = -1
+        self.frames_read = 0
+        self.frames_dropped = 0
+        self.torn_frames = 0
+        self.reader_waits = 0
+        self.reader_wait = 0.0
+        self.reader_wait_max = 0.0
+
+    @classmethod
+    def create(cls, width: int, height: int, slots: int = 4) -> 'SharedFrameRing':
+        """Allocate a ring for BGR frames of up to width x height pixels
+
+        Args:
+            width: Largest frame width
+            height: Largest frame height
+            slots: Number of frame slots (at least 2: one held by the reader, one being written)
+
+        Returns:
+            Ring owning the shared memory block (unlinked by close())
+        """
+        if slots < 2:
+            raise ValueError(f"A frame ring needs at least 2 slots, got {slots}")
+        size = _data_offset(slots) + slots * height * width * 3
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        header = np.ndarray((_HEADER_WORDS,), np.int64, shm.buf)
+        header[:] = 0
+        header[_HELD_SLOT] = -1
+        header[_WIDTH], header[_HEIGHT], header[_SLOTS] = width, height, slots
+        np.ndarray((slots,), np.int64, shm.buf, offset=_HEADER_WORDS * 8)[:] = -1
+        del header
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedFrameRing':
+        """Attach to a ring created by another process"""
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def closed(self) -> bool:
+        """Reader asked the writer to stop"""
+        return bool(self.header[_CLOSED])
+
+    @property
+    def eof(self) -> bool:
+        """Writer published its last frame"""
+        return bool(self.header[_EOF])
+
+    # Writer side
+
+    def acquire(self, overwrite: bool) -> Optional[Tuple[int, int]]:
+        """Claim a slot for the next frame and mark it as being written
+
+        Args:
+            overwrite: Reuse the oldest slot even if it holds an unread frame
+                       (counted as an overrun) instead of waiting for the reader
+
+        Returns:
+            (sequence, slot), or None if the reader closed the ring
+        """
+        header = self.header
+        seq = int(header[_WRITE_SEQ])
+        if overwrite:
+            while True:
+                held = header[_HELD_SLOT]
+                slot = min((s for s in range(self.slots) if s != held), key=lambda s: self.slot_seq[s])
+                previous = int(self.slot_seq[slot])
+                self.slot_seq[slot] = -1
+                if header[_HELD_SLOT] != slot:
+                    break
+                # The reader claimed it between our check and the mark: give it back untouched
+                self.slot_seq[slot] = previous
+            if previous >= header[_READ_SEQ]:
+                header[_OVERRUNS] += 1
+            return seq, int(slot)
+
+        wait_start = None
+        while True:
+            free = np.flatnonzero(self.slot_seq < header[_READ_SEQ])
+            free = free[free != header[_HELD_SLOT]]
+            if free.size:
+                slot = int(free[0])
+                break
+            if header[_CLOSED]:
+                return None
+            if wait_start is None:
+                wait_start = time.perf_counter_ns()
+            time.sleep(POLL_INTERVAL)
+        if wait_start is not None:
+            waited = time.perf_counter_ns() - wait_start
+            header[_WRITER_WAITS] += 1
+            header[_WRITER_WAIT_NS] += waited
+            header[_WRITER_WAIT_MAX_NS] = max(int(header[_WRITER_WAIT_MAX_NS]), waited)
+        self.slot_seq[slot] = -1
+        return seq, int(slot)
+
+    def commit(self, seq: int, slot: int, shape: Tuple[int, ...], timestamp: float):
+        """Publish a frame written into a claimed slot"""
+        self.slot_shape[slot] = shape[:2]
+        self.slot_time[slot] = timestamp
+        self.slot_seq[slot] = seq
+        self.header[_WRITE_SEQ] = seq + 1
+
+    def write_from(self, source: FrameSource, overwrite: bool):
+        """Writer loop: read frames from a source into the ring until it ends or the ring closes
+
+        Args:
+            source: Opened frame source (decodes straight into the slot if it can)
+            overwrite: See acquire()
+        """
+        header = self.header
+        cpu_start = time.process_time_ns()
+        while not header[_CLOSED]:
+            claim = self.acquire(overwrite)
+            if claim is None:
+                break
+            seq, slot = claim
+            read_start = time.perf_counter_ns()
+            frame = source.read_into(self.data[slot])
+            read_end = time.perf_counter_ns()
+            if frame is None:
+                if source.finished:
+                    break
+                continue  # Slot stays marked empty, the sequence is reused
+            header[_CAPTURE_NS] += read_end - read_start
+            header[_CAPTURE_CPU_NS] = time.process_time_ns() - cpu_start
+            header[_RESIZED] = source.frames_resized
+            header[_SOURCE_SKIPPED] = getattr(source, 'frames_skipped', 0)
+            self.commit(seq, slot, frame.shape, read_end / 1e9)
+        header[_EOF] = 1
+
+    # Reader side
+
+    def read(self, latest: bool = False, timeout: Optional[float] = None):
+        """Hold the next frame (the previously held one is released)
+
+        Args:
+            latest: Take the newest published frame, skipping older unread ones
+            timeout: Seconds to wait for a frame (None: until one arrives or the writer ends)
+
+        Returns:
+            (sequence, capture timestamp, frame view) or None on timeout or end of
+            stream. The view is only valid until the next read() or release().
+        """
+        self.release()
+        header = self.header
+        start = time.perf_counter()
+        waited = False
+        while True:
+            eof = header[_EOF]
+            read_seq = int(header[_READ_SEQ])
+            sequences = self.slot_seq.copy()
+            ready = np.flatnonzero(sequences >= read_seq)
+            if ready.size:
+                pick = ready[np.argmax(sequences[ready]) if latest else np.argmin(sequences[ready])]
+                seq = int(sequences[pick])
+                header[_HELD_SLOT] = pick
+                if self.slot_seq[pick] != seq:
+                    header[_HELD_SLOT] = -1  # Overwritten while claiming it
+                    continue
+                header[_READ_SEQ] = seq + 1
+                break
+            if eof or header[_CLOSED]:
+                return None
+            if timeout is not None and time.perf_counter() - start > timeout:
+                return None
+            waited = True
+            time.sleep(POLL_INTERVAL)
+
+        if waited:
+            wait = time.perf_counter() - start
+            self.reader_waits += 1
+            self.reader_wait += wait
+            self.reader_wait_max = max(self.reader_wait_max, wait)
+        self.frames_read += 1
+        self.frames_dropped += seq - read_seq
+        self.held_slot, self.held_seq = int(pick), seq
+        height, width = self.slot_shape[pick]
+        frame = self.data[pick, :height * width * 3].reshape(height, width, 3)
+        return seq, float(self.slot_time[pick]), frame
+
+    def release(self):
+        """Hand the held slot back to the writer, checking it was not overwritten meanwhile"""
+        if self.held_slot < 0:
+            return
+        if self.slot_seq[self.held_slot] != self.held_seq:
+            self.torn_frames += 1
+        self.header[_HELD_SLOT] = -1
+        self.held_slot = -1
+
+    def get_stats(self) -> Dict:
+        """Get writer (shared) and reader (this process) counters"""
+        header = self.header
+        written = int(header[_WRITE_SEQ])
+        writer_waits = int(header[_WRITER_WAITS])
+        return {
+            'slots': self.slots,
+            'slot_mb': self.width * self.height * 3 / (1024 * 1024),
+            'frames_written': written,
+            'frames_read': self.frames_read,
+            'frames_dropped': self.frames_dropped,
+            'overruns': int(header[_OVERRUNS]),
+            'torn_frames': self.torn_frames,
+            'frames_resized': int(header[_RESIZED]),
+            'source_skipped': int(header[_SOURCE_SKIPPED]),
+            'avg_capture_ms': int(header[_CAPTURE_NS]) / written / 1e6 if written else 0.0,
+            'capture_cpu_s': int(header[_CAPTURE_CPU_NS]) / 1e9,
+            'writer_slot_waits': writer_waits,
+            'avg_writer_wait_ms': int(header[_WRITER_WAIT_NS]) / writer_waits / 1e6 if writer_waits else 0.0,
+            'max_writer_wait_ms': int(header[_WRITER_WAIT_MAX_NS]) / 1e6,
+            'reader_waits': self.reader_waits,
+            'avg_reader_wait_ms': self.reader_wait / self.reader_waits * 1000 if self.reader_waits else 0.0,
+            'max_reader_wait_ms': self.reader_wait_max * 1000
+        }
+
+    def close(self):
+        """Unmap the ring (and unlink it if this process created it)"""
+        self.header = self.slot_seq = self.slot_time = self.slot_shape = self.data = None
+        try:
+            self.shm.close()
+        except BufferError:
+            pass  # A caller still holds a frame view; unmapped when it is collected
+        if self.owner:
+            self.shm.unlink()
+
+
+def _capture_main(kind: str, kwargs: Dict, conn):
+    """Capture process: open the source, report it, then fill the ring the parent creates"""
+    try:
+        source = open_source(kind, **kwargs)
+        if not source.isOpened():
+            conn.send(('error', f"Failed to open {source.describe()}"))
+            return
+        width, height = source.get_resolution()
+        if not width or not height:
+            conn.send(('error', f"{source.describe()} did not report a resolution"))
+            return
+        conn.send(('ready', {
+            'resolution': (width, height),
+            'max_resolution': source.get_max_resolution(),
+            'live': source.live,
+            'description': source.describe(),
+            'backend_name': getattr(source, 'backend_name', None),
+            'files': list(getattr(source, 'files', ()))
+        }))
+    except Exception:
+        conn.send(('error', traceback.format_exc()))
+        return
+
+    message = conn.recv()
+    if message is None:
+        source.release()
+        return
+    name, policy = message
+    ring = SharedFrameRing.attach(name)
+    try:
+        ring.write_from(source, overwrite=policy != 'block')
+    finally:
+        source.release()
+        ring.close()
+
+
+class SharedMemoryCaptureSource(FrameSource):
+    """Frame source whose capture runs in its own process behind a SharedFrameRing
+
+    The child process opens the underlying source (any kind accepted by
+    open_source) and decodes frames straight into ring slots; read() here
+    returns a view of a slot without copying. Decode and camera I/O then
+    run beside inference instead of on its critical path, without the GIL
+    or pickling in between.
+
+    Frames stay valid until the next read() or release(), so the consumer
+    must be done with one frame before reading the next. Live sources use
+    the 'latest' or 'fifo' capture policy (overwrite unread frames), others
+    'block' (the capture process waits for a free slot and nothing is lost).
+    """
+
+    def __init__(self, kind: str, slots: int = 4, capture_policy: str = 'latest',
+                 start_timeout: float = 30.0, **kwargs):
+        """Start the capture process and allocate the ring
+
+        Args:
+            kind: Source kind for open_source() ('camera', 'video', 'image_dir', 'synthetic')
+            slots: Ring slots
+            capture_policy: 'latest', 'fifo' or 'sync' for live sources ('sync' blocks like
+                            non-live sources)
+            start_timeout: Seconds to wait for the source to open
+            **kwargs: Source constructor arguments
+        """
+        super().__init__()
+        self.slots = slots
+        self.ring = None
+        self.error = None
+        self.info = {}
+        self.policy = None
+        self.frame_timestamp = None
+        self.stats = {}
+
+        ctx = multiprocessing.get_context('spawn')
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_capture_main, args=(kind, kwargs, child_conn),
+                                   name=f"{kind} capture", daemon=True)
+        self.process.start()
+        child_conn.close()
+
+        if not self.conn.poll(start_timeout):
+            self.error = f"Capture process did not start within {start_timeout:.0f}s"
+        else:
+            status, payload = self.conn.recv()
+            if status == 'error':
+                self.error = payload
+            else:
+                self.info = payload
+        if self.error:
+            self.process.join(timeout=2.0)
+            if self.process.is_alive():
+                self.process.terminate()
+            return
+
+        self.live = self.info['live']
+        self.backend_name = self.info['backend_name']
+        self.files = self.info['files']
+        self.policy = capture_policy if self.live and capture_policy in ('latest', 'fifo') else 'block'
+        width, height = self.info['max_resolution']
+        self.ring = SharedFrameRing.create(width, height, slots)
+        self.conn.send((self.ring.name, self.policy))
+
+    def isOpened(self) -> bool:
+        return self.ring is not None
+
+    def read(self):
+        if self.finished or self.ring is None:
+            return False, None
+        item = self.ring.read(latest=self.policy == 'latest', timeout=1.0)
+        if item is None:
+            if self.ring.eof or not self.process.is_alive():
+                self.finished = True
+            return False, None
+        _, self.frame_timestamp, frame = item
+        return True, frame
+
+    def get_resolution(self) -> Tuple[int, int]:
+        return self.info.get('resolution', (0, 0))
+
+    def describe(self) -> str:
+        return (f"{self.info.get('description', 'Capture process')} "
+                f"(shared-memory capture, {self.slots} slots, {self.policy})")
+
+    def get_stats(self) -> Dict:
+        """Get ring statistics (kept after release())"""
+        if self.ring is not None and self.ring.header is not None:
+            self.stats = dict(self.ring.get_stats(), policy=self.policy)
+        return self.stats
+
+    def release(self):
+        super().release()
+        if self.ring is None:
+            return
+        self.ring.release()
+        self.get_stats()
+        self.ring.header[_CLOSED] = 1
+        self.process.join(timeout=5.0)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.ring.close()
+
+
+if __name__ == '__main__':
+    # Throughput and integrity check: python3 -m utils.shm_ring [VIDEO] (from src/)
+    import sys
+
+    if len(sys.argv) > 1:
+        runs = [('video', {'path': sys.argv[1], 'prefetch': 0}, 'sync')]
+    else:
+        runs = [('synthetic', {'width': 640, 'height': 480, 'fps': 0}, policy)
+                for policy in ('sync', 'fifo', 'latest')]
+
+    for kind, kwargs, policy in runs:
+        source = SharedMemoryCaptureSource(kind, slots=4, capture_policy=policy, **kwargs)
+        if not source.isOpened():
+            print(f"{kind}: {source.error}")
+            continue
+        start = time.perf_counter()
+        frames = 0
+        checksum = 0
+        while frames < 300:
+            ret, frame = source.read()
+            if not ret:
+                if source.finished:
+                    break
+                continue
+            checksum += int(frame[::16, ::16].sum())
+            time.sleep(0.002)  # Simulated inference
+            frames += 1
+        elapsed = time.perf_counter() - start
+        source.release()
+        stats = source.get_stats()
+        print(f"{source.describe()}: {frames / elapsed:.0f} FPS read, written {stats['frames_written']}, "
+              f"dropped {stats['frames_dropped']}, overruns {stats['overruns']}, torn {stats['torn_frames']}, "
+              f"writer waits {stats['writer_slot_waits']} (avg {stats['avg_writer_wait_ms']:.2f}ms), "
+              f"reader waits {stats['reader_waits']} (avg {stats['avg_reader_wait_ms']:.2f}ms), "
+              f"checksum {checksum}")
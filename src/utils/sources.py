@@ -0,0 +1,504 @@
+"""
+Frame Source Module
+Camera, video-file, image-directory and synthetic frame sources behind one read() interface
+"""
+
+import os
+import re
+import time
+import queue
+import threading
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+class FrameSource:
+    """Base class for frame sources
+
+    Sources mimic cv2.VideoCapture: read() returns (ret, frame). 'live' sources
+    produce frames in real time whether or not they are consumed (so stale
+    frames may be dropped); non-live sources must not drop frames.
+    """
+
+    live = True
+
+    def __init__(self):
+        self.finished = False
+        self.frames_resized = 0
+
+    def isOpened(self) -> bool:
+        """Check whether the source can deliver frames"""
+        return True
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """Read the next frame"""
+        raise NotImplementedError
+
+    def read_into(self, buffer: np.ndarray) -> Optional[np.ndarray]:
+        """Read the next frame into a preallocated flat uint8 buffer
+
+        The frame is stored contiguously from the start of the buffer; frames
+        larger than the buffer are downscaled to fit. Sources that can decode
+        straight into the buffer override this to skip the copy.
+
+        Returns:
+            (height, width, 3) view of the frame in the buffer, or None
+        """
+        ret, frame = self.read()
+        if not ret:
+            return None
+        return self._fit_into(frame, buffer)
+
+    def _fit_into(self, frame: np.ndarray, buffer: np.ndarray) -> np.ndarray:
+        """Copy a frame to the start of buffer, downscaling it if it does not fit"""
+        if frame.nbytes <= buffer.size:
+            out = buffer[:frame.nbytes].reshape(frame.shape)
+            np.copyto(out, frame)
+            return out
+        scale = (buffer.size / frame.nbytes) ** 0.5
+        height, width = max(1, int(frame.shape[0] * scale)), max(1, int(frame.shape[1] * scale))
+        out = buffer[:height * width * 3].reshape(height, width, 3)
+        cv2.resize(frame, (width, height), dst=out, interpolation=cv2.INTER_AREA)
+        self.frames_resized += 1
+        return out
+
+    def _frame_view(self, buffer: np.ndarray) -> Optional[np.ndarray]:
+        """(height, width, 3) view at the start of buffer for the source resolution, if it fits"""
+        width, height = self.get_resolution()
+        if not width or not height or width * height * 3 > buffer.size:
+            return None
+        return buffer[:width * height * 3].reshape(height, width, 3)
+
+    def get_resolution(self) -> Tuple[int, int]:
+        """Get (width, height) of delivered frames"""
+        raise NotImplementedError
+
+    def get_max_resolution(self) -> Tuple[int, int]:
+        """Get (width, height) bounding every frame (differs for sources of mixed resolution)"""
+        return self.get_resolution()
+
+    def describe(self) -> str:
+        """Get a description for the log header"""
+        return self.__class__.__name__
+
+    def release(self):
+        """Release the source"""
+        self.finished = True
+
+
+class CameraSource(FrameSource):
+    """Live camera via cv2.VideoCapture, trying several backends"""
+
+    live = True
+
+    def __init__(self, camera_index: int = 0, width: int = 640, height: int = 480, fps: int = 30):
+        """Open camera
+
+        Args:
+            camera_index: Camera device index
+            width: Requested frame width
+            height: Requested frame height
+            fps: Requested frame rate
+        """
+        super().__init__()
+        self.camera_index = camera_index
+        self.backend_name = None
+        self.cap = None
+
+        # Try different camera backends for Raspberry Pi compatibility
+        # Newer Raspberry Pi OS uses libcamera (rpicam)
+        backends = [
+            (cv2.CAP_V4L2, "V4L2"),
+            (cv2.CAP_ANY, "ANY"),
+            (None, "Default")
+        ]
+
+        for backend, name in backends:
+            cap = cv2.VideoCapture(camera_index, backend) if backend is not None else cv2.VideoCapture(camera_index)
+            if cap.isOpened():
+                self.cap = cap
+                self.backend_name = name
+                break
+            cap.release()
+
+        if self.cap is not None:
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            self.cap.set(cv2.CAP_PROP_FPS, fps)
+
+    def isOpened(self) -> bool:
+        return self.cap is not None and self.cap.isOpened()
+
+    def read(self):
+        return self.cap.read()
+
+    def read_into(self, buffer: np.ndarray) -> Optional[np.ndarray]:
+        # cv2 decodes into out when the size matches and allocates otherwise
+        out = self._frame_view(buffer)
+        ret, frame = self.cap.read(out)
+        if not ret:
+            return None
+        if out is None or not np.shares_memory(frame, out):
+            return self._fit_into(frame, buffer)
+        return out
+
+    def get_resolution(self) -> Tuple[int, int]:
+        return (int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+
+    def describe(self) -> str:
+        return f"Camera {self.camera_index}"
+
+    def release(self):
+        super().release()
+        if self.cap is not None:
+            self.cap.release()
+
+
+class VideoFileSource(FrameSource):
+    """Video file decoded ahead on a background thread
+
+    Not live: read() blocks until the next decoded frame is available and
+    no frame is ever dropped, so runs over the same file are reproducible.
+    With prefetch=0 frames are decoded on the calling thread instead.
+    """
+
+    live = False
+
+    def __init__(self, path: str, prefetch: int = 8, loop: bool = False):
+        """Open video file
+
+        Args:
+            path: Path to video file
+            prefetch: Number of frames decoded ahead (0: decode in read())
+            loop: Restart from the first frame at end of file
+        """
+        super().__init__()
+        self.path = path
+        self.loop = loop
+        self.prefetch = prefetch
+        self.cap = cv2.VideoCapture(path)
+        self.frames = queue.Queue(maxsize=max(1, prefetch))
+        self.running = False
+        self.thread = None
+        self.frames_decoded = 0
+
+        if self.cap.isOpened() and prefetch > 0:
+            self.running = True
+            self.thread = threading.Thread(target=self._decode_loop, daemon=True)
+            self.thread.start()
+
+    def _decode(self, out: Optional[np.ndarray] = None):
+        """Decode the next frame (into out if given), rewinding when looping"""
+        ret, frame = self.cap.read(out)
+        if not ret and self.loop and self.frames_decoded > 0:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.cap.read(out)
+        if ret:
+            self.frames_decoded += 1
+        return ret, frame
+
+    def _decode_loop(self):
+        while self.running:
+            ret, frame = self._decode()
+            if not ret:
+                break
+
+            while self.running:
+                try:
+                    self.frames.put(frame, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+        # End of file marker
+        while self.running:
+            try:
+                self.frames.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+
+    def isOpened(self) -> bool:
+        return self.cap.isOpened()
+
+    def read(self):
+        if self.finished:
+            return False, None
+        if self.prefetch == 0:
+            ret, frame = self._decode()
+            self.finished = not ret
+            return ret, frame
+        while True:
+            try:
+                frame = self.frames.get(timeout=0.1)
+                break
+            except queue.Empty:
+                if not self.running:
+                    self.finished = True
+                    return False, None
+        if frame is None:
+            self.finished = True
+            return False, None
+        return True, frame
+
+    def read_into(self, buffer: np.ndarray) -> Optional[np.ndarray]:
+        if self.prefetch > 0:
+            return super().read_into(buffer)
+        if self.finished:
+            return None
+        out = self._frame_view(buffer)
+        ret, frame = self._decode(out)
+        if not ret:
+            self.finished = True
+            return None
+        if out is None or not np.shares_memory(frame, out):
+            return self._fit_into(frame, buffer)
+        return out
+
+    def get_resolution(self) -> Tuple[int, int]:
+        return (int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+
+    def describe(self) -> str:
+        return f"Video: {self.path}"
+
+    def release(self):
+        super().release()
+        self.running = False
+        if self.thread:
+            self.thread.join(timeout=2.0)
+        self.cap.release()
+
+
+class ImageDirectorySource(FrameSource):
+    """Image files of a directory decoded ahead on a background thread
+
+    Not live, like VideoFileSource: files are delivered in sorted name order
+    and none is ever dropped. Images may have different resolutions.
+    """
+
+    live = False
+
+    EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff', '.webp')
+
+    def __init__(self, path: str, prefetch: int = 8, loop: bool = False):
+        """Open image directory
+
+        Args:
+            path: Directory containing the images
+            prefetch: Number of images decoded ahead
+            loop: Restart from the first image after the last one
+        """
+        super().__init__()
+        self.path = path
+        self.loop = loop
+        self.files = []
+        if os.path.isdir(path):
+            self.files = sorted(os.path.join(path, name) for name in os.listdir(path)
+                                if name.lower().endswith(self.EXTENSIONS))
+        self.frames = queue.Queue(maxsize=max(1, prefetch))
+        self.running = False
+        self.thread = None
+        self.frames_decoded = 0
+        self.failed_files = []
+
+        # Resolution of the first readable image
+        self.resolution = (0, 0)
+        for file_path in self.files:
+            first = cv2.imread(file_path)
+            if first is not None:
+                self.resolution = (first.shape[1], first.shape[0])
+                break
+
+        if self.files:
+            self.running = True
+            self.thread = threading.Thread(target=self._decode_loop, daemon=True)
+            self.thread.start()
+
+    def _decode_loop(self):
+        index = 0
+        while self.running:
+            if index == len(self.files):
+                if self.loop and self.frames_decoded > 0:
+                    index = 0
+                    continue
+                break
+
+            file_path = self.files[index]
+            index += 1
+            frame = cv2.imread(file_path)
+            if frame is None:
+                if file_path not in self.failed_files:
+                    self.failed_files.append(file_path)
+                continue
+
+            self.frames_decoded += 1
+            while self.running:
+                try:
+                    self.frames.put(frame, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+        # End of directory marker
+        while self.running:
+            try:
+                self.frames.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+
+    def isOpened(self) -> bool:
+        return self.resolution != (0, 0)
+
+    def read(self):
+        if self.finished:
+            return False, None
+        while True:
+            try:
+                frame = self.frames.get(timeout=0.1)
+                break
+            except queue.Empty:
+                if not self.running:
+                    self.finished = True
+                    return False, None
+        if frame is None:
+            self.finished = True
+            return False, None
+        return True, frame
+
+    def get_resolution(self) -> Tuple[int, int]:
+        return self.resolution
+
+    def get_max_resolution(self) -> Tuple[int, int]:
+        # 1/8-scale decodes are cheap; JPEG rounds their size up and other
+        # formats down, so one extra 8-pixel block bounds the full size
+        width, height = self.resolution
+        for file_path in self.files:
+            reduced = cv2.imread(file_path, cv2.IMREAD_REDUCED_GRAYSCALE_8)
+            if reduced is not None:
+                width = max(width, (reduced.shape[1] + 1) * 8)
+                height = max(height, (reduced.shape[0] + 1) * 8)
+        return (width, height)
+
+    def describe(self) -> str:
+        return f"Image directory: {self.path} ({len(self.files)} images)"
+
+    def release(self):
+        super().release()
+        self.running = False
+        if self.thread:
+            self.thread.join(timeout=2.0)
+
+
+class SyntheticSource(FrameSource):
+    """Generated frames paced like a real camera
+
+    A fixed set of frames is rendered up front (a moving gradient with noise)
+    and replayed at the requested frame rate, so generating frames costs
+    nothing during the run. If the consumer is slower than the frame rate,
+    frames that were "exposed" while it was busy are skipped, like a sensor.
+    """
+
+    live = True
+
+    def __init__(self, width: int = 640, height: int = 480, fps: float = 30.0,
+                 num_frames: int = 30, seed: int = 0):
+        """Initialize synthetic source
+
+        Args:
+            width: Frame width
+            height: Frame height
+            fps: Frame rate to pace delivery at
+            num_frames: Number of distinct frames to cycle through
+            seed: Random seed for reproducible content
+        """
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.period = 1.0 / fps if fps > 0 else 0.0
+
+        rng = np.random.default_rng(seed)
+        x = np.linspace(0, 255, width, dtype=np.float32)
+        self.frames = []
+        for i in range(num_frames):
+            shift = int(i * width / num_frames)
+            gradient = np.roll(x, shift)[None, :, None]
+            noise = rng.normal(0, 12, (height, width, 3)).astype(np.float32)
+            frame = np.clip(gradient + noise, 0, 255).astype(np.uint8)
+            self.frames.append(frame)
+
+        self.index = 0
+        self.next_time = None
+        self.frames_skipped = 0
+
+    def read(self):
+        now = time.perf_counter()
+        if self.next_time is None:
+            self.next_time = now
+
+        if self.period > 0:
+            if now < self.next_time:
+                time.sleep(self.next_time - now)
+            else:
+                # Sensor kept exposing while we were busy: skip missed frames
+                missed = int((now - self.next_time) / self.period)
+                self.frames_skipped += missed
+                self.index += missed
+                self.next_time += missed * self.period
+            self.next_time += self.period
+
+        frame = self.frames[self.index % len(self.frames)]
+        self.index += 1
+        return True, frame
+
+    def get_resolution(self) -> Tuple[int, int]:
+        return (self.width, self.height)
+
+    def describe(self) -> str:
+        return f"Synthetic: {self.width}x{self.height}@{self.fps:g}"
+
+
+SOURCE_TYPES = {
+    'camera': CameraSource,
+    'video': VideoFileSource,
+    'image_dir': ImageDirectorySource,
+    'synthetic': SyntheticSource
+}
+
+
+def open_source(kind: str, **kwargs) -> FrameSource:
+    """Open a frame source by kind ('camera', 'video', 'image_dir', 'synthetic')
+
+    Args:
+        kind: Key of SOURCE_TYPES
+        **kwargs: Constructor arguments of that source
+
+    Returns:
+        The source (check isOpened())
+    """
+    if kind not in SOURCE_TYPES:
+        raise ValueError(f"Unknown source kind '{kind}' (expected one of {', '.join(SOURCE_TYPES)})")
+    return SOURCE_TYPES[kind](**kwargs)
+
+
+def parse_synthetic_spec(spec: str) -> Tuple[int, int, float]:
+    """Parse a 'WxH@fps' synthetic source spec
+
+    Args:
+        spec: e.g. '640x480@30'
+
+    Returns:
+        Tuple of (width, height, fps)
+    """
+    match = re.fullmatch(r'(\d+)x(\d+)(?:@(\d+(?:\.\d+)?))?', spec.strip())
+    if not match:
+        raise ValueError(f"Invalid synthetic source spec '{spec}' (expected WxH@fps, e.g. 640x480@30)")
+    width, height, fps = int(match.group(1)), int(match.group(2)), match.group(3)
+    if width < 1 or height < 1:
+        raise ValueError(f"Synthetic frame size must be positive, got {width}x{height}")
+    return width, height, float(fps) if fps else 30.0
@@ -0,0 +1,157 @@
+"""
+Thermal Control Module
+Cool-down before a run and thermal steady-state (plateau) detection during it
+"""
+
+import time
+from collections import deque
+from typing import Dict, Optional
+
+
+DEFAULT_COOLDOWN_TIMEOUT = 600.0
+DEFAULT_PLATEAU_WINDOW = 60.0
+DEFAULT_PLATEAU_SLOPE = 0.5
+
+
+def wait_for_cooldown(monitor, target: float, timeout: float = DEFAULT_COOLDOWN_TIMEOUT,
+                      poll_interval: float = 2.0, settle_samples: int = 3,
+                      show_progress: bool = True) -> Dict:
+    """Block until the CPU temperature is back at or below a target
+
+    The target counts as reached after settle_samples consecutive readings
+    at or below it, so one noisy low reading does not end the wait.
+
+    Args:
+        monitor: SystemMonitor providing get_cpu_temp()
+        target: Target temperature in Celsius
+        timeout: Maximum seconds to wait
+        poll_interval: Seconds between readings
+        settle_samples: Consecutive readings required at or below target
+        show_progress: Print the current temperature while waiting
+
+    Returns:
+        Dictionary with target_c, start_c, end_c, waited_s and reached
+        (None when no temperature sensor is available)
+    """
+    start = time.perf_counter()
+    temperature = monitor.get_cpu_temp()
+    result = {'target_c': target, 'start_c': temperature, 'end_c': temperature,
+              'waited_s': 0.0, 'reached': None}
+    if temperature is None:
+        return result
+
+    below = 0
+    printed = False
+    while True:
+        below = below + 1 if temperature <= target else 0
+        waited = time.perf_counter() - start
+        if below >= settle_samples or waited >= timeout:
+            break
+        if show_progress:
+            print(f"\rCooling down: {temperature:.1f}°C -> {target:.1f}°C ({waited:.0f}s)",
+                  end='', flush=True)
+            printed = True
+        time.sleep(poll_interval)
+        reading = monitor.get_cpu_temp()
+        if reading is not None:
+            temperature = reading
+
+    if printed:
+        print()
+    result['end_c'] = temperature
+    result['waited_s'] = time.perf_counter() - start
+    result['reached'] = temperature <= target
+    return result
+
+
+class PlateauDetector:
+    """Detects thermal steady state from periodic temperature samples
+
+    A least-squares line is fitted to the samples of the last window
+    seconds. Once the window is covered and the magnitude of its slope is at
+    most max_slope (°C per minute), the run is at a plateau. Detection
+    latches: later samples do not undo it.
+    """
+
+    def __init__(self, window: float = DEFAULT_PLATEAU_WINDOW, max_slope: float = DEFAULT_PLATEAU_SLOPE,
+                 min_samples: int = 5):
+        """Initialize detector
+
+        Args:
+            window: Seconds of samples the slope is fitted over
+            max_slope: Largest slope (°C/min) that counts as flat
+            min_samples: Fewest samples in the window before testing
+        """
+        self.window = window
+        self.max_slope = max_slope
+        self.min_samples = min_samples
+        self.samples = deque()
+
+        self.slope: Optional[float] = None
+        self.plateau_time: Optional[float] = None
+        self.plateau_temperature: Optional[float] = None
+        self.first_time: Optional[float] = None
+
+    @property
+    def reached(self) -> bool:
+        return self.plateau_time is not None
+
+    def update(self, timestamp: float, temperature: Optional[float]) -> bool:
+        """Add one sample
+
+        Args:
+            timestamp: Sample time in seconds (any monotonic clock)
+            temperature: Temperature in Celsius (None is ignored)
+
+        Returns:
+            True only for the sample at which the plateau is first detected
+        """
+        if temperature is None or self.reached:
+            return False
+        if self.first_time is None:
+            self.first_time = timestamp
+
+        self.samples.append((timestamp, temperature))
+        while timestamp - self.samples[0][0] > self.window:
+            self.samples.popleft()
+        if len(self.samples) < self.min_samples or timestamp - self.first_time < self.window:
+            return False
+
+        n = len(self.samples)
+        mean_t = sum(t for t, _ in self.samples) / n
+        mean_y = sum(y for _, y in self.samples) / n
+        var_t = sum((t - mean_t) ** 2 for t, _ in self.samples)
+        if var_t == 0:
+            return False
+        self.slope = sum((t - mean_t) * (y - mean_y) for t, y in self.samples) / var_t * 60
+
+        if abs(self.slope) <= self.max_slope:
+            self.plateau_time = timestamp
+            self.plateau_temperature = mean_y
+            return True
+        return False
+
+    def to_dict(self) -> Dict:
+        """Get detector settings and result"""
+        return {
+            'plateau_reached': self.reached,
+            'plateau_temperature': self.plateau_temperature,
+            'slope_c_per_min': self.slope,
+            'window_s': self.window,
+            'max_slope_c_per_min': self.max_slope
+        }
+
+
+if __name__ == '__main__':
+    # Exponential warm-up towards 72°C with sensor noise, sampled at 1 Hz
+    import math
+    import random
+
+    random.seed(0)
+    detector = PlateauDetector()
+    for second in range(900):
+        temperature = 72 - 27 * math.exp(-second / 120) + random.gauss(0, 0.3)
+        if detector.update(float(second), round(temperature * 2) / 2):
+            print(f"Plateau at {second}s, {detector.plateau_temperature:.1f}°C "
+                  f"(slope {detector.slope:+.2f}°C/min)")
+    print(detector.to_dict())
@@ -0,0 +1,332 @@
+"""
+Inference Worker Pool Module
+K processes with their own ONNX Runtime session, fed round-robin, results reordered by sequence number
+"""
+
+import os
+import time
+import queue
+import resource
+import traceback
+import multiprocessing
+from typing import Dict, Optional
+
+import numpy as np
+
+from .autotune import DEFAULT_SESSION_SETTINGS, apply_session_settings, format_session_settings
+from .letterbox import LetterboxPreprocessor, stretch_preprocess, stretch_to_source
+from .letterbox import input_layout, input_shape, LAYOUT_NHWC
+from .postprocess import YOLODecoder
+
+
+def threads_per_worker(total_threads: int, num_workers: int) -> int:
+    """Split a thread budget evenly across workers (at least one each)"""
+    return max(1, total_threads // max(1, num_workers))
+
+
+def _worker_main(worker_id: int, model_path: str, input_size: int, settings: Dict, preprocess: str,
+                 decoder_args: tuple, warmup: int, tasks, results):
+    """Worker process: preprocess, infer and decode frames until a None task arrives"""
+    try:
+        import onnxruntime as ort
+
+        sess_options = ort.SessionOptions()
+        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        apply_session_settings(sess_options, settings)
+        session = ort.InferenceSession(model_path, sess_options=sess_options,
+                                       providers=['CPUExecutionProvider'])
+        input_name = session.get_inputs()[0].name
+        layout = input_layout(session.get_inputs()[0])
+        preprocessor = LetterboxPreprocessor(input_size, layout=layout) if preprocess == 'letterbox' else None
+        decoder = YOLODecoder(*decoder_args)
+
+        if layout == LAYOUT_NHWC:
+            dummy = np.random.randint(0, 256, input_shape(layout, input_size), dtype=np.uint8)
+        else:
+            dummy = np.random.rand(*input_shape(layout, input_size)).astype(np.float32)
+        for _ in range(warmup):
+            session.run(None, {input_name: dummy})
+    except Exception:
+        results.put(('error', worker_id, traceback.format_exc()))
+        return
+    results.put(('ready', worker_id, None))
+
+    cpu_start = time.process_time()
+    frames = 0
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        seq, frame = task
+        try:
+            t0 = time.perf_counter()
+            if preprocessor is not None:
+                tensor = preprocessor(frame)
+            else:
+                tensor = stretch_preprocess(frame, input_size, layout)
+            t1 = time.perf_counter()
+            outputs = session.run(None, {input_name: tensor})
+            t2 = time.perf_counter()
+            detections = decoder.decode(outputs[0])
+            if preprocessor is not None:
+                preprocessor.to_source(detections, frame.shape[0], frame.shape[1])
+            else:
+                stretch_to_source(detections, frame.shape[0], frame.shape[1], input_size)
+            t3 = time.perf_counter()
+        except Exception:
+            results.put(('error', worker_id, traceback.format_exc()))
+            return
+        frames += 1
+        results.put(('result', worker_id, (seq, detections, t1 - t0, t2 - t1, t3 - t2)))
+
+    results.put(('stats', worker_id, {
+        'frames': frames,
+        'cpu_s': time.process_time() - cpu_start,
+        # ru_maxrss is reported in kilobytes on Linux
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    }))
+
+
+class InferenceWorkerPool:
+    """Throughput scaling with K single-session worker processes
+
+    One session with all cores leaves threads idle between small operators.
+    Here each of num_workers processes owns a session with
+    total_threads / num_workers intra-op threads and runs preprocess,
+    inference and decode for whole frames. Frame N goes to worker N mod K
+    through that worker's bounded queue, so a slow worker back-pressures
+    submit(). Results arrive on one shared queue in any order and get()
+    hands them back in sequence order through a reorder buffer.
+
+    Frames are pickled into the worker queues. Thread spinning is off in the
+    workers, so an idle worker does not take cores from a busy one.
+    """
+
+    def __init__(self, model_path: str, num_workers: int, total_threads: Optional[int] = None,
+                 input_size: int = 640, session_settings: Optional[Dict] = None,
+                 preprocess: str = 'letterbox', conf_threshold: float = 0.25,
+                 iou_threshold: float = 0.45, top_k: Optional[int] = None,
+                 queue_size: int = 2, warmup: int = 5):
+        """Initialize worker pool
+
+        Args:
+            model_path: ONNX model every worker loads
+            num_workers: Number of worker processes (K)
+            total_threads: Intra-op threads shared by all workers (default: CPU count)
+            input_size: Model input size
+            session_settings: Base session settings (intra-op threads are overridden)
+            preprocess: 'letterbox' or 'stretch'
+            conf_threshold: Decoder confidence threshold
+            iou_threshold: Decoder NMS IoU threshold
+            top_k: Decoder pre-NMS top-k (None to disable)
+            queue_size: Frames queued per worker besides the one in progress
+            warmup: Warm-up runs per worker before start() returns
+        """
+        self.model_path = model_path
+        self.num_workers = num_workers
+        self.total_threads = total_threads or os.cpu_count() or 1
+        self.threads = threads_per_worker(self.total_threads, num_workers)
+        self.settings = dict(session_settings or DEFAULT_SESSION_SETTINGS,
+                             intra_op_num_threads=self.threads, allow_spinning=False)
+        self.input_size = input_size
+        self.preprocess = preprocess
+        self.decoder_args = (conf_threshold, iou_threshold, top_k)
+        self.queue_size = queue_size
+        self.warmup = warmup
+
+        self.ctx = multiprocessing.get_context('spawn')
+        self.tasks = []
+        self.results = None
+        self.processes = []
+
+        self.next_seq = 0
+        self.next_emit = 0
+        self.reorder: Dict[int, Dict] = {}
+        self.submitted_at: Dict[int, float] = {}
+        self.max_reorder_depth = 0
+        self.submit_wait = 0.0
+        self.worker_frames = [0] * num_workers
+        self.worker_stats: Dict[int, Dict] = {}
+        self.startup_s = None
+
+    @property
+    def capacity(self) -> int:
+        """Frames that can be in flight without blocking submit()"""
+        return self.num_workers * (self.queue_size + 1)
+
+    @property
+    def pending(self) -> int:
+        """Frames submitted but not yet returned by get()"""
+        return self.next_seq - self.next_emit
+
+    def start(self, timeout: float = 120.0):
+        """Spawn the workers and wait until every session is loaded and warm
+
+        Raises:
+            RuntimeError: If a worker fails to start
+        """
+        start = time.perf_counter()
+        self.results = self.ctx.Queue()
+        for worker_id in range(self.num_workers):
+            tasks = self.ctx.Queue(maxsize=self.queue_size)
+            process = self.ctx.Process(
+                target=_worker_main, name=f"inference worker {worker_id}", daemon=True,
+                args=(worker_id, self.model_path, self.input_size, self.settings, self.preprocess,
+                      self.decoder_args, self.warmup, tasks, self.results))
+            process.start()
+            self.tasks.append(tasks)
+            self.processes.append(process)
+
+        ready = 0
+        deadline = start + timeout
+        while ready < self.num_workers:
+            try:
+                kind, worker_id, payload = self.results.get(timeout=max(0.1, deadline - time.perf_counter()))
+            except queue.Empty:
+                self.stop()
+                raise RuntimeError(f"Workers not ready after {timeout:.0f}s")
+            if kind == 'error':
+                self.stop()
+                raise RuntimeError(f"Worker {worker_id} failed to start:\n{payload}")
+            if kind == 'ready':
+                ready += 1
+        self.startup_s = time.perf_counter() - start
+
+    def submit(self, frame: np.ndarray) -> int:
+        """Queue a frame for its round-robin worker (blocks while that worker is full)
+
+        Returns:
+            Sequence number of the frame
+        """
+        seq = self.next_seq
+        wait_start = time.perf_counter()
+        self.tasks[seq % self.num_workers].put((seq, frame))
+        now = time.perf_counter()
+        self.submit_wait += now - wait_start
+        self.submitted_at[seq] = now
+        self.next_seq += 1
+        return seq
+
+    def get(self, timeout: float = 10.0, block: bool = True) -> Optional[Dict]:
+        """Get the next result in sequence order
+
+        Args:
+            timeout: Seconds to wait for it when blocking
+            block: False to return None unless it has already arrived
+
+        Returns:
+            Dictionary with seq, worker, detections, preprocess, inference and
+            postprocess (seconds, measured in the worker) and submitted_at
+
+        Raises:
+            RuntimeError: If a worker fails or dies, or nothing arrives within timeout
+        """
+        if self.pending == 0:
+            raise RuntimeError("No frames in flight")
+        deadline = time.perf_counter() + timeout
+        while self.next_emit not in self.reorder:
+            try:
+                if block:
+                    kind, worker_id, payload = self.results.get(timeout=0.5)
+                else:
+                    kind, worker_id, payload = self.results.get_nowait()
+            except queue.Empty:
+                if not block:
+                    return None
+                dead = [p.name for p in self.processes if not p.is_alive()]
+                if dead:
+                    raise RuntimeError(f"Worker process exited: {', '.join(dead)}")
+                if time.perf_counter() > deadline:
+                    raise RuntimeError(f"No result for frame {self.next_emit} after {timeout:.0f}s")
+                continue
+            if kind == 'error':
+                raise RuntimeError(f"Worker {worker_id} failed:\n{payload}")
+            if kind == 'stats':
+                self.worker_stats[worker_id] = payload
+                continue
+            seq, detections, preprocess, inference, postprocess = payload
+            self.worker_frames[worker_id] += 1
+            self.reorder[seq] = {'seq': seq, 'worker': worker_id, 'detections': detections,
+                                 'preprocess': preprocess, 'inference': inference,
+                                 'postprocess': postprocess}
+            self.max_reorder_depth = max(self.max_reorder_depth, len(self.reorder))
+
+        result = self.reorder.pop(self.next_emit)
+        result['submitted_at'] = self.submitted_at.pop(self.next_emit)
+        self.next_emit += 1
+        return result
+
+    def stop(self, timeout: float = 10.0):
+        """Stop the workers and collect their CPU time and memory statistics
+
+        Frames still in flight are discarded.
+        """
+        for tasks, process in zip(self.tasks, self.processes):
+            if process.is_alive():
+                try:
+                    tasks.put(None, timeout=1.0)
+                except queue.Full:
+                    pass  # Terminated below
+            # Do not block interpreter exit on frames a dead worker never read
+            tasks.cancel_join_thread()
+
+        deadline = time.perf_counter() + timeout
+        while self.results is not None and len(self.worker_stats) < len(self.processes):
+            if not any(p.is_alive() for p in self.processes) and self.results.empty():
+                break
+            try:
+                kind, worker_id, payload = self.results.get(timeout=max(0.1, deadline - time.perf_counter()))
+            except queue.Empty:
+                break
+            if kind == 'stats':
+                self.worker_stats[worker_id] = payload
+
+        for process in self.processes:
+            process.join(timeout=max(0.1, deadline - time.perf_counter()))
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+    def get_stats(self) -> Dict:
+        """Get pool configuration, per-worker frames and CPU time, and ordering statistics"""
+        delivered = self.next_emit
+        cpu_s = sum(stats['cpu_s'] for stats in self.worker_stats.values())
+        return {
+            'workers': self.num_workers,
+            'total_threads': self.total_threads,
+            'threads_per_worker': self.threads,
+            'session_settings': format_session_settings(self.settings),
+            'startup_s': self.startup_s,
+            'frames': delivered,
+            'worker_frames': list(self.worker_frames),
+            'worker_cpu_s': cpu_s,
+            'worker_peak_rss_mb': max((stats['peak_rss_mb'] for stats in self.worker_stats.values()),
+                                      default=None),
+            'max_reorder_depth': self.max_reorder_depth,
+            'avg_submit_wait_ms': (self.submit_wait / self.next_seq * 1000) if self.next_seq else 0.0
+        }
+
+
+if __name__ == '__main__':
+    # Sweep K on a test model: python3 -m utils.worker_pool MODEL.onnx (from src/)
+    import sys
+
+    model = sys.argv[1] if len(sys.argv) > 1 else 'models/yolov8n.onnx'
+    frame = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+    for k in (1, 2, 4):
+        pool = InferenceWorkerPool(model, k, total_threads=4)
+        pool.start()
+        start = time.perf_counter()
+        seqs = []
+        for _ in range(40):
+            if pool.pending >= pool.capacity:
+                seqs.append(pool.get()['seq'])
+            pool.submit(frame)
+        while pool.pending:
+            seqs.append(pool.get()['seq'])
+        elapsed = time.perf_counter() - start
+        pool.stop()
+        stats = pool.get_stats()
+        print(f"K={k} ({stats['threads_per_worker']} threads): {40 / elapsed:.1f} FPS, "
+              f"in order: {seqs == sorted(seqs)}, per worker: {stats['worker_frames']}, "
+              f"max reorder depth: {stats['max_reorder_depth']}")